@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+"""
+On-disk HTTP response cache with conditional GET support.
+
+Entries are keyed by URL + sorted query params and stored in a small SQLite
+file under data/ (default: data/http_cache.db). Each entry keeps the response
+body text plus its ETag/Last-Modified validators so the next request can send
+If-None-Match/If-Modified-Since and replay the stored body on 304.
+
+Bounds:
+- fresh_seconds: entries younger than this are served without a request
+- ttl_seconds: entries not stored or revalidated within this window are evicted
+- max_bytes: total body size cap, enforced by least-recently-used eviction
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+DEFAULT_PATH = os.path.join(_ROOT, "data", "http_cache.db")
+
+
+def cache_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Deterministic key for a URL and its query params."""
+    canonical = json.dumps([url, sorted((str(k), str(v)) for k, v in (params or {}).items())], separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class HttpCache:
+    """SQLite-backed response cache shared by all fetchers in a process."""
+
+    def __init__(
+        self,
+        path: str = DEFAULT_PATH,
+        ttl_seconds: float = 7 * 24 * 3600,
+        max_bytes: int = 50 * 1024 * 1024,
+        fresh_seconds: float = 0.0,
+        now_fn: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.ttl_seconds = float(ttl_seconds)
+        self.max_bytes = int(max_bytes)
+        self.fresh_seconds = float(fresh_seconds)
+        self._now = now_fn
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS http_cache (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    body TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_http_cache_accessed ON http_cache(accessed_at)")
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=10)
+
+    def lookup(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Return the cached entry (with a `fresh` flag) or None when absent/expired."""
+        key = cache_key(url, params)
+        now = self._now()
+        with self._lock:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT etag, last_modified, body, stored_at FROM http_cache WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    return None
+                etag, last_modified, body, stored_at = row
+                if now - float(stored_at) > self.ttl_seconds:
+                    conn.execute("DELETE FROM http_cache WHERE key = ?", (key,))
+                    conn.commit()
+                    return None
+                conn.execute("UPDATE http_cache SET accessed_at = ? WHERE key = ?", (now, key))
+                conn.commit()
+            finally:
+                conn.close()
+        return {
+            "key": key,
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": body,
+            "stored_at": float(stored_at),
+            "fresh": (now - float(stored_at)) < self.fresh_seconds,
+        }
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for a cached entry."""
+        headers: Dict[str, str] = {}
+        if not entry:
+            return headers
+        if entry.get("etag"):
+            headers["If-None-Match"] = str(entry["etag"])
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = str(entry["last_modified"])
+        return headers
+
+    def store(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        body: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Store a response body; skipped when the server sent no validators and nothing is served fresh."""
+        if not etag and not last_modified and self.fresh_seconds <= 0:
+            return
+        key = cache_key(url, params)
+        now = self._now()
+        size = len(body.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO http_cache(key, url, etag, last_modified, body, size, stored_at, accessed_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (key, url, etag, last_modified, body, size, now, now),
+                )
+                self._evict(conn, now)
+                conn.commit()
+            finally:
+                conn.close()
+
+    def revalidated(self, entry: Dict[str, Any]) -> None:
+        """Mark an entry as confirmed current by a 304 response."""
+        now = self._now()
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    "UPDATE http_cache SET stored_at = ?, accessed_at = ? WHERE key = ?",
+                    (now, now, entry["key"]),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        conn.execute("DELETE FROM http_cache WHERE stored_at < ?", (now - self.ttl_seconds,))
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = conn.execute("SELECT key, size FROM http_cache ORDER BY accessed_at ASC").fetchall()
+        doomed = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            total -= int(size)
+        conn.executemany("DELETE FROM http_cache WHERE key = ?", doomed)
+
+    def stats(self) -> Dict[str, Any]:
+        conn = self._connect()
+        try:
+            entries, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM http_cache").fetchone()
+        finally:
+            conn.close()
+        return {"entries": int(entries), "bytes": int(total), "max_bytes": self.max_bytes}
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute("DELETE FROM http_cache")
+                conn.commit()
+            finally:
+                conn.close()
@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+"""
+Shared pooled HTTP client for job discovery sources.
+
+One process-wide `requests.Session` (sync) and one `httpx.AsyncClient` per
+event loop (async) keep TCP+TLS connections alive between calls, so fetchers
+and source adapters stop paying connection setup on every request.
+
+- Pool size is per host (`pool_maxsize`), across `pool_connections` hosts.
+- Responses are negotiated as gzip/deflate, plus brotli when a brotli decoder
+  is installed (urllib3/httpx decode it transparently).
+- An optional on-disk cache (automation/common/http_cache.py) adds
+  conditional GET: validators are sent on repeat requests and cached bodies
+  are replayed on 304.
+- Both HTTP libraries are optional; callers get a LibraryUnavailable
+  (a RuntimeError and ImportError) when missing.
+"""
+
+import json
+import os
+import threading
+import weakref
+from typing import Any, Dict, Optional
+
+try:
+    import requests  # type: ignore
+    from requests.adapters import HTTPAdapter  # type: ignore
+except Exception:  # pragma: no cover - allow import without requests installed
+    requests = None  # type: ignore
+    HTTPAdapter = None  # type: ignore
+
+try:
+    import httpx  # type: ignore
+except Exception:  # pragma: no cover - async engine is optional
+    httpx = None  # type: ignore
+
+
+class LibraryUnavailable(RuntimeError, ImportError):
+    """An optional HTTP library is not installed (permanent; never worth retrying)."""
+
+
+def _load_http_cache():
+    try:
+        from automation.common import http_cache  # type: ignore
+        return http_cache
+    except ModuleNotFoundError:
+        import importlib.util
+
+        _p = os.path.join(os.path.dirname(os.path.abspath(__file__)), "http_cache.py")
+        spec = importlib.util.spec_from_file_location("automation_common_http_cache", _p)
+        mod = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+        spec.loader.exec_module(mod)  # type: ignore[union-attr]
+        return mod
+
+
+def _brotli_available() -> bool:
+    for name in ("brotli", "brotlicffi"):
+        try:
+            __import__(name)
+            return True
+        except Exception:
+            continue
+    return False
+
+
+DEFAULT_SETTINGS: Dict[str, Any] = {
+    "pool_connections": 10,
+    "pool_maxsize": 10,
+    "user_agent": "StrataOS-JobDiscovery/1.0",
+}
+
+_LOCK = threading.Lock()
+_SETTINGS: Dict[str, Any] = dict(DEFAULT_SETTINGS)
+_SESSION: Optional[Any] = None
+_CACHE: Optional[Any] = None
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[Any, Any]" = weakref.WeakKeyDictionary()
+
+
+def accept_encoding() -> str:
+    """Accept-Encoding header value for the codecs this process can decode."""
+    return "gzip, deflate, br" if _brotli_available() else "gzip, deflate"
+
+
+def default_headers() -> Dict[str, str]:
+    return {
+        "Accept": "application/json",
+        "Accept-Encoding": accept_encoding(),
+        "Connection": "keep-alive",
+        "User-Agent": str(_SETTINGS.get("user_agent") or DEFAULT_SETTINGS["user_agent"]),
+    }
+
+
+def configure(
+    pool_connections: Optional[int] = None,
+    pool_maxsize: Optional[int] = None,
+    user_agent: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Update pool settings. Existing clients are closed so new settings apply.
+
+    Args:
+        pool_connections: Number of distinct hosts to keep pools for.
+        pool_maxsize: Keep-alive connections kept per host.
+        user_agent: Optional User-Agent override.
+
+    Returns:
+        The effective settings mapping.
+    """
+    global _SESSION
+    with _LOCK:
+        if pool_connections is not None:
+            _SETTINGS["pool_connections"] = max(1, int(pool_connections))
+        if pool_maxsize is not None:
+            _SETTINGS["pool_maxsize"] = max(1, int(pool_maxsize))
+        if user_agent:
+            _SETTINGS["user_agent"] = str(user_agent)
+        if _SESSION is not None:
+            try:
+                _SESSION.close()
+            except Exception:
+                pass
+            _SESSION = None
+        # Async clients are bound to their loop; drop them and let each loop rebuild
+        _ASYNC_CLIENTS.clear()
+        return dict(_SETTINGS)
+
+
+def get_session() -> Any:
+    """Return the shared keep-alive `requests.Session` (created on first use)."""
+    global _SESSION
+    if requests is None:
+        raise LibraryUnavailable("requests library not available")
+    with _LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=int(_SETTINGS["pool_connections"]),
+                pool_maxsize=int(_SETTINGS["pool_maxsize"]),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(default_headers())
+            _SESSION = session
+        return _SESSION
+
+
+def configure_cache(
+    enabled: bool = True,
+    path: Optional[str] = None,
+    ttl_seconds: Optional[float] = None,
+    max_bytes: Optional[int] = None,
+    fresh_seconds: Optional[float] = None,
+) -> Optional[Any]:
+    """Enable (or disable) the shared on-disk response cache.
+
+    Returns the active HttpCache, or None when disabled.
+    """
+    global _CACHE
+    with _LOCK:
+        if not enabled:
+            _CACHE = None
+            return None
+        http_cache = _load_http_cache()
+        kwargs: Dict[str, Any] = {"path": path or http_cache.DEFAULT_PATH}
+        if ttl_seconds is not None:
+            kwargs["ttl_seconds"] = ttl_seconds
+        if max_bytes is not None:
+            kwargs["max_bytes"] = max_bytes
+        if fresh_seconds is not None:
+            kwargs["fresh_seconds"] = fresh_seconds
+        _CACHE = http_cache.HttpCache(**kwargs)
+        return _CACHE
+
+
+def get_cache() -> Optional[Any]:
+    return _CACHE
+
+
+def _prepare_cached(url: str, params: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]], use_cache: bool):
+    cache = _CACHE if use_cache else None
+    entry = cache.lookup(url, params) if cache is not None else None
+    req_headers = dict(headers or {})
+    if entry is not None:
+        req_headers.update(cache.conditional_headers(entry))
+    return cache, entry, req_headers
+
+
+def _finish_cached(cache: Any, entry: Optional[Dict[str, Any]], url: str, params: Optional[Dict[str, Any]], res: Any) -> Any:
+    if entry is not None and res.status_code == 304:
+        cache.revalidated(entry)
+        return json.loads(entry["body"])
+    res.raise_for_status()
+    payload = res.json()
+    if cache is not None:
+        cache.store(url, params, res.text, res.headers.get("ETag"), res.headers.get("Last-Modified"))
+    return payload
+
+
+def get_json(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    timeout: float = 10,
+    headers: Optional[Dict[str, str]] = None,
+    use_cache: bool = True,
+) -> Any:
+    """HTTP GET over the shared session returning parsed JSON.
+
+    When the response cache is enabled, fresh entries are served without a
+    request and stale ones are revalidated conditionally (304 replays the
+    cached body). Raises on non-2xx status or JSON parse error.
+    """
+    cache, entry, req_headers = _prepare_cached(url, params, headers, use_cache)
+    if entry is not None and entry["fresh"]:
+        return json.loads(entry["body"])
+    res = get_session().get(url, params=params or {}, timeout=timeout, headers=req_headers)
+    return _finish_cached(cache, entry, url, params, res)
+
+
+def get_async_client() -> Any:
+    """Return the shared `httpx.AsyncClient` for the running event loop."""
+    import asyncio
+
+    if httpx is None:
+        raise LibraryUnavailable("httpx library not available")
+    loop = asyncio.get_running_loop()
+    with _LOCK:
+        client = _ASYNC_CLIENTS.get(loop)
+        if client is None or client.is_closed:
+            per_host = int(_SETTINGS["pool_maxsize"])
+            limits = httpx.Limits(
+                max_connections=per_host * int(_SETTINGS["pool_connections"]),
+                max_keepalive_connections=per_host * int(_SETTINGS["pool_connections"]),
+            )
+            client = httpx.AsyncClient(limits=limits, headers=default_headers(), follow_redirects=True)
+            _ASYNC_CLIENTS[loop] = client
+        return client
+
+
+async def async_get_json(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    timeout: float = 10,
+    headers: Optional[Dict[str, str]] = None,
+    use_cache: bool = True,
+) -> Any:
+    """Async HTTP GET over the loop's shared client returning parsed JSON.
+
+    Shares the response cache and conditional GET behavior of get_json.
+    """
+    cache, entry, req_headers = _prepare_cached(url, params, headers, use_cache)
+    if entry is not None and entry["fresh"]:
+        return json.loads(entry["body"])
+    client = get_async_client()
+    res = await client.get(url, params=params or {}, timeout=timeout, headers=req_headers)
+    return _finish_cached(cache, entry, url, params, res)
+
+
+def close() -> None:
+    """Close the shared sync session. Async clients close with `aclose()`."""
+    global _SESSION
+    with _LOCK:
+        if _SESSION is not None:
+            try:
+                _SESSION.close()
+            except Exception:
+                pass
+            _SESSION = None
+
+
+async def aclose() -> None:
+    """Close the shared async client for the running event loop."""
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    with _LOCK:
+        client = _ASYNC_CLIENTS.pop(loop, None)
+    if client is not None:
+        await client.aclose()
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+"""
+Canonical job identity shared by adapters, storage and the web app.
+
+- normalize_url(): scheme/host case, default ports, `www.`, fragments,
+  tracking parameters and query order no longer change a posting's identity
+- canonical_id(): SHA-1 of the normalized URL (or of company|title|location
+  when a posting has no URL); independent of which board reported it
+- simhash(): 64-bit SimHash over title + company + description, used by the
+  storage registry to map near-duplicate postings of the same company and
+  location onto one global id
+
+All functions are pure and deterministic.
+"""
+
+import hashlib
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+SIMHASH_BITS = 64
+# Bands for the SimHash index: any two hashes within BANDS - 1 bits share a band
+SIMHASH_BANDS = 8
+# Max Hamming distance for a near-duplicate: any posting of the same company,
+# or (looser, since short descriptions move more bits per edit) same title too
+NEAR_DUPLICATE_DISTANCE = 3
+SAME_TITLE_DISTANCE = 7
+
+_TRACKING_PARAMS = frozenset(
+    {
+        "gclid", "fbclid", "msclkid", "mc_cid", "mc_eid", "_hsenc", "_hsmi",
+        "ref", "referrer", "src", "source", "trk", "trackingid", "refid",
+    }
+)
+_TRACKING_PREFIXES = ("utm_",)
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+_TOKEN = re.compile(r"[a-z0-9#+]+")
+
+
+def _text(value: Any) -> str:
+    return " ".join(str(value or "").split()).strip().lower()
+
+
+def normalize_url(url: Any) -> str:
+    """Canonical form of a posting URL ("" when empty)."""
+    return _normalize_url(str(url or "").strip())
+
+
+@lru_cache(maxsize=16384)
+def _normalize_url(raw: str) -> str:
+    if not raw:
+        return ""
+    if "://" not in raw:
+        raw = "https://" + raw.lstrip("/")
+    try:
+        parts = urlsplit(raw)
+    except ValueError:
+        return raw.lower()
+    scheme = (parts.scheme or "https").lower()
+    if scheme == "http":
+        scheme = "https"
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    port = parts.port if parts.port is not None else None
+    netloc = host if port is None or str(port) in _DEFAULT_PORTS.values() else f"{host}:{port}"
+    path = re.sub(r"/{2,}", "/", parts.path or "")
+    if len(path) > 1:
+        path = path.rstrip("/")
+    query = [
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in _TRACKING_PARAMS and not k.lower().startswith(_TRACKING_PREFIXES)
+    ]
+    query.sort()
+    return urlunsplit((scheme, netloc, path, urlencode(query), ""))
+
+
+def canonical_key(job: Dict[str, Any]) -> str:
+    """Identity key: normalized URL, else "company|title|location" text."""
+    url = normalize_url(job.get("url"))
+    if url:
+        return url
+    return "|".join(_text(job.get(k)) for k in ("company", "title", "location"))
+
+
+def canonical_id(job: Dict[str, Any]) -> str:
+    """Stable, source-independent job id (40-char SHA-1 hex)."""
+    return hashlib.sha1(canonical_key(job).encode("utf-8")).hexdigest()
+
+
+def normalize_text(value: Any) -> str:
+    """Lowercase, whitespace-collapsed text used for company/title comparisons."""
+    return _text(value)
+
+
+def is_near_duplicate(distance: int, same_title: bool) -> bool:
+    return distance <= (SAME_TITLE_DISTANCE if same_title else NEAR_DUPLICATE_DISTANCE)
+
+
+def _features(text: str) -> List[str]:
+    tokens = _TOKEN.findall(text)
+    return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+
+def simhash_text(job: Dict[str, Any]) -> str:
+    """Normalized text fingerprinted for near-duplicate detection."""
+    return " ".join(_text(job.get(k)) for k in ("title", "company", "description") if job.get(k))
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash of unigram + bigram features (0 for empty text)."""
+    features = _features(text.lower())
+    if not features:
+        return 0
+    # One bit string for all feature hashes; a stride-64 slice is one bit
+    # position, so str.count does the per-position tally in C
+    blob = b"".join([hashlib.blake2b(f.encode("utf-8"), digest_size=8).digest() for f in features])
+    bits = format(int.from_bytes(blob, "big"), f"0{len(blob) * 8}b")
+    half = len(features) / 2
+    value = 0
+    for pos in range(SIMHASH_BITS):
+        if bits[pos::SIMHASH_BITS].count("1") > half:
+            value |= 1 << (SIMHASH_BITS - 1 - pos)
+    return value
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def simhash_bands(value: int) -> Iterable[int]:
+    """Band values of a SimHash (band index folded into the high bits)."""
+    width = SIMHASH_BITS // SIMHASH_BANDS
+    mask = (1 << width) - 1
+    for band in range(SIMHASH_BANDS):
+        yield (band << width) | ((value >> (band * width)) & mask)
+
+
+def to_sqlite_int(value: int) -> int:
+    """Map an unsigned 64-bit value onto SQLite's signed INTEGER range."""
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def from_sqlite_int(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
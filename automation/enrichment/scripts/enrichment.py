@@ -1,5 +1,10 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+import multiprocessing
+import os
 import re
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from automation.common.normalization import normalize_terms, ensure_str
 
 
@@ -16,6 +21,74 @@ def normalize_title(title: Optional[str]) -> str:
     return collapsed.lower()
 
 
+# Heuristics applied after any configured patterns
+_DEFAULT_SENIORITY_PATTERNS = [(r"\b(sr|senior)\b", "Senior"), (r"\b(jr|junior)\b", "Junior")]
+# Numbered/named group references would point at the wrong group once merged
+_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+
+class SeniorityClassifier:
+    """
+    Compiled seniority matcher built once per pattern set.
+    All patterns (configured, then the default heuristics) are merged into one
+    anchored alternation of named lookahead groups, so a single match returns
+    the first pattern, in config order, that occurs anywhere in the title.
+    Results are memoized by normalized title.
+    """
+
+    def __init__(self, patterns: Optional[Dict[str, str]] = None, memo_size: int = 4096):
+        self._patterns = dict(patterns or {})
+        self._memo_size = int(memo_size)
+        self._memo: Dict[str, str] = {}
+        items = list(self._patterns.items()) + _DEFAULT_SENIORITY_PATTERNS
+        self._labels = {f"_s{i}": label for i, (_, label) in enumerate(items)}
+        # Per-pattern fallback keeps semantics for patterns that cannot be merged
+        # (backreferences, conflicting group names, mid-pattern inline flags)
+        self._compiled = [(re.compile(pat), label) for pat, label in items]
+        self._combined: Optional[re.Pattern] = None
+        if any(_GROUP_REFERENCE.search(pat) for pat, _ in items):
+            return
+        try:
+            alternation = "|".join(f"(?P<_s{i}>(?=.*?(?:{pat})))" for i, (pat, _) in enumerate(items))
+            self._combined = re.compile(alternation, re.DOTALL)
+        except re.error:
+            pass
+
+    def __reduce__(self):
+        # Rebuild from patterns in worker processes instead of pickling the memo
+        return (SeniorityClassifier, (self._patterns, self._memo_size))
+
+    def _classify(self, title_norm: str) -> str:
+        if self._combined is not None:
+            m = self._combined.match(title_norm)
+            # The winning named group closes last, after any groups inside its pattern
+            return self._labels[m.lastgroup] if m is not None else "Mid"
+        for rx, label in self._compiled:
+            if rx.search(title_norm):
+                return label
+        return "Mid"
+
+    def classify(self, title: Optional[str]) -> str:
+        """Return the seniority label for a raw title ('Mid' when empty or unmatched)."""
+        if not title:
+            return "Mid"
+        return self._label(normalize_title(title))
+
+    def _label(self, title_norm: str) -> str:
+        label = self._memo.get(title_norm)
+        if label is None:
+            label = self._classify(title_norm)
+            if len(self._memo) >= self._memo_size:
+                self._memo.clear()
+            self._memo[title_norm] = label
+        return label
+
+
+@lru_cache(maxsize=32)
+def _classifier_for(items: Tuple[Tuple[str, str], ...]) -> SeniorityClassifier:
+    return SeniorityClassifier(dict(items))
+
+
 def infer_seniority(title: Optional[str], patterns: Optional[Dict[str, str]] = None) -> str:
     """
     Infer seniority label using provided regexlabel patterns.
@@ -23,17 +96,16 @@ def infer_seniority(title: Optional[str], patterns: Optional[Dict[str, str]] = N
     """
     if not title:
         return "Mid"
-    title_norm = normalize_title(title)
-    if patterns:
-        for pattern, label in patterns.items():
-            if re.search(pattern, title_norm):
-                return label
-    # Simple heuristics if no patterns provided
-    if re.search(r"\b(sr|senior)\b", title_norm):
-        return "Senior"
-    if re.search(r"\b(jr|junior)\b", title_norm):
-        return "Junior"
-    return "Mid"
+    return _classifier_for(tuple((patterns or {}).items())).classify(title)
+
+
+def _match_all(keys: List[str], hay: str) -> List[str]:
+    # keys and hay are already normalized (lowercase, trimmed)
+    return sorted({kw for kw in keys if kw and kw in hay})
+
+
+def _match_any(keys: List[str], hay: str) -> bool:
+    return any(kw and kw in hay for kw in keys)
 
 
 def detect_stack(
@@ -48,14 +120,8 @@ def detect_stack(
     if not stack_keywords:
         return []
     # Normalize once at boundary for robustness
-    keys = normalize_terms(stack_keywords)
     hay = (normalize_title(title) + " " + normalize_title(description)).strip()
-    found = set()
-    for kw in keys:
-        # kw is expected already lowercase and trimmed
-        if kw and kw in hay:
-            found.add(kw)
-    return sorted(found)
+    return _match_all(normalize_terms(stack_keywords), hay)
 
 
 def detect_role_tags(title: Optional[str], role_keywords: Optional[List[str]] = None) -> List[str]:
@@ -65,14 +131,7 @@ def detect_role_tags(title: Optional[str], role_keywords: Optional[List[str]] =
     """
     if not role_keywords:
         return []
-    keys = normalize_terms(role_keywords)
-    title_norm = normalize_title(title)
-    found = set()
-    for kw in keys:
-        # kw is expected already lowercase and trimmed
-        if kw and kw in title_norm:
-            found.add(kw)
-    return sorted(found)
+    return _match_all(normalize_terms(role_keywords), normalize_title(title))
 
 
 def is_remote_friendly(
@@ -83,39 +142,24 @@ def is_remote_friendly(
     """
     if not remote_aliases:
         return False
-    keys = normalize_terms(remote_aliases)
     hay = (normalize_title(title) + " " + normalize_title(description)).strip()
-    for alias in keys:
-        # alias expected pre-normalized
-        if alias and alias in hay:
-            return True
-    return False
+    return _match_any(normalize_terms(remote_aliases), hay)
 
 
-def extract_features(job: Dict[str, Any], config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+def compile_config(config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
-    Extract deterministic enrichment features from a canonical job record.
-    Expected job keys: 'title', 'description' (optional), others are ignored.
+    Normalize the enrichment config slice once so it can be reused across jobs.
     Config keys (optional):
       enrichment.keywords.role: List[str]
       enrichment.keywords.stack: List[str]
       enrichment.remote_aliases: List[str]
       enrichment.seniority_patterns: Dict[str, str]
-    Returns an enriched dict including normalized_title, seniority, stack_tags,
-    role_tags, and remote_friendly.
+    Returns a plain (picklable) dict consumed by extract_features_compiled.
     """
     cfg = (config or {}).get("enrichment", {})
     kw = cfg.get("keywords", {})
-    role_keywords_raw = kw.get("role", [])
-    stack_keywords_raw = kw.get("stack", [])
-    remote_aliases_raw = cfg.get("remote_aliases", [])
     seniority_patterns_raw = cfg.get("seniority_patterns", {})
 
-    # Normalize lists once at boundary
-    role_keywords = normalize_terms(role_keywords_raw)
-    stack_keywords = normalize_terms(stack_keywords_raw)
-    remote_aliases = normalize_terms(remote_aliases_raw)
-
     # Sanitize seniority patterns keys/labels without changing semantics
     seniority_patterns: Dict[str, str] = {}
     if isinstance(seniority_patterns_raw, dict):
@@ -125,14 +169,29 @@ def extract_features(job: Dict[str, Any], config: Optional[Dict[str, Any]] = Non
             if pat_s:
                 seniority_patterns[pat_s] = label_s
 
+    return {
+        "role_keywords": normalize_terms(kw.get("role", [])),
+        "stack_keywords": normalize_terms(kw.get("stack", [])),
+        "remote_aliases": normalize_terms(cfg.get("remote_aliases", [])),
+        "seniority_patterns": seniority_patterns,
+        "seniority": _classifier_for(tuple(seniority_patterns.items())),
+    }
+
+
+def extract_features_compiled(job: Dict[str, Any], compiled: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Extract enrichment features using a config produced by compile_config.
+    Keyword lists arrive normalized, so only the title and description are
+    normalized here, once each.
+    """
     title = job.get("title")
-    description = job.get("description")
 
     norm_title = normalize_title(title)
-    seniority = infer_seniority(title, seniority_patterns)
-    stack_tags = detect_stack(title, description, stack_keywords)
-    role_tags = detect_role_tags(title, role_keywords)
-    remote = is_remote_friendly(title, description, remote_aliases)
+    hay = (norm_title + " " + normalize_title(job.get("description"))).strip()
+    seniority = compiled["seniority"]._label(norm_title) if title else "Mid"
+    stack_tags = _match_all(compiled["stack_keywords"], hay)
+    role_tags = _match_all(compiled["role_keywords"], norm_title)
+    remote = _match_any(compiled["remote_aliases"], hay)
 
     enriched = dict(job)  # shallow copy, preserve canonical fields
     enriched.update(
@@ -145,3 +204,56 @@ def extract_features(job: Dict[str, Any], config: Optional[Dict[str, Any]] = Non
         }
     )
     return enriched
+
+
+def extract_features(job: Dict[str, Any], config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Extract deterministic enrichment features from a canonical job record.
+    Expected job keys: 'title', 'description' (optional), others are ignored.
+    See compile_config for the recognized config keys.
+    Returns an enriched dict including normalized_title, seniority, stack_tags,
+    role_tags, and remote_friendly.
+    """
+    return extract_features_compiled(job, compile_config(config))
+
+
+def _extract_chunk(args: Any) -> List[Dict[str, Any]]:
+    # Module-level so it can be pickled into worker processes
+    jobs, compiled = args
+    return [extract_features_compiled(j, compiled) for j in jobs]
+
+
+def extract_features_batch(
+    jobs: List[Dict[str, Any]],
+    config: Optional[Dict[str, Any]] = None,
+    max_workers: Optional[int] = None,
+    chunk_size: int = 500,
+) -> List[Dict[str, Any]]:
+    """
+    Enrich many jobs, compiling the config once.
+    - max_workers: process count; None uses os.cpu_count(), <= 1 runs inline.
+    - chunk_size: jobs per task sent to a worker process.
+    Batches that fit in a single chunk run inline (process startup would dominate).
+    Workers are spawned, never forked: callers such as the control-center
+    backend run this from a thread of a multi-threaded server, where a forked
+    child can inherit locks held by other threads and deadlock.
+    Output order matches input order; results equal [extract_features(j, config) ...].
+    """
+    compiled = compile_config(config)
+    rows = list(jobs)
+    size = max(1, int(chunk_size))
+    workers = (os.cpu_count() or 1) if max_workers is None else int(max_workers)
+    chunks = [rows[i:i + size] for i in range(0, len(rows), size)]
+    if workers <= 1 or len(chunks) <= 1:
+        return _extract_chunk((rows, compiled))
+    try:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), mp_context=multiprocessing.get_context("spawn")) as pool:
+            # map() yields results in submission order, keeping output deterministic
+            results = list(pool.map(_extract_chunk, [(c, compiled) for c in chunks]))
+    except (OSError, NotImplementedError, ImportError, BrokenProcessPool):
+        # Process pools unavailable (restricted sandbox, missing semaphores): run inline
+        return _extract_chunk((rows, compiled))
+    out: List[Dict[str, Any]] = []
+    for r in results:
+        out.extend(r)
+    return out
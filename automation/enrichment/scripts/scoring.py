@@ -1,4 +1,9 @@
-from typing import Any, Dict
+from typing import Any, Dict, List, Sequence, Tuple
+
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover - vectorized path is optional
+    np = None  # type: ignore
 
 
 DEFAULT_THRESHOLDS = {
@@ -23,6 +28,14 @@ def bucket_score(score: float, thresholds: Dict[str, float] | None = None) -> st
     return "Weak"
 
 
+# Weight keys that read a differently named enriched field
+_FEATURE_ALIASES = {
+    "role_fit": "role_tags",
+    "stack": "stack_tags",
+    "remote": "remote_friendly",
+}
+
+
 def _feature_value(enriched: Dict[str, Any], key: str) -> float:
     """
     Convert common boolean/list features into numeric contributions [0,1].
@@ -63,14 +76,7 @@ def score_job(
 
     for k, wt in w.items():
         max_total += abs(float(wt))
-        feature_key = k
-        if k == "role_fit":
-            feature_key = "role_tags"
-        elif k == "stack":
-            feature_key = "stack_tags"
-        elif k == "remote":
-            feature_key = "remote_friendly"
-
+        feature_key = _FEATURE_ALIASES.get(k, k)
         contrib = _feature_value(enriched, feature_key) * float(wt)
         total += contrib
 
@@ -83,3 +89,79 @@ def score_job(
 
     bucket = bucket_score(normalized, thresholds)
     return {"score": normalized, "bucket": bucket}
+
+
+def build_features(enriched_rows: Sequence[Dict[str, Any]], keys: Sequence[str]) -> Dict[str, Any]:
+    """
+    Precompute per-key feature columns for a run so it can be re-scored cheaply.
+    Keys are weight keys (aliases like 'role_fit' resolve as in score_job).
+    Returns {key: column} where columns are float64 arrays when NumPy is
+    available, else lists of floats.
+    """
+    features: Dict[str, Any] = {}
+    for k in keys:
+        feature_key = _FEATURE_ALIASES.get(k, k)
+        col = [_feature_value(e, feature_key) for e in enriched_rows]
+        features[k] = np.asarray(col, dtype=np.float64) if np is not None else col
+    return features
+
+
+def score_features(
+    features: Dict[str, Any],
+    n_rows: int,
+    weights: Dict[str, float] | None = None,
+    thresholds: Dict[str, float] | None = None,
+) -> Tuple[List[float], List[str]]:
+    """
+    Score precomputed feature columns under one weight set.
+    Results are bit-identical to score_job: contributions are accumulated
+    column by column in weights order (elementwise IEEE ops, no BLAS
+    reordering), then normalized, clamped and bucketed with the same rules.
+    Returns (scores, buckets) aligned with the rows used to build features.
+    """
+    w = weights or {}
+    th = thresholds or DEFAULT_THRESHOLDS
+    max_total = 0.0
+    for wt in w.values():
+        max_total += abs(float(wt))
+
+    if np is None:
+        scores: List[float] = []
+        for i in range(n_rows):
+            total = 0.0
+            for k, wt in w.items():
+                total += features[k][i] * float(wt)
+            scores.append(max(0.0, min(1.0, total / max_total)) if max_total > 0.0 else 0.0)
+        return scores, [bucket_score(s, thresholds) for s in scores]
+
+    total = np.zeros(n_rows, dtype=np.float64)
+    for k, wt in w.items():
+        total += features[k] * float(wt)
+    if max_total > 0.0:
+        normalized = np.maximum(0.0, np.minimum(1.0, total / max_total))
+    else:
+        normalized = np.zeros(n_rows, dtype=np.float64)
+    labels = np.select(
+        [
+            normalized >= th.get("exceptional", 0.8),
+            normalized >= th.get("strong", 0.6),
+            normalized >= th.get("moderate", 0.4),
+        ],
+        ["Exceptional", "Strong", "Moderate"],
+        default="Weak",
+    )
+    return normalized.tolist(), labels.tolist()
+
+
+def score_jobs(
+    enriched_rows: Sequence[Dict[str, Any]],
+    weights: Dict[str, float] | None = None,
+    thresholds: Dict[str, float] | None = None,
+) -> List[Dict[str, Any]]:
+    """
+    Score a whole run at once; equivalent to [score_job(e, weights, thresholds) ...].
+    """
+    w = weights or {}
+    features = build_features(enriched_rows, list(w.keys()))
+    scores, buckets = score_features(features, len(enriched_rows), w, thresholds)
+    return [{"score": s, "bucket": b} for s, b in zip(scores, buckets)]
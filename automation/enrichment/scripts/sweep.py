@@ -0,0 +1,214 @@
+"""
+What-if sweep over scoring weights and thresholds.
+
+Re-scores stored enriched features (sqlite_store `enriched` table) under a
+grid of weight/threshold candidates without re-running enrichment. Feature
+columns are built once for the union of weight keys; each candidate is then
+scored with scoring.score_features (vectorized when NumPy is installed), so
+scores and buckets match scoring.score_job / bucket_score exactly.
+
+CLI:
+  python automation/enrichment/scripts/sweep.py --grid grid.json [--run-ts 20260101_080000]
+
+Grid JSON, either a cartesian grid:
+  {"weights": {"role_fit": [0.4, 0.5], "stack": [0.3]},
+   "thresholds": {"exceptional": [0.8, 0.85]}}
+or explicit candidates:
+  {"candidates": [{"weights": {...}, "thresholds": {...}}]}
+
+Candidates are overrides: keys a candidate leaves out keep their configured
+(baseline) value, so each delta measures only the knobs being swept.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+import sys
+from typing import Any, Dict, List, Optional, Sequence
+
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from automation.enrichment.scripts import scoring  # noqa: E402
+
+BUCKETS = ("Exceptional", "Strong", "Moderate", "Weak")
+DEFAULT_MAX_CANDIDATES = 1000
+
+
+def expand_grid(grid: Dict[str, Any], max_candidates: int = DEFAULT_MAX_CANDIDATES) -> List[Dict[str, Any]]:
+    """Expand a grid spec into [{"weights": {...}, "thresholds": {...}}, ...].
+
+    Scalar grid values are treated as single-value lists. Key order follows
+    the grid so every candidate sums weights in the same order.
+    Raises ValueError when the grid is empty or exceeds max_candidates.
+    """
+    if "candidates" in grid:
+        candidates = [
+            {"weights": dict(c.get("weights") or {}), "thresholds": dict(c.get("thresholds") or {})}
+            for c in grid.get("candidates") or []
+        ]
+    else:
+        w_grid = {k: v if isinstance(v, list) else [v] for k, v in (grid.get("weights") or {}).items()}
+        t_grid = {k: v if isinstance(v, list) else [v] for k, v in (grid.get("thresholds") or {}).items()}
+        keys = list(w_grid) + list(t_grid)
+        total = 1
+        for values in list(w_grid.values()) + list(t_grid.values()):
+            total *= len(values)
+        if total > max_candidates:
+            raise ValueError(f"grid expands to {total} candidates (max {max_candidates})")
+        candidates = []
+        for combo in itertools.product(*w_grid.values(), *t_grid.values()):
+            picked = dict(zip(keys, combo))
+            candidates.append(
+                {
+                    "weights": {k: float(picked[k]) for k in w_grid},
+                    "thresholds": {k: float(picked[k]) for k in t_grid},
+                }
+            )
+    if not candidates:
+        raise ValueError("grid produced no candidates")
+    if len(candidates) > max_candidates:
+        raise ValueError(f"{len(candidates)} candidates exceeds max {max_candidates}")
+    return candidates
+
+
+def _ranks(scores: Sequence[float]) -> List[int]:
+    """1-based rank per row: higher score first, ties broken by row order."""
+    order = sorted(range(len(scores)), key=lambda i: (-scores[i], i))
+    ranks = [0] * len(scores)
+    for pos, i in enumerate(order):
+        ranks[i] = pos + 1
+    return ranks
+
+
+def sweep(
+    enriched_rows: Sequence[Dict[str, Any]],
+    candidates: Sequence[Dict[str, Any]],
+    baseline: Optional[Dict[str, Any]] = None,
+    top_n: int = 10,
+) -> Dict[str, Any]:
+    """Score every candidate and compare it against the baseline.
+
+    Candidate weights/thresholds are merged over the baseline's before
+    scoring; results report the effective (merged) values. Each result
+    carries bucket counts, how many jobs changed bucket or rank versus the
+    baseline, the largest rank shift, and the top_n job ids.
+    """
+    rows = list(enriched_rows)
+    n = len(rows)
+    base = baseline or {"weights": {}, "thresholds": dict(scoring.DEFAULT_THRESHOLDS)}
+    base_weights = dict(base.get("weights") or {})
+    base_thresholds = dict(base.get("thresholds") or scoring.DEFAULT_THRESHOLDS)
+    candidates = [
+        {
+            "weights": {**base_weights, **(c.get("weights") or {})},
+            "thresholds": {**base_thresholds, **(c.get("thresholds") or {})},
+        }
+        for c in candidates
+    ]
+    keys: List[str] = []
+    for c in [base, *candidates]:
+        for k in c.get("weights") or {}:
+            if k not in keys:
+                keys.append(k)
+    features = scoring.build_features(rows, keys)
+    ids = [str(r.get("job_id") or r.get("url") or i) for i, r in enumerate(rows)]
+
+    def evaluate(c: Dict[str, Any]) -> Dict[str, Any]:
+        scores, buckets = scoring.score_features(features, n, c.get("weights") or {}, c.get("thresholds") or None)
+        return {"scores": scores, "buckets": buckets, "ranks": _ranks(scores)}
+
+    base_eval = evaluate(base)
+    results: List[Dict[str, Any]] = []
+    for c in candidates:
+        ev = evaluate(c)
+        counts = {b: 0 for b in BUCKETS}
+        for b in ev["buckets"]:
+            counts[b] += 1
+        shifts = [abs(r - br) for r, br in zip(ev["ranks"], base_eval["ranks"])]
+        top = sorted(range(n), key=lambda i: ev["ranks"][i])[: max(0, int(top_n))]
+        results.append(
+            {
+                "weights": dict(c.get("weights") or {}),
+                "thresholds": dict(c.get("thresholds") or {}),
+                "bucket_counts": counts,
+                "bucket_changes": sum(1 for b, bb in zip(ev["buckets"], base_eval["buckets"]) if b != bb),
+                "rank_changes": sum(1 for s in shifts if s),
+                "max_rank_shift": max(shifts, default=0),
+                "top": [ids[i] for i in top],
+            }
+        )
+    base_counts = {b: 0 for b in BUCKETS}
+    for b in base_eval["buckets"]:
+        base_counts[b] += 1
+    return {
+        "jobs": n,
+        "baseline": {
+            "weights": dict(base.get("weights") or {}),
+            "thresholds": dict(base.get("thresholds") or {}),
+            "bucket_counts": base_counts,
+        },
+        "results": results,
+    }
+
+
+def baseline_from_config(cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """Current scoring.weights / scoring.thresholds from a config mapping."""
+    sc = cfg.get("scoring", {}) if isinstance(cfg, dict) else {}
+    sc = sc if isinstance(sc, dict) else {}
+    return {
+        "weights": dict(sc.get("weights") or {}),
+        "thresholds": dict(sc.get("thresholds") or scoring.DEFAULT_THRESHOLDS),
+    }
+
+
+def sweep_run(
+    grid: Dict[str, Any],
+    run_ts: Optional[str] = None,
+    cfg: Optional[Dict[str, Any]] = None,
+    top_n: int = 10,
+) -> Dict[str, Any]:
+    """Load a run's enriched rows from sqlite_store and sweep the grid over them."""
+    from automation.storage import sqlite_store
+
+    resolved_ts, rows = sqlite_store.load_enriched(run_ts)
+    out = sweep(rows, expand_grid(grid), baseline_from_config(cfg or {}), top_n=top_n)
+    out["run_ts"] = resolved_ts
+    return out
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="What-if sweep of scoring weights/thresholds over stored features")
+    parser.add_argument("--grid", required=True, help="Path to grid JSON (weights/thresholds lists or candidates)")
+    parser.add_argument("--run-ts", dest="run_ts", default=None, help="Run timestamp to sweep (default: latest)")
+    parser.add_argument("--top", type=int, default=10, help="Top job ids to report per candidate")
+    args = parser.parse_args(argv)
+
+    with open(args.grid, "r", encoding="utf-8") as f:
+        grid = json.load(f)
+    cfg: Dict[str, Any] = {}
+    try:
+        from config.config_loader import config  # type: ignore
+
+        json_cfg = os.path.join(_ROOT, "config", "env.json")
+        if not os.path.exists(json_cfg):
+            json_cfg = os.path.join(_ROOT, "config", "env.sample.json")
+        config.initialize(json_path=json_cfg)
+        cfg = config.to_dict() or {}
+    except Exception:
+        cfg = {}
+    try:
+        out = sweep_run(grid, args.run_ts, cfg, top_n=args.top)
+    except ValueError as e:
+        print(f"Sweep failed: {e}", file=sys.stderr)
+        return 2
+    print(json.dumps(out, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,209 @@
+"""
+Near-duplicate posting clustering across job boards.
+
+The same role is often cross-posted (Greenhouse, Indeed, ZipRecruiter, Google
+Jobs, ...) under different URLs. cluster_postings() groups such postings with
+MinHash + LSH over normalized title tokens:
+
+- each posting's title becomes a feature set (unigrams/bigrams); MinHash
+  signatures are banded so only postings sharing a band are compared
+- candidates are confirmed with exact title Jaccard similarity >= threshold
+- hard vetoes, whatever the similarity: a different seniority/level
+  (senior vs staff, "Software Engineer" vs "Senior Software Engineer",
+  II vs III), different normalized locations (the same rule as the posting
+  registry in sqlite_store), and two postings from the same source (one board
+  listing the same title twice is usually two openings)
+- only postings of the same, non-empty normalized company are compared
+
+Each cluster yields one representative (most complete posting) carrying
+`alternate_sources` with the source/url of the others. Pure and deterministic.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+from typing import Any, Dict, FrozenSet, List, Sequence, Tuple
+
+NUM_PERM = 64
+BANDS = 16  # rows per band = NUM_PERM // BANDS; candidate threshold ~ (1/16) ** (1/4) = 0.5
+DEFAULT_THRESHOLD = 0.7
+
+_MERSENNE = (1 << 61) - 1
+_rng = random.Random(0x5EED)
+_PERMS: Tuple[Tuple[int, int], ...] = tuple(
+    (_rng.randrange(1, _MERSENNE), _rng.randrange(0, _MERSENNE)) for _ in range(NUM_PERM)
+)
+
+_TOKEN = re.compile(r"[a-z0-9#+]+")
+_TITLE_SYNONYMS = {
+    "sr": "senior",
+    "jr": "junior",
+    "eng": "engineer",
+    "engr": "engineer",
+    "dev": "developer",
+    "mgr": "manager",
+    "swe": "software engineer",
+    "snr": "senior",
+    "i": "1",
+    "ii": "2",
+    "iii": "3",
+    "iv": "4",
+    "v": "5",
+}
+_TITLE_NOISE = frozenset({"remote", "hybrid", "onsite", "m", "f", "d", "w", "x", "hiring", "urgent", "new"})
+# Seniority and level tokens (after synonyms); postings must agree on them exactly
+_LEVEL_TOKENS = frozenset(
+    {
+        "intern", "junior", "entry", "associate", "mid", "senior", "staff", "principal", "lead",
+        "distinguished", "head", "director", "vp", "chief", "1", "2", "3", "4", "5",
+    }
+)
+_COMPANY_SUFFIXES = frozenset({"inc", "llc", "ltd", "limited", "corp", "corporation", "co", "company", "gmbh", "plc", "sa", "ag", "bv"})
+
+
+def _tokens(value: Any) -> List[str]:
+    return _TOKEN.findall(str(value or "").lower())
+
+
+def _title_tokens(value: Any) -> List[str]:
+    out: List[str] = []
+    for tok in _tokens(value):
+        tok = _TITLE_SYNONYMS.get(tok, tok)
+        out.extend(t for t in tok.split() if t not in _TITLE_NOISE)
+    return out
+
+
+def normalize_company(value: Any) -> str:
+    return " ".join(t for t in _tokens(value) if t not in _COMPANY_SUFFIXES)
+
+
+def features(job: Dict[str, Any]) -> FrozenSet[str]:
+    """Title feature set compared by Jaccard similarity.
+
+    Company and location are not features: company scopes the comparison and
+    location is checked separately, so neither can lift two different
+    titles over the threshold.
+    """
+    title = _title_tokens(job.get("title"))
+    feats = set(title)
+    feats.update(f"{a} {b}" for a, b in zip(title, title[1:]))
+    return frozenset(feats)
+
+
+def level(job: Dict[str, Any]) -> FrozenSet[str]:
+    """Seniority/level tokens of a posting's title (empty for an unlevelled title)."""
+    return frozenset(t for t in _title_tokens(job.get("title")) if t in _LEVEL_TOKENS)
+
+
+def normalize_location(value: Any) -> str:
+    return " ".join(_tokens(value))
+
+
+def minhash(feats: FrozenSet[str]) -> Tuple[int, ...]:
+    """MinHash signature (NUM_PERM values) of a feature set."""
+    if not feats:
+        return (0,) * NUM_PERM
+    hashed = [
+        int.from_bytes(hashlib.blake2b(f.encode("utf-8"), digest_size=8).digest(), "big") & _MERSENNE for f in feats
+    ]
+    return tuple(min([(a * x + b) % _MERSENNE for x in hashed]) for a, b in _PERMS)
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def _completeness(job: Dict[str, Any]) -> Tuple[int, int]:
+    return (sum(1 for v in job.values() if v not in (None, "", [], {})), len(str(job.get("description") or "")))
+
+
+def cluster_postings(
+    jobs: Sequence[Dict[str, Any]],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[Dict[str, Any]]:
+    """Collapse cross-posted near-duplicates; returns representatives in input order.
+
+    Singletons are returned unchanged. A representative of a multi-posting
+    cluster is a copy with `alternate_sources` ([{"source", "url"}, ...]) and
+    `cluster_size` added.
+    """
+    n = len(jobs)
+    if n < 2:
+        return list(jobs)
+    feats = [features(j) for j in jobs]
+    levels = [level(j) for j in jobs]
+    locations = [normalize_location(j.get("location")) for j in jobs]
+    companies = [normalize_company(j.get("company")) for j in jobs]
+    sources = [str(j.get("source", "")) for j in jobs]
+    # Only companies listed by two or more sources can hold a cross-post
+    company_sources: Dict[str, set] = {}
+    for company, source in zip(companies, sources):
+        company_sources.setdefault(company, set()).add(source)
+    rows = NUM_PERM // BANDS
+    # Buckets are scoped to the normalized company, so unrelated employers
+    # with generic titles never become candidates
+    buckets: Dict[Tuple[str, int, Tuple[int, ...]], List[int]] = {}
+    for i, f in enumerate(feats):
+        # Without a company there is nothing to scope the comparison to
+        if not companies[i] or len(company_sources[companies[i]]) < 2:
+            continue
+        sig = minhash(f)
+        for band in range(BANDS):
+            buckets.setdefault((companies[i], band, sig[band * rows:(band + 1) * rows]), []).append(i)
+
+    pairs: Dict[Tuple[int, int], float] = {}
+    for members in buckets.values():
+        if len(members) < 2:
+            continue
+        for x in range(len(members)):
+            for y in range(x + 1, len(members)):
+                i, k = members[x], members[y]
+                # Different cities are different openings, however similar the title
+                if (i, k) in pairs or sources[i] == sources[k] or levels[i] != levels[k] or locations[i] != locations[k]:
+                    continue
+                sim = jaccard(feats[i], feats[k])
+                if sim >= threshold:
+                    pairs[(i, k)] = sim
+
+    # Union most similar pairs first; never join two components sharing a source
+    parent = list(range(n))
+    member_sources: Dict[int, set] = {i: {sources[i]} for i in range(n)}
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for (i, k), _sim in sorted(pairs.items(), key=lambda item: (-item[1], item[0])):
+        ri, rk = find(i), find(k)
+        if ri == rk or member_sources[ri] & member_sources[rk]:
+            continue
+        if rk < ri:
+            ri, rk = rk, ri
+        parent[rk] = ri
+        member_sources[ri] |= member_sources.pop(rk)
+
+    clusters: Dict[int, List[int]] = {}
+    for i in range(n):
+        clusters.setdefault(find(i), []).append(i)
+
+    out: List[Dict[str, Any]] = []
+    for root in sorted(clusters):
+        members = clusters[root]
+        if len(members) == 1:
+            out.append(jobs[members[0]])
+            continue
+        # Most complete posting wins; earliest in input order breaks ties
+        best = max(members, key=lambda i: (_completeness(jobs[i]), -i))
+        rep = dict(jobs[best])
+        rep["alternate_sources"] = [
+            {"source": sources[i], "url": str(jobs[i].get("url", ""))} for i in members if i != best
+        ]
+        rep["cluster_size"] = len(members)
+        out.append(rep)
+    return out
@@ -10,11 +10,16 @@ Provides pure, deterministic inference of:
 All functions are pure and operate on existing canonical fields.
 Inputs may include optional fields like description; functions are resilient
 to missing keys.
+
+Keyword lookups share one precompiled matcher (see `_KeywordMatcher`) so a
+text is lowercased and scanned once for every tag, instead of once per key.
 """
 
 from __future__ import annotations
 
-from typing import Dict, List, Set, Any
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Set, Any
 
 
 _TECH_KEYWORDS = {
@@ -132,47 +137,99 @@ _SENIORITY_MAP = [
 ]
 
 
+# Soft skills inferred from indicator substrings (checked in extract_skills)
+_SOFT_SKILLS = [
+    ("Leadership", ["lead", "manager", "mentorship"]),
+    ("Agile", ["agile", "scrum"]),
+    ("CI/CD", ["ci/cd", "pipeline", "jenkins", "github actions", "gitlab ci", "circleci"]),
+]
+
+
+class _KeywordMatcher:
+    """Find every keyword occurring as a substring of a text in one regex pass.
+
+    Keys are compiled into a single prefix-trie regex inside a lookahead, so
+    each text position is tried once and overlapping hits (e.g. "mysql" and
+    "sql", "django " and "go ") are all reported. Where several keys start at
+    the same position the longest wins and its key prefixes are implied, which
+    keeps results identical to `key in text` for every key.
+    """
+
+    def __init__(self, keys: Iterable[str]):
+        uniq = sorted({k for k in keys if k})
+        self._implied: Dict[str, FrozenSet[str]] = {
+            k: frozenset(p for p in uniq if k.startswith(p)) for k in uniq
+        }
+        self._regex = re.compile("(?=(" + self._trie_pattern(uniq) + "))")
+
+    @staticmethod
+    def _trie_pattern(words: List[str]) -> str:
+        trie: Dict[str, Any] = {}
+        for w in words:
+            node = trie
+            for ch in w:
+                node = node.setdefault(ch, {})
+            node[""] = {}
+
+        def build(node: Dict[str, Any]) -> str:
+            branches = [re.escape(ch) + build(sub) for ch, sub in sorted(node.items()) if ch]
+            if not branches:
+                return ""
+            body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+            # A key ending here makes the longer continuation optional (greedy => longest)
+            return "(?:" + body + ")?" if "" in node else body
+
+        return build(trie)
+
+    def scan(self, text_lower: str) -> FrozenSet[str]:
+        found: Set[str] = set()
+        for key in set(self._regex.findall(text_lower)):
+            found |= self._implied[key]
+        return frozenset(found)
+
+
+_MATCHER = _KeywordMatcher(
+    list(_TECH_KEYWORDS)
+    + [k for keys in _DOMAIN_TAGS.values() for k in keys]
+    + [k for k, _ in _SENIORITY_MAP]
+    + [k for _, keys in _SOFT_SKILLS for k in keys]
+)
+
+
+@lru_cache(maxsize=256)
+def _scan(text: str) -> FrozenSet[str]:
+    # enrich_job runs every infer_* on the same basis text; cache the scan
+    return _MATCHER.scan(text.lower())
+
+
 def infer_seniority(text: str) -> str:
-    t = text.lower()
+    hits = _scan(text)
     for key, val in _SENIORITY_MAP:
-        if key in t:
+        if key in hits:
             return val
-    # Default heuristic: manager titles
-    if "engineering manager" in t or "manager" in t:
-        return "manager"
     # Assume mid-level when unspecified
     return "mid"
 
 
 def infer_domain_tags(text: str) -> List[str]:
-    t = text.lower()
-    tags: List[str] = []
-    for tag, keys in _DOMAIN_TAGS.items():
-        if any(k in t for k in keys):
-            tags.append(tag)
+    hits = _scan(text)
+    tags = [tag for tag, keys in _DOMAIN_TAGS.items() if any(k in hits for k in keys)]
     # Stable order
     return sorted(set(tags))
 
 
 def infer_stack(text: str) -> List[str]:
-    t = text.lower()
-    found: Set[str] = set()
-    for key, norm in _TECH_KEYWORDS.items():
-        if key in t:
-            found.add(norm)
-    return sorted(found)
+    hits = _scan(text)
+    return sorted({norm for key, norm in _TECH_KEYWORDS.items() if key in hits})
 
 
 def extract_skills(text: str) -> List[str]:
-    # For now mirror stack keywords and add soft indicators if present
-    t = text.lower()
-    skills: Set[str] = set(infer_stack(text))
-    if "lead" in t or "manager" in t or "mentorship" in t:
-        skills.add("Leadership")
-    if "agile" in t or "scrum" in t:
-        skills.add("Agile")
-    if "ci/cd" in t or "pipeline" in t or "jenkins" in t or "github actions" in t or "gitlab ci" in t or "circleci" in t:
-        skills.add("CI/CD")
+    # Mirror stack keywords and add soft indicators if present
+    hits = _scan(text)
+    skills: Set[str] = {norm for key, norm in _TECH_KEYWORDS.items() if key in hits}
+    for skill, keys in _SOFT_SKILLS:
+        if any(k in hits for k in keys):
+            skills.add(skill)
     return sorted(skills)
 
 
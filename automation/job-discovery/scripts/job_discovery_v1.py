@@ -16,7 +16,7 @@ try:  # Python 3.11+
 except Exception:  # Python <3.11
     from datetime import timezone as _tz  # type: ignore
     UTC = _tz.utc  # type: ignore
-from typing import Dict, List, Callable, Any, Optional
+from typing import Dict, List, Callable, Any, Iterable, Iterator, Optional
 import argparse
 import logging
 import json
@@ -57,6 +57,16 @@ logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
 REQUIRED_KEYS = {"title", "location", "company", "source", "url", "posted_date"}
+FILE_ONLY_CONFIG_KEYS = (
+    "JOB_FILTER_KEYWORDS",
+    "JOB_FILTER_LOCATIONS",
+    "JOB_FILTER_EXCLUDE_KEYWORDS",
+    "JOB_FILTER_MAX_AGE_DAYS",
+    "INDEED_API_URL",
+    "INDEED_ENABLED",
+    "LINKEDIN_ENABLED",
+    "LINKEDIN_API_URL",
+)
 
 
 def _validate_job(job: Dict[str, Any]) -> bool:
@@ -75,45 +85,69 @@ def _validate_job(job: Dict[str, Any]) -> bool:
     return True
 
 
-def _safe_fetch(name: str, func: Callable[[], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+def _iter_source(name: str, func: Callable[[], Iterable[Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
+    """Yield a source's valid jobs as its pages arrive.
+
+    A source that fails (up front or mid-stream) is logged and stops; jobs it
+    already yielded are kept.
+    """
+    invalid = 0
     try:
         res = func()
-        if not isinstance(res, list):
+        if isinstance(res, (dict, str, bytes)) or not hasattr(res, "__iter__"):
             logger.error("source '%s' returned non-list result", name)
-            return []
-        valid = [j for j in res if _validate_job(j)]
-        invalid = len(res) - len(valid)
-        if invalid:
-            logger.warning("source '%s' returned %d invalid jobs", name, invalid)
-        return valid
+            return
+        for job in res:
+            if _validate_job(job):
+                yield job
+            else:
+                invalid += 1
     except Exception:
         logger.error("source '%s' failed", name, exc_info=True)
-        return []
+    finally:
+        if invalid:
+            logger.warning("source '%s' returned %d invalid jobs", name, invalid)
 
 
-def discover_jobs() -> List[Dict[str, str]]:
-    """Collect jobs from enabled sources. Each job has keys:
+def _placeholder_jobs() -> List[Dict[str, str]]:
+    # Fallback minimal placeholder (kept for bootstrapping)
+    today = datetime.now(UTC).strftime("%Y-%m-%d")
+    return [
+        {
+            "title": "Senior Software Engineer - Remote",
+            "location": "Remote",
+            "company": "Acme Corp",
+            "source": "sample",
+            "url": "https://example.com/jobs/1",
+            "posted_date": today,
+        }
+    ]
+
+
+def iter_discovered_jobs() -> Iterator[Dict[str, str]]:
+    """Stream jobs from enabled sources page by page. Each job has keys:
     title, location, company, source, url, posted_date (YYYY-MM-DD).
+
+    Only the current page of each source is held; the bootstrap placeholder is
+    yielded when no source produced a job.
     """
-    jobs: List[Dict[str, str]] = []
+    found = False
+    streams = []
     if config.get_bool("LINKEDIN_ENABLED", False):
-        jobs.extend(_safe_fetch("linkedin", sources.fetch_linkedin_jobs))
+        streams.append(("linkedin", sources.iter_linkedin_jobs))
     if config.get_bool("INDEED_ENABLED", True):
-        jobs.extend(_safe_fetch("indeed", sources.fetch_indeed_jobs))
-    if not jobs:
-        # Fallback minimal placeholder (kept for bootstrapping)
-        today = datetime.now(UTC).strftime("%Y-%m-%d")
-        jobs = [
-            {
-                "title": "Senior Software Engineer - Remote",
-                "location": "Remote",
-                "company": "Acme Corp",
-                "source": "sample",
-                "url": "https://example.com/jobs/1",
-                "posted_date": today,
-            }
-        ]
-    return jobs
+        streams.append(("indeed", sources.iter_indeed_jobs))
+    for name, func in streams:
+        for job in _iter_source(name, func):
+            found = True
+            yield job
+    if not found:
+        yield from _placeholder_jobs()
+
+
+def discover_jobs() -> List[Dict[str, str]]:
+    """Collect jobs from enabled sources; materialized form of iter_discovered_jobs."""
+    return list(iter_discovered_jobs())
 
 
 def ensure_dir(path: str) -> None:
@@ -198,44 +232,123 @@ def export_scored_csv_with_ts(rows: List[Dict[str, Any]], out_dir: str, ts: str)
     return path
 
 
-def main(argv: List[str] | None = None) -> None:
-    parser = argparse.ArgumentParser(description="Job discovery orchestrator")
-    parser.add_argument("--out-dir", dest="out_dir", default=None, help="Override output directory")
-    parser.add_argument("--summary-only", dest="summary_only", action="store_true", help="Run discovery without CSV export")
-    parser.add_argument("--enrich", dest="enrich", action="store_true", help="Run enrichment + scoring and export artifacts")
-    parser.add_argument("--schedule", dest="schedule", action="store_true", help="Enable scheduling gate (Phase 3B)")
-    args = parser.parse_args(argv)
+def export_run_manifest(
+    path: str,
+    run_ts: str,
+    artifacts: Dict[str, Optional[str]],
+    counts: Dict[str, Optional[int]],
+) -> str:
+    """Write the run manifest naming this run's exact artifacts and row counts.
+
+    Written via a temp file + os.replace so readers never see a partial manifest.
+    """
+    ensure_dir(os.path.dirname(os.path.abspath(path)))
+    manifest = {
+        "run_ts": run_ts,
+        "created_at": datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S+00:00"),
+        "artifacts": {
+            kind: {"path": os.path.abspath(p), "rows": counts.get(kind)} if p else None
+            for kind, p in artifacts.items()
+        },
+    }
+    tmp = f"{path}.tmp.{os.getpid()}"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp, path)
+    return path
+
+
+def run_manifest_path(out_dir: str, ts: str) -> str:
+    return os.path.join(out_dir, f"jobs_run_{ts}.manifest.json")
+
+
+def claim_run_ts(out_dir: str, base: str) -> str:
+    """Reserve a run id that is unique within out_dir: base, then base_2, base_3, ...
+
+    The claim is the exclusive creation of the run's manifest, so two runs
+    started in the same second never share artifact names; the manifest
+    written at the end of the run replaces the placeholder.
+    """
+    ensure_dir(out_dir)
+    n = 1
+    while True:
+        ts = base if n == 1 else f"{base}_{n}"
+        try:
+            fd = os.open(run_manifest_path(out_dir, ts), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            n += 1
+            continue
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"run_ts": ts, "status": "running"}, f)
+        return ts
+
+
+def _incremental_salt(cfg: Dict[str, Any], weights: Dict[str, Any], thresholds: Dict[str, Any]) -> str:
+    """Signature of the enrichment/scoring inputs; changing them invalidates carried rows."""
+    payload = {
+        "enrichment": cfg.get("enrichment", {}),
+        "weights": weights,
+        "thresholds": thresholds,
+    }
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
 
-    # Uvicorn and parent shells can retain stale env values across hot reloads.
-    # Reset discovery-related keys so this run uses the latest .env/json settings.
-    for key in (
-        "JOB_FILTER_KEYWORDS",
-        "JOB_FILTER_LOCATIONS",
-        "JOB_FILTER_EXCLUDE_KEYWORDS",
-        "JOB_FILTER_MAX_AGE_DAYS",
-        "INDEED_API_URL",
-        "INDEED_ENABLED",
-        "LINKEDIN_ENABLED",
-        "LINKEDIN_API_URL",
-    ):
-        os.environ.pop(key, None)
 
+def _report(progress: Optional[Callable[[str, Dict[str, Any]], None]], stage: str, **data: Any) -> None:
+    """Forward a progress event; a failing listener never breaks the run."""
+    if progress is None:
+        return
+    try:
+        progress(stage, data)
+    except Exception:
+        logger.info("Progress listener failed for stage '%s'", stage)
+
+
+def run_pipeline(
+    out_dir: Optional[str] = None,
+    *,
+    summary_only: bool = False,
+    enrich: bool = False,
+    schedule: bool = False,
+    incremental: bool = False,
+    echo: Callable[[str], None] = print,
+    progress: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    manifest_path: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Run discovery (and optionally enrichment + scoring) in-process.
+
+    Same behavior and artifacts as the CLI; the rows are also returned so callers
+    such as the control-center backend need not parse the exported files back.
+    `progress(stage, data)` is called as stages complete: "fetch" (per-source
+    counts), "filter", "enrich" (started/done), "score", "export", "persist".
+    A run manifest naming the exact artifact paths and row counts is written to
+    `<out_dir>/jobs_run_{ts}.manifest.json` (and copied to `manifest_path` when given).
+    `ts` is the run's start second, suffixed `_2`, `_3`, ... when another run in
+    `out_dir` already claimed that second, so concurrent runs never share files.
+
+    Returns:
+        {"run_ts", "status": "completed" | "skipped", "summary", "jobs" (matched),
+        "enriched", "scored", "artifacts": {"summary", "discovered_csv",
+        "enriched_json", "scored_csv"}, "manifest"} (only run_ts/status when skipped).
+    """
     json_cfg = os.path.join(_ROOT, "config", "env.json")
     if not os.path.exists(json_cfg):
         json_cfg = os.path.join(_ROOT, "config", "env.sample.json")
-    config.initialize(json_path=json_cfg)
+    # Uvicorn and parent shells can retain stale env values across hot reloads:
+    # discovery keys come from the latest .env/json files, without touching the
+    # host process environment (runs may share it with the web server)
+    config.initialize(json_path=json_cfg, file_only_keys=FILE_ONLY_CONFIG_KEYS)
 
     environment = config.get("SYSTEM_ENVIRONMENT", "development")
     log_level = config.get("SYSTEM_LOG_LEVEL", "INFO")
-    out_dir = str(args.out_dir or config.get("SYSTEM_OUTPUT_DIRECTORY", "output"))
+    out_dir = str(out_dir or config.get("SYSTEM_OUTPUT_DIRECTORY", "output"))
 
     # Filters from config
     keywords = normalize_terms(config.get_list("JOB_FILTER_KEYWORDS", ["software engineer", "developer"]) or [])
     locations = normalize_terms(config.get_list("JOB_FILTER_LOCATIONS", ["Remote"]) or [])
     exclude = normalize_terms(config.get_list("JOB_FILTER_EXCLUDE_KEYWORDS", ["volunteer"]) or [])
 
-    print("Job discovery v1  starting")
-    print(
+    echo("Job discovery v1  starting")
+    echo(
         f"Env: {environment} | Log: {log_level} | "
         f"Keywords: {', '.join(keywords) or '-'} | Locations: {', '.join(locations) or '-'} | Exclude: {', '.join(exclude) or '-'}"
     )
@@ -243,10 +356,22 @@ def main(argv: List[str] | None = None) -> None:
     # Reset per-run source metrics
     if hasattr(sources, "reset_metrics"):
         sources.reset_metrics()
+    # Size the shared HTTP connection pool from config
+    if hasattr(sources, "configure_http"):
+        try:
+            sources.configure_http(config)
+        except Exception:
+            logger.info("HTTP pool configuration skipped; using defaults")
+    if hasattr(sources, "configure_rate_limits"):
+        try:
+            sources.configure_rate_limits(config)
+        except Exception:
+            logger.info("Rate limit store configuration skipped; using in-process buckets")
 
     # Prepare optional JSONL logging sink
-    # Single timestamp used across artifacts for determinism in tests
-    run_ts = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
+    # Single timestamp used across artifacts for determinism in tests,
+    # suffixed when another run in out_dir already claimed this second
+    run_ts = claim_run_ts(out_dir, datetime.now(UTC).strftime("%Y%m%d_%H%M%S"))
     if config.get_bool("LOG_TO_FILE", False):
         set_jsonl_sink(os.path.join(out_dir, f"run-{run_ts}.jsonl"))
         # Optional suppression of stdout logs when JSONL is enabled
@@ -254,7 +379,7 @@ def main(argv: List[str] | None = None) -> None:
         set_suppress_stdout_if_jsonl(bool(suppress))
 
     # Optional scheduling gate (Phase 3B)
-    if getattr(args, "schedule", False):
+    if schedule:
         try:
             import scheduler  # type: ignore
 
@@ -266,30 +391,48 @@ def main(argv: List[str] | None = None) -> None:
             except NotImplementedError:
                 should = True  # defer gating until implemented
             if not should:
-                print("--schedule enabled: not time to run; exiting early")
-                return
+                echo("--schedule enabled: not time to run; exiting early")
+                os.remove(run_manifest_path(out_dir, run_ts))
+                return {"run_ts": run_ts, "status": "skipped"}
         except Exception:
             # Scheduling unavailable; proceed without gating
             logger.info("Scheduling helpers unavailable; proceeding without schedule gating")
 
-    # Fetch and filter
-    jobs = discover_jobs()
+    # Fetch and filter page by page: only matched jobs are kept in memory
+    fetched = 0
+    per_source_counts: Dict[str, int] = {}
     matched: List[Dict[str, str]] = []
-    for job in jobs:
+    for job in iter_discovered_jobs():
+        fetched += 1
+        name = str(job.get("source", ""))
+        per_source_counts[name] = per_source_counts.get(name, 0) + 1
         if matches_filters(job.get("title", ""), job.get("location", ""), keywords, locations, exclude):
             matched.append(job)
-
-    print(f"Found {len(jobs)} jobs; {len(matched)} matched filters")
+    filtered_out = fetched - len(matched)
+    # Collapse cross-posted duplicates among the matched jobs
+    duplicates_clustered: Optional[int] = None
+    if config.get_bool("SOURCES_CLUSTER_ENABLED", False) and hasattr(sources, "cluster_jobs"):
+        before = len(matched)
+        matched = sources.cluster_jobs(matched, config)
+        duplicates_clustered = before - len(matched)
+    total_discovered = fetched - (duplicates_clustered or 0)
+    _report(progress, "fetch", total=total_discovered, per_source=per_source_counts, duplicates_clustered=duplicates_clustered)
+
+    echo(f"Found {total_discovered} jobs; {len(matched)} matched filters")
+    _report(progress, "filter", matched=len(matched), filtered_out=filtered_out)
     # Single timestamp for CSV + summary for determinism
     ts = run_ts
     out_csv = None
     enriched_json_path = None
     out_scored_csv = None
-    if not args.summary_only:
+    incremental_counts: Optional[Dict[str, int]] = None
+    enriched_rows: List[Dict[str, Any]] = []
+    scored_rows: List[Dict[str, Any]] = []
+    if not summary_only:
         out_csv = export_to_csv_with_ts(matched, out_dir, ts)
 
     # Optional enrichment + scoring pipeline (Phase 3A)
-    if args.enrich and not args.summary_only:
+    if enrich and not summary_only:
         if enrichment and scoring:
             # Build config slices for enrichment/scoring (defaults if missing)
             # Enrichment uses config within extract_features; scoring uses weights/thresholds
@@ -308,16 +451,57 @@ def main(argv: List[str] | None = None) -> None:
             except Exception:
                 pass
 
-            enriched_rows: List[Dict[str, Any]] = [enrichment.extract_features(j, config.to_dict()) for j in matched]
-            enriched_json_path = export_enriched_json_with_ts(enriched_rows, out_dir, ts)
-
-            scored_rows: List[Dict[str, Any]] = []
-            for e in enriched_rows:
-                s = scoring.score_job(e, weights, thresholds)
+            # Incremental mode: only the delta goes through enrichment + scoring
+            store = None
+            salt = ""
+            to_process: List[Dict[str, Any]] = list(matched)
+            carried: Dict[str, Dict[str, Any]] = {}
+            if incremental or config.get_bool("STORAGE_INCREMENTAL", False):
+                try:
+                    from automation.storage import sqlite_store as store  # type: ignore
+
+                    store.init_schema()
+                    salt = _incremental_salt(config.to_dict(), weights, thresholds)
+                    to_process, carried = store.partition_seen(matched, salt)
+                except Exception:
+                    logger.info("Incremental state unavailable; processing all matched jobs")
+                    store = None
+                    to_process, carried = list(matched), {}
+
+            # Batch API compiles the enrichment config once; large sets fan out to processes
+            workers = config.get_int("ENRICHMENT_WORKERS", 0)
+            _report(progress, "enrich", status="started", jobs=len(to_process), carried_forward=len(carried))
+            fresh_enriched = enrichment.extract_features_batch(to_process, config.to_dict(), max_workers=workers or None)
+            _report(progress, "enrich", status="done", enriched=len(fresh_enriched))
+            fresh_rows: List[Dict[str, Any]] = []
+            # Score the whole delta at once (vectorized when NumPy is installed)
+            for e, s in zip(fresh_enriched, scoring.score_jobs(fresh_enriched, weights, thresholds)):
                 combined = dict(e)
                 combined.update({"score": s.get("score", 0.0), "bucket": s.get("bucket", "Weak")})
-                scored_rows.append(combined)
+                fresh_rows.append(combined)
+
+            # Reassemble in matched order so artifacts are identical to a full run
+            scored_rows = []
+            fresh_iter = iter(fresh_rows)
+            for j in matched:
+                prev = carried.get(store.job_id_for(j)) if store is not None else None
+                scored_rows.append(prev if prev is not None else next(fresh_iter))
+            enriched_rows = [
+                {k: v for k, v in r.items() if k not in ("score", "bucket")} for r in scored_rows
+            ]
+            buckets: Dict[str, int] = {}
+            for r in scored_rows:
+                buckets[str(r.get("bucket"))] = buckets.get(str(r.get("bucket")), 0) + 1
+            _report(progress, "score", scored=len(scored_rows), buckets=buckets)
+            enriched_json_path = export_enriched_json_with_ts(enriched_rows, out_dir, ts)
             out_scored_csv = export_scored_csv_with_ts(scored_rows, out_dir, ts)
+
+            if store is not None:
+                incremental_counts = {"processed": len(fresh_rows), "carried_forward": len(carried)}
+                try:
+                    store.remember_processed(run_ts, fresh_rows, salt)
+                except Exception:
+                    logger.info("Failed to persist incremental state; next run will reprocess")
         else:
             logger.warning("Enrichment/scoring modules not available; skipping --enrich pipeline.")
 
@@ -337,27 +521,52 @@ def main(argv: List[str] | None = None) -> None:
             "scraper_failures": m.get("scraper_failures", 0),
         }
 
-    filtered_out = max(0, len(jobs) - len(matched))
     summary = {
         "timestamp_utc": datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S+00:00"),
         "enabled_sources": enabled_sources,
         "counts": {
-            "total_discovered": len(jobs),
+            "total_discovered": total_discovered,
             "filtered_out": filtered_out,
             "exported": len(matched),
         },
         "per_source": per_source,
     }
+    if duplicates_clustered is not None:
+        summary["counts"]["duplicates_clustered"] = duplicates_clustered
+    if incremental_counts is not None:
+        summary["incremental"] = incremental_counts
     out_json = export_summary(out_dir, ts, summary)
+    artifacts = {
+        "summary": out_json,
+        "discovered_csv": out_csv,
+        "enriched_json": enriched_json_path,
+        "scored_csv": out_scored_csv,
+    }
+    manifest_counts = {"discovered_csv": len(matched), "enriched_json": len(enriched_rows), "scored_csv": len(scored_rows)}
+    # The default manifest always replaces this run's claim; --manifest gets its own copy
+    manifest = export_run_manifest(run_manifest_path(out_dir, ts), run_ts, artifacts, manifest_counts)
+    if manifest_path:
+        manifest = export_run_manifest(manifest_path, run_ts, artifacts, manifest_counts)
+    _report(progress, "export", manifest=manifest, **artifacts)
+    # Optionally persist the whole run to sqlite_store in one transaction
+    if config.get_bool("STORAGE_PERSIST_RUNS", False):
+        try:
+            from automation.storage import sqlite_store  # type: ignore
+
+            sqlite_store.init_schema()
+            sqlite_store.ingest_run(dict(summary, run_ts=run_ts), matched, enriched_rows, scored_rows)
+            _report(progress, "persist", run_ts=run_ts)
+        except Exception:
+            logger.info("Run persistence skipped; sqlite_store unavailable or schema mismatch")
     # Optionally pretty-print a short summary after export
-    print(pretty_print_summary(summary))
-    if not args.summary_only and out_csv:
-        print(f"Exported matched jobs to: {out_csv}")
+    echo(pretty_print_summary(summary))
+    if not summary_only and out_csv:
+        echo(f"Exported matched jobs to: {out_csv}")
     if enriched_json_path:
-        print(f"Exported enriched jobs to: {enriched_json_path}")
+        echo(f"Exported enriched jobs to: {enriched_json_path}")
     if out_scored_csv:
-        print(f"Exported scored jobs to: {out_scored_csv}")
-    print(f"Summary: {out_json}")
+        echo(f"Exported scored jobs to: {out_scored_csv}")
+    echo(f"Summary: {out_json}")
 
     # Optional retention prune (Phase 3B)
     try:
@@ -381,6 +590,46 @@ def main(argv: List[str] | None = None) -> None:
     except Exception:
         logger.info("Retention prune skipped due to missing backend or config")
 
+    return {
+        "run_ts": run_ts,
+        "status": "completed",
+        "summary": summary,
+        "jobs": matched,
+        "enriched": enriched_rows,
+        "scored": scored_rows,
+        "artifacts": artifacts,
+        "manifest": manifest,
+    }
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Job discovery orchestrator")
+    parser.add_argument("--out-dir", dest="out_dir", default=None, help="Override output directory")
+    parser.add_argument("--summary-only", dest="summary_only", action="store_true", help="Run discovery without CSV export")
+    parser.add_argument("--enrich", dest="enrich", action="store_true", help="Run enrichment + scoring and export artifacts")
+    parser.add_argument("--schedule", dest="schedule", action="store_true", help="Enable scheduling gate (Phase 3B)")
+    parser.add_argument(
+        "--incremental",
+        dest="incremental",
+        action="store_true",
+        help="With --enrich, only enrich/score new or changed jobs; carry forward the rest from storage",
+    )
+    parser.add_argument(
+        "--manifest",
+        dest="manifest",
+        default=None,
+        help="Write the run manifest (artifact paths and row counts) to this path",
+    )
+    args = parser.parse_args(argv)
+    run_pipeline(
+        args.out_dir,
+        manifest_path=args.manifest,
+        summary_only=args.summary_only,
+        enrich=args.enrich,
+        schedule=args.schedule,
+        incremental=args.incremental,
+    )
+
 
 if __name__ == "__main__":
     main()
@@ -9,10 +9,15 @@ Two-stage import hardening:
 """
 from __future__ import annotations
 
+import os
+import json
 import time
 import random
 import logging
-from typing import Callable, TypeVar, Optional
+import sqlite3
+import threading
+from typing import Any, Callable, Dict, TypeVar, Optional, Tuple
+from urllib.parse import urlparse
 
 def _load_logging_utils():
     try:
@@ -29,51 +34,306 @@ def _load_logging_utils():
 T = TypeVar("T")
 logger = logging.getLogger(__name__)
 
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+_DEFAULT_BUCKET_DB = os.path.join(_ROOT, "data", "rate_limits.db")
+_DEFAULT_BREAKER_PATH = os.path.join(_ROOT, "data", "circuit_breakers.json")
+
+
+class MemoryBucketStore:
+    """In-process token bucket state, safe to share between threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._state: Dict[str, Tuple[float, float]] = {}
+
+    def take(self, key: str, rate: float, capacity: float, now: float) -> float:
+        """Reserve one token and return how long the caller must wait for it."""
+        with self._lock:
+            tokens, updated = self._state.get(key, (capacity, now))
+            tokens, wait = _reserve(tokens, updated, rate, capacity, now)
+            self._state[key] = (tokens, now)
+            return wait
+
+
+class SQLiteBucketStore:
+    """Token bucket state in a SQLite file so several processes share one budget.
+
+    Each reservation runs in a `BEGIN IMMEDIATE` transaction, which serializes
+    concurrent writers across processes via SQLite's file lock.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_buckets (key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def take(self, key: str, rate: float, capacity: float, now: float) -> float:
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT tokens, updated_at FROM rate_buckets WHERE key = ?", (key,)).fetchone()
+            tokens, updated = (float(row[0]), float(row[1])) if row else (capacity, now)
+            tokens, wait = _reserve(tokens, updated, rate, capacity, now)
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_buckets(key, tokens, updated_at) VALUES (?, ?, ?)",
+                (key, tokens, max(now, updated)),
+            )
+            conn.execute("COMMIT")
+            return wait
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+
+def _reserve(tokens: float, updated: float, rate: float, capacity: float, now: float) -> Tuple[float, float]:
+    """Refill a bucket up to `now`, take one token, and return (tokens, wait).
+
+    Tokens may go negative: the deficit is a reservation that later callers
+    queue behind, so waits stay fair without re-checking after sleep.
+    """
+    elapsed = max(0.0, now - updated)
+    tokens = min(capacity, tokens + elapsed * rate)
+    tokens -= 1.0
+    wait = 0.0 if tokens >= 0 else (-tokens) / rate
+    return tokens, wait
+
 
 class RateLimiter:
-    """Simple per-minute rate limiter.
+    """Token bucket rate limiter.
 
-    - rpm: allowed calls per minute
+    - rpm: sustained calls per minute (refilled smoothly, rpm/60 per second)
+    - burst: bucket capacity; defaults to rpm
+    - key/store: bucket identity and backing store; limiters sharing a key and
+      store share one budget (see `for_host`)
     - now_fn: injectable time function for tests
     - sleep_fn: injectable sleep function for tests
     """
 
+    # Store backing `for_host` buckets; see configure_shared_store
+    shared_store: Any = MemoryBucketStore()
+
     def __init__(
         self,
         rpm: int = 60,
         now_fn: Callable[[], float] = time.time,
         sleep_fn: Callable[[float], None] = time.sleep,
         on_sleep: Optional[Callable[[float], None]] = None,
+        burst: Optional[int] = None,
+        key: Optional[str] = None,
+        store: Any = None,
     ):
         self.rpm = max(1, int(rpm))
+        self.burst = max(1, int(burst)) if burst else self.rpm
         self._now = now_fn
         self._sleep = sleep_fn
         self._on_sleep = on_sleep
-        self._window_start = self._now()
-        self._count = 0
+        self._key = key or f"limiter:{id(self)}"
+        self._store = store if store is not None else MemoryBucketStore()
+
+    @classmethod
+    def for_host(cls, url: str, rpm: int = 60, burst: Optional[int] = None, **kwargs: Any) -> "RateLimiter":
+        """Limiter sharing one bucket per host across fetchers (and processes
+        when the shared store is SQLite-backed)."""
+        host = urlparse(url).netloc.lower() if "://" in str(url) else str(url).lower()
+        kwargs.setdefault("store", cls.shared_store)
+        return cls(rpm=rpm, burst=burst, key=f"host:{host}", **kwargs)
+
+    @classmethod
+    def configure_shared_store(cls, kind: str = "memory", path: Optional[str] = None) -> Any:
+        """Select the store backing per-host limiters ("memory" or "sqlite")."""
+        if str(kind).lower() == "sqlite":
+            cls.shared_store = SQLiteBucketStore(path or _DEFAULT_BUCKET_DB)
+        else:
+            cls.shared_store = MemoryBucketStore()
+        return cls.shared_store
 
     def acquire(self) -> None:
-        now = self._now()
-        elapsed = now - self._window_start
-        if elapsed >= 60.0:
-            # reset window
-            self._window_start = now
-            self._count = 0
-        if self._count >= self.rpm:
-            wait = max(0.0, 60.0 - elapsed)
-            if wait > 0:
-                structured_log = _load_logging_utils()
-                structured_log(logger, "info", "rate_limit_sleep", wait_seconds=round(wait, 3))
-                if self._on_sleep:
-                    try:
-                        self._on_sleep(wait)
-                    except Exception:
-                        logger.debug("on_sleep callback error", exc_info=True)
-                self._sleep(wait)
-            # reset after waiting
-            self._window_start = self._now()
-            self._count = 0
-        self._count += 1
+        wait = self._store.take(self._key, self.rpm / 60.0, float(self.burst), self._now())
+        if wait > 0:
+            structured_log = _load_logging_utils()
+            structured_log(logger, "info", "rate_limit_sleep", wait_seconds=round(wait, 3))
+            if self._on_sleep:
+                try:
+                    self._on_sleep(wait)
+                except Exception:
+                    logger.debug("on_sleep callback error", exc_info=True)
+            self._sleep(wait)
+
+
+# HTTP statuses worth retrying; every other 4xx is a caller/config problem
+RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+# Missing modules/libraries and programming errors fail the same way every time
+FATAL_ERRORS = (ImportError, NameError, AttributeError, TypeError, NotImplementedError)
+# Malformed URLs from configuration (requests/httpx), matched by name so
+# neither library has to be importable here
+FATAL_ERROR_NAMES = frozenset({"MissingSchema", "InvalidSchema", "InvalidURL", "UnsupportedProtocol"})
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    """HTTP status carried by requests/httpx errors (or a `status_code` attr)."""
+    for holder in (getattr(exc, "response", None), exc):
+        code = getattr(holder, "status_code", None)
+        if isinstance(code, int):
+            return code
+    return None
+
+
+def classify_error(exc: BaseException) -> str:
+    """Return "retry" for transient failures and "fatal" for ones retrying cannot fix.
+
+    Fatal: interpreter signals (KeyboardInterrupt, SystemExit, ...), HTTP
+    4xx responses other than 408/425/429, import/missing-library errors
+    (e.g. "requests library not available"), programming errors and malformed
+    configured URLs. Everything else is retried.
+    """
+    if not isinstance(exc, Exception):
+        return "fatal"
+    if isinstance(exc, FATAL_ERRORS) or any(cls.__name__ in FATAL_ERROR_NAMES for cls in type(exc).__mro__):
+        return "fatal"
+    code = _status_code(exc)
+    if code is not None and 400 <= code < 500 and code not in RETRYABLE_STATUS:
+        return "fatal"
+    return "retry"
+
+
+def retry_after_seconds(exc: BaseException, now_fn: Callable[[], float] = time.time) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) from an HTTP error."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        value = headers.get("Retry-After")
+    except Exception:
+        return None
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        from email.utils import parsedate_to_datetime
+
+        return max(0.0, parsedate_to_datetime(value).timestamp() - now_fn())
+    except Exception:
+        return None
+
+
+class JsonBreakerStore:
+    """Circuit breaker state persisted to a JSON file so it survives across runs."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def load(self, name: str) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._read().get(name, {}))
+
+    def save(self, name: str, state: Dict[str, Any]) -> None:
+        with self._lock:
+            data = self._read()
+            data[name] = state
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp = f"{self.path}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp, self.path)
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                loaded = json.load(f)
+            return loaded if isinstance(loaded, dict) else {}
+        except Exception:
+            return {}
+
+
+class CircuitBreaker:
+    """Per-source circuit breaker.
+
+    After `failure_threshold` consecutive give-ups the breaker opens and calls
+    are skipped for `cooldown_seconds`. The first call after the cool-down is a
+    half-open probe: success closes the breaker, failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        cooldown_seconds: float = 3600.0,
+        now_fn: Callable[[], float] = time.time,
+        store: Optional[JsonBreakerStore] = None,
+    ):
+        self.name = name
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.cooldown_seconds = float(cooldown_seconds)
+        self._now = now_fn
+        self._store = store
+        state = store.load(name) if store else {}
+        self.failures = int(state.get("failures", 0))
+        self.opened_at: Optional[float] = state.get("opened_at")
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if self._now() - float(self.opened_at) >= self.cooldown_seconds:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        return self.state != "open"
+
+    def record_success(self) -> None:
+        if self.failures or self.opened_at is not None:
+            self.failures = 0
+            self.opened_at = None
+            self._persist()
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            self.opened_at = self._now()
+        self._persist()
+
+    def _persist(self) -> None:
+        if self._store:
+            self._store.save(self.name, {"failures": self.failures, "opened_at": self.opened_at})
+
+
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+_BREAKERS_LOCK = threading.Lock()
+
+
+def get_breaker(
+    name: str,
+    failure_threshold: int = 3,
+    cooldown_seconds: float = 3600.0,
+    path: Optional[str] = _DEFAULT_BREAKER_PATH,
+) -> CircuitBreaker:
+    """Process-wide breaker for a source, backed by a JSON state file (None = memory only)."""
+    with _BREAKERS_LOCK:
+        breaker = _BREAKERS.get(name)
+        if breaker is None:
+            store = JsonBreakerStore(path) if path else None
+            breaker = CircuitBreaker(name, failure_threshold, cooldown_seconds, store=store)
+            _BREAKERS[name] = breaker
+        else:
+            breaker.failure_threshold = max(1, int(failure_threshold))
+            breaker.cooldown_seconds = float(cooldown_seconds)
+        return breaker
 
 
 def with_retry(
@@ -85,32 +345,60 @@ def with_retry(
     sleep_fn: Callable[[float], None] = time.sleep,
     on_error: Optional[Callable[[int, BaseException], None]] = None,
     on_retry: Optional[Callable[[int, float, BaseException], None]] = None,
+    classify: Callable[[BaseException], str] = classify_error,
+    retry_after_max: float = 60.0,
+    breaker: Optional[CircuitBreaker] = None,
 ) -> Optional[T]:
-    """Execute func with exponential backoff + jitter on exceptions.
+    """Execute func with exponential backoff + jitter on retryable exceptions.
+
+    - Errors are classified via `classify`; fatal ones stop immediately
+      (interpreter signals such as KeyboardInterrupt are re-raised).
+    - A Retry-After header on the error raises the delay, capped at
+      `retry_after_max` seconds.
+    - With a `breaker`, calls are skipped while it is open and each give-up
+      counts toward opening it.
 
-    Returns the function result, or None after exhausting retries.
-    Logs structured messages on failures.
+    Returns the function result, or None after a fatal error, exhausted
+    retries, or an open circuit. Logs structured messages on failures.
     """
+    structured_log = _load_logging_utils()
+    if breaker is not None and not breaker.allow():
+        structured_log(logger, "error", "scraper_circuit_open", breaker=breaker.name, failures=breaker.failures)
+        return None
     attempts = 0
     while True:
         try:
-            return func()
+            result = func()
         except BaseException as e:  # noqa: BLE001
+            if not isinstance(e, Exception):
+                # Never swallow interpreter signals (KeyboardInterrupt, SystemExit)
+                raise
             attempts += 1
-            structured_log = _load_logging_utils()
+            kind = classify(e)
             if on_error:
                 on_error(attempts, e)
             structured_log(logger, "error", "scraper_retry_error", attempt=attempts, message=str(e))
-            if attempts > max_retries:
-                structured_log(logger, "error", "scraper_exhausted", max_retries=max_retries)
+            if kind == "fatal" or attempts > max_retries:
+                if kind == "fatal":
+                    structured_log(logger, "error", "scraper_fatal_error", status=_status_code(e), message=str(e))
+                else:
+                    structured_log(logger, "error", "scraper_exhausted", max_retries=max_retries)
+                if breaker is not None:
+                    breaker.record_failure()
                 return None
-            # compute backoff with jitter
+            # compute backoff with jitter, raised to the server's Retry-After
             delay = min(backoff_max, backoff_base * (2 ** (attempts - 1)))
             delay += random.uniform(0, jitter_ms / 1000.0)
+            hinted = retry_after_seconds(e)
+            if hinted is not None:
+                delay = max(delay, min(hinted, retry_after_max))
             if on_retry:
                 try:
                     on_retry(attempts, delay, e)
                 except Exception:
                     logger.debug("on_retry callback error", exc_info=True)
             sleep_fn(delay)
-
+        else:
+            if breaker is not None:
+                breaker.record_success()
+            return result
@@ -15,13 +15,16 @@ from __future__ import annotations
 
 import os
 import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeout
 from datetime import datetime
 try:  # Python 3.11+
     from datetime import UTC  # type: ignore
 except Exception:  # Python <3.11
     from datetime import timezone as _tz  # type: ignore
     UTC = _tz.utc  # type: ignore
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Iterator, Tuple
 
 # Ensure repo root on path (mirrors orchestrator behavior)
 _ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
@@ -82,6 +85,32 @@ def _load_scrape_utils():
         return mod.RateLimiter, mod.with_retry
 
 
+def _load_breaker_factory():
+    try:
+        from automation.job_discovery.scripts.scrape_utils import get_breaker  # type: ignore
+        return get_breaker
+    except ModuleNotFoundError:
+        load_module_from_path = _load_import_helpers()
+        mod = load_module_from_path(
+            "automation/job-discovery/scripts/scrape_utils.py",
+            "job_discovery_scrape_utils",
+        )
+        return mod.get_breaker
+
+
+def _load_error_classifier():
+    try:
+        from automation.job_discovery.scripts.scrape_utils import classify_error  # type: ignore
+        return classify_error
+    except ModuleNotFoundError:
+        load_module_from_path = _load_import_helpers()
+        mod = load_module_from_path(
+            "automation/job-discovery/scripts/scrape_utils.py",
+            "job_discovery_scrape_utils",
+        )
+        return mod.classify_error
+
+
 def _load_metrics_cls():
     try:
         from automation.job_discovery.scripts.metrics import Metrics  # type: ignore
@@ -119,11 +148,52 @@ def _load_mapping():
             "job_discovery_mapping",
         )
         return mod.map_linkedin_item, mod.map_indeed_item
+
+
+def _load_job_identity():
+    try:
+        from automation.common import job_identity  # type: ignore
+        return job_identity
+    except ModuleNotFoundError:
+        load_module_from_path = _load_import_helpers()
+        return load_module_from_path("automation/common/job_identity.py", "automation_common_job_identity")
+
+
+def _load_clustering():
+    try:
+        from automation.job_discovery.scripts import clustering  # type: ignore
+        return clustering
+    except ModuleNotFoundError:
+        load_module_from_path = _load_import_helpers()
+        return load_module_from_path("automation/job-discovery/scripts/clustering.py", "job_discovery_clustering")
+
+
+def cluster_jobs(jobs: List[Dict[str, Any]], cfg: Any) -> List[Dict[str, Any]]:
+    """Collapse cross-posted near-duplicates when SOURCES_CLUSTER_ENABLED.
+
+    SOURCES_CLUSTER_THRESHOLD: minimum Jaccard similarity of normalized
+    title features (default 0.7); level and location mismatches never merge.
+    """
+    if not _cfg_bool(cfg, "SOURCES_CLUSTER_ENABLED", False):
+        return jobs
+    _, ensure_float, _ = _load_normalization()
+    clustering = _load_clustering()
+    threshold = ensure_float(cfg.get("SOURCES_CLUSTER_THRESHOLD", clustering.DEFAULT_THRESHOLD), clustering.DEFAULT_THRESHOLD)
+    clustered = clustering.cluster_postings(jobs, threshold=threshold)
+    if len(clustered) != len(jobs):
+        structured_log = _load_logging_utils()
+        structured_log(logger, "info", "postings_clustered", before=len(jobs), after=len(clustered))
+    return clustered
+
+
+def _load_http_client():
+    try:
+        from automation.common import http_client  # type: ignore
+        return http_client
+    except ModuleNotFoundError:
+        load_module_from_path = _load_import_helpers()
+        return load_module_from_path("automation/common/http_client.py", "automation_common_http_client")
 import logging
-try:
-    import requests  # type: ignore
-except Exception:  # pragma: no cover - allow tests to run without requests installed
-    requests = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
@@ -165,12 +235,88 @@ def get_metrics() -> Any:
 
 
 def _http_get_json(url: str, params: Optional[Dict[str, Any]] = None, timeout: int = 10, headers: Optional[Dict[str, str]] = None) -> Any:
-    """HTTP GET returning parsed JSON. Raises on non-200 or parse error."""
-    if requests is None:
-        raise RuntimeError("requests library not available")
-    res = requests.get(url, params=params or {}, timeout=timeout, headers=headers or {})
-    res.raise_for_status()
-    return res.json()
+    """HTTP GET returning parsed JSON. Raises on non-200 or parse error.
+
+    Uses the shared keep-alive session from automation.common.http_client so
+    repeated requests to the same host reuse pooled connections.
+    """
+    http_client = _load_http_client()
+    return http_client.get_json(url, params=params, timeout=timeout, headers=headers)
+
+
+def configure_http(cfg: Any) -> None:
+    """Apply HTTP pool and response cache settings from config.
+
+    Keys: HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_CACHE_ENABLED,
+    HTTP_CACHE_PATH, HTTP_CACHE_TTL_SECONDS, HTTP_CACHE_FRESH_SECONDS,
+    HTTP_CACHE_MAX_BYTES.
+    """
+    ensure_int, ensure_float, ensure_str = _load_normalization()
+    getter = cfg.get_int if hasattr(cfg, "get_int") else cfg.get
+    http_client = _load_http_client()
+    http_client.configure(
+        pool_connections=ensure_int(getter("HTTP_POOL_CONNECTIONS", 10), 10),
+        pool_maxsize=ensure_int(getter("HTTP_POOL_MAXSIZE", 10), 10),
+    )
+    enabled = cfg.get_bool("HTTP_CACHE_ENABLED", False) if hasattr(cfg, "get_bool") else bool(cfg.get("HTTP_CACHE_ENABLED", False))
+    if not enabled:
+        http_client.configure_cache(enabled=False)
+        return
+    path = ensure_str(cfg.get("HTTP_CACHE_PATH", ""), "")
+    if path and not os.path.isabs(path):
+        path = os.path.join(_ROOT, path)
+    http_client.configure_cache(
+        enabled=True,
+        path=path or None,
+        ttl_seconds=ensure_float(cfg.get("HTTP_CACHE_TTL_SECONDS", 604800), 604800.0),
+        fresh_seconds=ensure_float(cfg.get("HTTP_CACHE_FRESH_SECONDS", 0), 0.0),
+        max_bytes=ensure_int(cfg.get("HTTP_CACHE_MAX_BYTES", 52428800), 52428800),
+    )
+
+
+def _cfg_bool(cfg: Any, key: str, default: bool = False) -> bool:
+    value = cfg.get(key, default)
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _source_breaker(source: str, cfg: Any) -> Any:
+    """Circuit breaker for a source when SCRAPER_BREAKER_ENABLED, else None.
+
+    Keys: SCRAPER_BREAKER_THRESHOLD (consecutive give-ups before opening),
+    SCRAPER_BREAKER_COOLDOWN_SECONDS, SCRAPER_BREAKER_PATH (state file, or
+    "memory" to keep state in this process only).
+    """
+    if not _cfg_bool(cfg, "SCRAPER_BREAKER_ENABLED", False):
+        return None
+    ensure_int, ensure_float, ensure_str = _load_normalization()
+    path = ensure_str(cfg.get("SCRAPER_BREAKER_PATH", ""), "").strip()
+    kwargs: Dict[str, Any] = {
+        "failure_threshold": ensure_int(cfg.get("SCRAPER_BREAKER_THRESHOLD", 3), 3),
+        "cooldown_seconds": ensure_float(cfg.get("SCRAPER_BREAKER_COOLDOWN_SECONDS", 3600), 3600.0),
+    }
+    if path.lower() == "memory":
+        kwargs["path"] = None
+    elif path:
+        kwargs["path"] = path if os.path.isabs(path) else os.path.join(_ROOT, path)
+    return _load_breaker_factory()(source, **kwargs)
+
+
+def configure_rate_limits(cfg: Any) -> None:
+    """Select the token bucket store shared by per-host limiters.
+
+    SCRAPER_RATE_LIMIT_STORE: "memory" (default, per process) or "sqlite"
+    (shared across processes via SCRAPER_RATE_LIMIT_PATH, default data/rate_limits.db).
+    """
+    _, _, ensure_str = _load_normalization()
+    kind = ensure_str(cfg.get("SCRAPER_RATE_LIMIT_STORE", "memory"), "memory").strip().lower() or "memory"
+    path = ensure_str(cfg.get("SCRAPER_RATE_LIMIT_PATH", ""), "")
+    if path and not os.path.isabs(path):
+        path = os.path.join(_ROOT, path)
+    rl_cls = RateLimiter if RateLimiter is not None else _load_scrape_utils()[0]
+    if hasattr(rl_cls, "configure_shared_store"):
+        rl_cls.configure_shared_store(kind, path or None)
 
 
 def _normalize_date(date_value: Any, default_today: str) -> str:
@@ -189,230 +335,394 @@ def _normalize_date(date_value: Any, default_today: str) -> str:
     return default_today
 
 
-def fetch_linkedin_jobs() -> List[Dict[str, str]]:
-    """Config-driven LinkedIn scraper.
+# Envelope keys used by public job APIs for the item list and the next-page cursor
+_ENVELOPE_ITEM_KEYS = ("jobs", "results", "data")
+_ENVELOPE_CURSOR_KEYS = ("next_page_token", "nextPageToken", "next_cursor", "nextCursor", "cursor", "next")
+
 
-    If LINKEDIN_API_URL is not set, return a small sample to keep the pipeline operable.
-    Applies rate limiting and retries around the HTTP request.
-    Expects the API to return a JSON list of items with at least title, company, location, url, posted_date.
+def _extract_page(data: Any, label: str) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Split one API response into (items, next_cursor).
+
+    Accepts a bare JSON list or a jobs/results/data envelope. The cursor is the
+    first non-empty value among the common next-page keys, or None.
+    """
+    cursor: Optional[str] = None
+    if isinstance(data, dict):
+        for key in _ENVELOPE_CURSOR_KEYS:
+            value = data.get(key)
+            if isinstance(value, (str, int)) and str(value):
+                cursor = str(value)
+                break
+        for key in _ENVELOPE_ITEM_KEYS:
+            if isinstance(data.get(key), list):
+                data = data.get(key)
+                break
+    if not isinstance(data, list):
+        raise ValueError(f"{label} API returned non-list")
+    return data, cursor
+
+
+def _iter_api_jobs(
+    source: str,
+    label: str,
+    url: str,
+    cfg: Any,
+    map_item: Callable[[Dict[str, Any], str], Dict[str, str]],
+    today: str,
+) -> Iterator[Dict[str, str]]:
+    """Fetch a paginated job API and yield mapped jobs page by page.
+
+    Pagination is selected by `<SOURCE>_PAGINATION`:
+    - "auto" (default): one request, then follow a next-page cursor when the
+      envelope carries one
+    - "cursor": same as auto, cursor sent as `<SOURCE>_CURSOR_PARAM`
+    - "offset": `<SOURCE>_OFFSET_PARAM`/`<SOURCE>_LIMIT_PARAM` windows
+    - "page": 1-based `<SOURCE>_PAGE_PARAM` with `<SOURCE>_LIMIT_PARAM`
+    - "none": single request
+    `<SOURCE>_PAGE_SIZE` and `<SOURCE>_MAX_PAGES` bound the walk. Only one page
+    is held in memory at a time.
     """
-    today = datetime.now(UTC).strftime("%Y-%m-%d")
     ensure_int, ensure_float, ensure_str = _load_normalization()
-    cfg = config if hasattr(config, "get") else _load_config()  # prefer module-level patched config
-    url = ensure_str(cfg.get("LINKEDIN_API_URL", ""))
-    token = ensure_str(cfg.get("LINKEDIN_API_TOKEN", cfg.get("LINKEDIN_API_KEY", "")))
+    prefix = source.upper()
     rpm = ensure_int(cfg.get_int("SCRAPER_RPM", 30), 30)
     timeout = ensure_int(cfg.get_int("SCRAPER_TIMEOUT", 10), 10)
     max_retries = ensure_int(cfg.get_int("SCRAPER_MAX_RETRIES", 3), 3)
     backoff_base = ensure_float(cfg.get_float("SCRAPER_BACKOFF_BASE", 0.5), 0.5)
     backoff_max = ensure_float(cfg.get_float("SCRAPER_BACKOFF_MAX", 4.0), 4.0)
     jitter_ms = ensure_int(cfg.get_int("SCRAPER_JITTER_MS", 100), 100)
-
-    # Safe fallback when no configured endpoint
-    if not url:
-        return [
-            {
-                "title": "Software Engineer",
-                "location": "Remote",
-                "company": "LinkedIn Co",
-                "source": "linkedin",
-                "url": "https://linkedin.com/jobs/example",
-                "posted_date": today,
-            }
-        ]
+    mode = ensure_str(cfg.get(f"{prefix}_PAGINATION", "auto"), "auto").strip().lower() or "auto"
+    page_size = max(1, ensure_int(cfg.get(f"{prefix}_PAGE_SIZE", 100), 100))
+    max_pages = max(1, ensure_int(cfg.get(f"{prefix}_MAX_PAGES", 50), 50))
+    cursor_param = ensure_str(cfg.get(f"{prefix}_CURSOR_PARAM", "cursor"), "cursor")
+    offset_param = ensure_str(cfg.get(f"{prefix}_OFFSET_PARAM", "offset"), "offset")
+    page_param = ensure_str(cfg.get(f"{prefix}_PAGE_PARAM", "page"), "page")
+    limit_param = ensure_str(cfg.get(f"{prefix}_LIMIT_PARAM", "limit"), "limit")
 
     # Prefer module-level proxies (for tests), fallback to loader
     rl_cls = RateLimiter if RateLimiter is not None else _load_scrape_utils()[0]
     retry_fn = with_retry if with_retry is not None else _load_scrape_utils()[1]
     structured_log = _load_logging_utils()
-    map_linkedin_item, _ = _load_mapping()
     _ensure_metrics()
 
-    limiter = rl_cls(rpm=rpm)
+    burst = ensure_int(cfg.get_int("SCRAPER_BURST", rpm), rpm)
 
-    def _fetch() -> List[Dict[str, Any]]:
-        limiter.acquire()
-        # Authorization header handled internally when real HTTP is used
-        data = _http_get_json(ensure_str(url), timeout=timeout)
-        if not isinstance(data, list):
-            raise ValueError("LinkedIn API returned non-list")
-        return data
+    def _on_sleep(wait: float) -> None:
+        _METRICS.rate_limit_sleeps += 1
+
+    # One token bucket per host, shared by every fetcher hitting that host
+    if hasattr(rl_cls, "for_host"):
+        limiter = rl_cls.for_host(url, rpm=rpm, burst=burst, on_sleep=_on_sleep)
+    else:
+        limiter = rl_cls(rpm=rpm)
 
     def _on_error(attempt: int, e: Exception) -> None:
-        structured_log(logger, "error", "scraper_error", source="linkedin", attempt=attempt, message=str(e))
+        structured_log(logger, "error", "scraper_error", source=source, attempt=attempt, message=str(e))
 
     def _on_retry(attempt: int, delay: float, e: Exception) -> None:
         _METRICS.retries_attempted += 1
-        structured_log(logger, "error", "scraper_retry_error", source="linkedin", attempt=attempt, delay=round(delay, 3))
-
-    result = retry_fn(
-        _fetch,
-        max_retries=max_retries,
-        backoff_base=backoff_base,
-        backoff_max=backoff_max,
-        jitter_ms=jitter_ms,
-        on_error=_on_error,
-        on_retry=_on_retry,
-    )
-    if result is None:
-        structured_log(logger, "error", "scraper_give_up", source="linkedin")
-        _METRICS.scraper_failures += 1
-        return []
-
-    _METRICS.inc_jobs("linkedin", len(result))
-    jobs: List[Dict[str, str]] = []
-    for item in result:
-        # Map via helper
-        mapped = map_linkedin_item(item, today)
-        # Track malformed if critical fields missing
-        if not all(mapped.get(k) for k in ("title", "location", "company", "url", "posted_date")):
-            _METRICS.inc_malformed("linkedin", 1)
-            structured_log(logger, "warning", "malformed_entry", source="linkedin")
-        jobs.append(mapped)
-    return jobs
+        structured_log(logger, "error", "scraper_retry_error", source=source, attempt=attempt, delay=round(delay, 3))
+
+    breaker = _source_breaker(source, cfg)
+
+    page_url = url
+    cursor: Optional[str] = None
+    seen_cursors = set()
+    for page_index in range(max_pages):
+        if mode == "offset":
+            params: Optional[Dict[str, Any]] = {offset_param: page_index * page_size, limit_param: page_size}
+        elif mode == "page":
+            params = {page_param: page_index + 1, limit_param: page_size}
+        elif cursor is not None and page_url == url:
+            params = {cursor_param: cursor}
+        else:
+            params = None
+
+        def _fetch(page_url: str = page_url, params: Optional[Dict[str, Any]] = params) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+            limiter.acquire()
+            # First page keeps the historical call shape; later pages add params
+            if params:
+                data = _http_get_json(ensure_str(page_url), params=params, timeout=timeout)
+            else:
+                data = _http_get_json(ensure_str(page_url), timeout=timeout)
+            return _extract_page(data, label)
+
+        result = retry_fn(
+            _fetch,
+            max_retries=max_retries,
+            backoff_base=backoff_base,
+            backoff_max=backoff_max,
+            jitter_ms=jitter_ms,
+            on_error=_on_error,
+            on_retry=_on_retry,
+            breaker=breaker,
+        )
+        if result is None:
+            structured_log(logger, "error", "scraper_give_up", source=source, page=page_index + 1)
+            _METRICS.scraper_failures += 1
+            return
+
+        items, next_cursor = result
+        _METRICS.inc_jobs(source, len(items))
+        for item in items:
+            mapped = map_item(item, today)
+            # Track malformed if critical fields missing
+            if not all(mapped.get(k) for k in ("title", "location", "company", "url", "posted_date")):
+                _METRICS.inc_malformed(source, 1)
+                structured_log(logger, "warning", "malformed_entry", source=source)
+            yield mapped
+
+        if mode == "none":
+            return
+        if mode in ("offset", "page"):
+            if len(items) < page_size:
+                return
+            continue
+        # auto / cursor: follow the envelope cursor until exhausted or repeated
+        if not next_cursor or next_cursor in seen_cursors:
+            return
+        seen_cursors.add(next_cursor)
+        if next_cursor.startswith(("http://", "https://")):
+            page_url, cursor = next_cursor, None
+        else:
+            page_url, cursor = url, next_cursor
+
+
+def iter_linkedin_jobs() -> Iterator[Dict[str, str]]:
+    """Config-driven LinkedIn scraper yielding mapped jobs page by page.
+
+    If LINKEDIN_API_URL is not set, yield a small sample to keep the pipeline operable.
+    Applies rate limiting and retries around each page request.
+    Expects a JSON list (or jobs/results/data envelope) of items with at least
+    title, company, location, url, posted_date.
+    """
+    today = datetime.now(UTC).strftime("%Y-%m-%d")
+    _, _, ensure_str = _load_normalization()
+    cfg = config if hasattr(config, "get") else _load_config()  # prefer module-level patched config
+    url = ensure_str(cfg.get("LINKEDIN_API_URL", ""))
+
+    # Safe fallback when no configured endpoint
+    if not url:
+        yield {
+            "title": "Software Engineer",
+            "location": "Remote",
+            "company": "LinkedIn Co",
+            "source": "linkedin",
+            "url": "https://linkedin.com/jobs/example",
+            "posted_date": today,
+        }
+        return
+
+    map_linkedin_item, _ = _load_mapping()
+    yield from _iter_api_jobs("linkedin", "LinkedIn", url, cfg, map_linkedin_item, today)
 
 
-def fetch_indeed_jobs() -> List[Dict[str, str]]:
-    """Config-driven Indeed scraper.
+def fetch_linkedin_jobs() -> List[Dict[str, str]]:
+    """Config-driven LinkedIn scraper; materialized form of iter_linkedin_jobs."""
+    return list(iter_linkedin_jobs())
+
 
-    If INDEED_API_URL is not set, return a small sample to keep the pipeline operable.
-    Applies rate limiting and retries around the HTTP request.
-    Expects the API to return a JSON list of items with at least title, company, location, url, posted_date.
+def iter_indeed_jobs() -> Iterator[Dict[str, str]]:
+    """Config-driven Indeed scraper yielding mapped jobs page by page.
+
+    If INDEED_API_URL is not set, yield a small sample to keep the pipeline operable.
+    Applies rate limiting and retries around each page request.
+    Expects a JSON list (or jobs/results/data envelope) of items with at least
+    title, company, location, url, posted_date.
     """
     today = datetime.now(UTC).strftime("%Y-%m-%d")
-    ensure_int, ensure_float, ensure_str = _load_normalization()
+    _, _, ensure_str = _load_normalization()
     cfg = config if hasattr(config, "get") else _load_config()
     url = ensure_str(cfg.get("INDEED_API_URL", ""))
-    token = ensure_str(cfg.get("INDEED_API_TOKEN", cfg.get("INDEED_PUBLISHER_KEY", "")))
-    rpm = ensure_int(cfg.get_int("SCRAPER_RPM", 30), 30)
-    timeout = ensure_int(cfg.get_int("SCRAPER_TIMEOUT", 10), 10)
-    max_retries = ensure_int(cfg.get_int("SCRAPER_MAX_RETRIES", 3), 3)
-    backoff_base = ensure_float(cfg.get_float("SCRAPER_BACKOFF_BASE", 0.5), 0.5)
-    backoff_max = ensure_float(cfg.get_float("SCRAPER_BACKOFF_MAX", 4.0), 4.0)
-    jitter_ms = ensure_int(cfg.get_int("SCRAPER_JITTER_MS", 100), 100)
 
     if not url:
-        return [
-            {
-                "title": "Data Analyst",
-                "location": "New York, NY",
-                "company": "Indeed LLC",
-                "source": "indeed",
-                "url": "https://indeed.com/viewjob/example",
-                "posted_date": today,
-            }
-        ]
+        yield {
+            "title": "Data Analyst",
+            "location": "New York, NY",
+            "company": "Indeed LLC",
+            "source": "indeed",
+            "url": "https://indeed.com/viewjob/example",
+            "posted_date": today,
+        }
+        return
 
-    rl_cls = RateLimiter if RateLimiter is not None else _load_scrape_utils()[0]
-    retry_fn = with_retry if with_retry is not None else _load_scrape_utils()[1]
-    structured_log = _load_logging_utils()
     _, map_indeed_item = _load_mapping()
-    _ensure_metrics()
+    yield from _iter_api_jobs("indeed", "Indeed", url, cfg, map_indeed_item, today)
 
-    limiter = rl_cls(rpm=rpm)
 
-    def _fetch() -> List[Dict[str, Any]]:
-        limiter.acquire()
-        data = _http_get_json(ensure_str(url), timeout=timeout)
+def fetch_indeed_jobs() -> List[Dict[str, str]]:
+    """Config-driven Indeed scraper; materialized form of iter_indeed_jobs."""
+    return list(iter_indeed_jobs())
 
-        # Normalize common envelope payloads used by public job APIs.
-        if isinstance(data, dict):
-            if isinstance(data.get("jobs"), list):
-                data = data.get("jobs")
-            elif isinstance(data.get("results"), list):
-                data = data.get("results")
-            elif isinstance(data.get("data"), list):
-                data = data.get("data")
+# ------------------
+# Phase 3D Orchestrator
+# ------------------
+# Adapter registry mapping enable keys to adapter names
+_SOURCE_REGISTRY: List[Dict[str, str]] = [
+    {"enable_key": "LEVER_ENABLED", "adapter": "lever", "func": "fetch_lever_jobs"},
+    {"enable_key": "GREENHOUSE_ENABLED", "adapter": "greenhouse", "func": "fetch_greenhouse_jobs"},
+    {"enable_key": "ASHBY_ENABLED", "adapter": "ashby", "func": "fetch_ashby_jobs"},
+    {"enable_key": "INDEED_ENABLED", "adapter": "indeed", "func": "fetch_indeed_jobs"},
+    {"enable_key": "ZIPRECRUITER_ENABLED", "adapter": "ziprecruiter", "func": "fetch_ziprecruiter_jobs"},
+    {"enable_key": "GOOGLEJOBS_ENABLED", "adapter": "google_jobs", "func": "fetch_google_jobs"},
+    {"enable_key": "GLASSDOOR_ENABLED", "adapter": "glassdoor", "func": "fetch_glassdoor_jobs"},
+    {"enable_key": "CRAIGSLIST_ENABLED", "adapter": "craigslist", "func": "fetch_craigslist_jobs"},
+    {"enable_key": "GOREMOTE_ENABLED", "adapter": "goremote", "func": "fetch_goremote_jobs"},
+]
+
+
+def _load_adapter_fetch(entry: Dict[str, str]) -> Callable[[Dict[str, Any]], Any]:
+    """Resolve the fetch function for a registry entry (dotted import, then path)."""
+    adapter = entry["adapter"]
+    dotted = f"automation.job_discovery.scripts.source_{adapter}_adapter"
+    try:
+        module = importlib.import_module(dotted)  # type: ignore
+    except ModuleNotFoundError:
+        load_module_from_path = _load_import_helpers()
+        path = f"automation/job-discovery/scripts/source_{adapter}_adapter.py"
+        module = load_module_from_path(path, f"job_discovery_source_{adapter}_adapter")
+    return getattr(module, entry["func"])  # type: ignore
 
-        if not isinstance(data, list):
-            raise ValueError("Indeed API returned non-list")
-        return data
 
-    def _on_error(attempt: int, e: Exception) -> None:
-        structured_log(logger, "error", "scraper_error", source="indeed", attempt=attempt, message=str(e))
+def _adapter_deadline(cfg: Dict[str, Any], entry: Dict[str, str]) -> float:
+    """Per-adapter deadline in seconds.
+
+    `<SOURCE>_DEADLINE_SECONDS` (e.g. LEVER_DEADLINE_SECONDS) overrides the
+    global SOURCES_DEADLINE_SECONDS. Values <= 0 disable the deadline.
+    """
+    _, ensure_float, _ = _load_normalization()
+    prefix = entry["enable_key"][: -len("_ENABLED")]
+    default = ensure_float(cfg.get("SOURCES_DEADLINE_SECONDS", 30.0), 30.0)
+    return ensure_float(cfg.get(f"{prefix}_DEADLINE_SECONDS", default), default)
+
+
+def _adapter_failed(adapter: str, exc: Exception) -> List[Dict[str, Any]]:
+    """Shared error contract for both fetch paths.
+
+    Fatal errors (configuration, missing libraries, programming errors; see
+    scrape_utils.classify_error) propagate; anything else is logged and the
+    adapter contributes no jobs.
+    """
+    if _load_error_classifier()(exc) == "fatal":
+        raise exc
+    _load_logging_utils()(logger, "error", "source_fetch_failed", source=adapter, message=str(exc))
+    return []
+
+
+def _fetch_sequential(cfg: Dict[str, Any], enabled: List[Dict[str, str]]) -> List[List[Dict[str, Any]]]:
+    outputs: List[List[Dict[str, Any]]] = []
+    for entry in enabled:
+        fetch_fn = _load_adapter_fetch(entry)
+        try:
+            out = fetch_fn(cfg)
+        except Exception as e:
+            out = _adapter_failed(entry["adapter"], e)
+        outputs.append(out if isinstance(out, list) else [])
+    return outputs
+
+
+# Adapters abandoned at their deadline, by name. Python threads cannot be
+# interrupted, so a late adapter keeps its worker (and any connection or
+# rate-limit token it holds) until its own HTTP timeouts end it; while it is
+# still running the adapter is skipped instead of being started again, which
+# bounds abandoned workers to one per adapter.
+_ABANDONED: Dict[str, Future] = {}
+_ABANDONED_LOCK = threading.Lock()
+
+
+def _fetch_concurrent(cfg: Dict[str, Any], enabled: List[Dict[str, str]]) -> List[List[Dict[str, Any]]]:
+    """Fan out enabled adapters across a thread pool.
+
+    Each adapter gets its own deadline measured from fan-out start. Errors
+    follow the sequential contract (_adapter_failed); adapters that miss their
+    deadline contribute no jobs and are left to finish in the background (see
+    _ABANDONED). Queued work is cancelled and the pool is not joined on late
+    adapters. Outputs are returned in registry order so downstream
+    de-duplication is unchanged.
+    """
+    ensure_int, _, _ = _load_normalization()
+    structured_log = _load_logging_utils()
+    # Resolve adapters up front so imports never race inside workers
+    fetch_fns = [_load_adapter_fetch(entry) for entry in enabled]
+    max_workers = ensure_int(cfg.get("SOURCES_MAX_WORKERS", 0), 0)
+    if max_workers <= 0:
+        max_workers = len(enabled)
+
+    with _ABANDONED_LOCK:
+        for name in [n for n, f in _ABANDONED.items() if f.done()]:
+            del _ABANDONED[name]
+        busy = set(_ABANDONED)
+
+    outputs: List[List[Dict[str, Any]]] = []
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="source-fetch")
+    try:
+        started = time.monotonic()
+        futures = [None if entry["adapter"] in busy else executor.submit(fn, cfg) for entry, fn in zip(enabled, fetch_fns)]
+        for entry, fut in zip(enabled, futures):
+            adapter = entry["adapter"]
+            if fut is None:
+                structured_log(logger, "error", "source_still_running", source=adapter)
+                outputs.append([])
+                continue
+            deadline = _adapter_deadline(cfg, entry)
+            remaining = None if deadline <= 0 else max(0.0, started + deadline - time.monotonic())
+            try:
+                out = fut.result(timeout=remaining)
+            except FuturesTimeout:
+                if not fut.cancel():
+                    with _ABANDONED_LOCK:
+                        _ABANDONED[adapter] = fut
+                structured_log(logger, "error", "source_deadline_exceeded", source=adapter, deadline_seconds=deadline)
+                out = []
+            except Exception as e:
+                out = _adapter_failed(adapter, e)
+            outputs.append(out if isinstance(out, list) else [])
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return outputs
 
-    def _on_retry(attempt: int, delay: float, e: Exception) -> None:
-        _METRICS.retries_attempted += 1
-        structured_log(logger, "error", "scraper_retry_error", source="indeed", attempt=attempt, delay=round(delay, 3))
-
-    result = retry_fn(
-        _fetch,
-        max_retries=max_retries,
-        backoff_base=backoff_base,
-        backoff_max=backoff_max,
-        jitter_ms=jitter_ms,
-        on_error=_on_error,
-        on_retry=_on_retry,
-    )
-    if result is None:
-        structured_log(logger, "error", "scraper_give_up", source="indeed")
-        _METRICS.scraper_failures += 1
-        return []
-
-    _METRICS.inc_jobs("indeed", len(result))
-    jobs: List[Dict[str, str]] = []
-    for item in result:
-        mapped = map_indeed_item(item, today)
-        if not all(mapped.get(k) for k in ("title", "location", "company", "url", "posted_date")):
-            _METRICS.inc_malformed("indeed", 1)
-            structured_log(logger, "warning", "malformed_entry", source="indeed")
-        jobs.append(mapped)
-    return jobs
 
-# ------------------
-# Phase 3D Orchestrator
-# ------------------
 def fetch_all_sources(cfg: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Fetch jobs from all enabled source adapters and return a single canonical list.
 
     - Config-gated activation per source
-    - De-duplication by job_id across sources
+    - Optional concurrent fan-out (SOURCES_CONCURRENT) with per-adapter deadlines
+    - De-duplication by job_id and canonical URL identity across sources
+    - Optional near-duplicate clustering across boards (SOURCES_CLUSTER_ENABLED)
     - Deterministic ordering by job_id
     """
-    # Adapter registry mapping enable keys to adapter names
-    registry: List[Dict[str, str]] = [
-        {"enable_key": "LEVER_ENABLED", "adapter": "lever", "func": "fetch_lever_jobs"},
-        {"enable_key": "GREENHOUSE_ENABLED", "adapter": "greenhouse", "func": "fetch_greenhouse_jobs"},
-        {"enable_key": "ASHBY_ENABLED", "adapter": "ashby", "func": "fetch_ashby_jobs"},
-        {"enable_key": "INDEED_ENABLED", "adapter": "indeed", "func": "fetch_indeed_jobs"},
-        {"enable_key": "ZIPRECRUITER_ENABLED", "adapter": "ziprecruiter", "func": "fetch_ziprecruiter_jobs"},
-        {"enable_key": "GOOGLEJOBS_ENABLED", "adapter": "google_jobs", "func": "fetch_google_jobs"},
-        {"enable_key": "GLASSDOOR_ENABLED", "adapter": "glassdoor", "func": "fetch_glassdoor_jobs"},
-        {"enable_key": "CRAIGSLIST_ENABLED", "adapter": "craigslist", "func": "fetch_craigslist_jobs"},
-        {"enable_key": "GOREMOTE_ENABLED", "adapter": "goremote", "func": "fetch_goremote_jobs"},
-    ]
-
-    load_module_from_path = _load_import_helpers()
-    all_jobs: List[Dict[str, Any]] = []
-    for entry in registry:
-        key = entry["enable_key"]
-        if not bool(cfg.get(key, False)):
-            continue
-        adapter = entry["adapter"]
-        dotted = f"automation.job_discovery.scripts.source_{adapter}_adapter"
-        try:
-            module = importlib.import_module(dotted)  # type: ignore
-        except ModuleNotFoundError:
-            path = f"automation/job-discovery/scripts/source_{adapter}_adapter.py"
-            module = load_module_from_path(path, f"job_discovery_source_{adapter}_adapter")
+    enabled = [entry for entry in _SOURCE_REGISTRY if bool(cfg.get(entry["enable_key"], False))]
 
-        fetch_fn = getattr(module, entry["func"])  # type: ignore
-        out = fetch_fn(cfg)
-        if isinstance(out, list):
-            all_jobs.extend(out)
+    if bool(cfg.get("SOURCES_CONCURRENT", False)) and len(enabled) > 1:
+        outputs = _fetch_concurrent(cfg, enabled)
+    else:
+        outputs = _fetch_sequential(cfg, enabled)
 
-    # De-duplicate by job_id
+    all_jobs: List[Dict[str, Any]] = []
+    for out in outputs:
+        all_jobs.extend(out)
+
+    # De-duplicate by job_id, then by canonical (normalized URL) identity so the
+    # same posting reported by two adapters under different ids is kept once
+    canonical_id = _load_job_identity().canonical_id
     dedup: Dict[str, Dict[str, Any]] = {}
+    seen_canonical = set()
     for job in all_jobs:
         jid = str(job.get("job_id", ""))
         if not jid:
             # Skip entries missing canonical id
             continue
-        if jid not in dedup:
-            dedup[jid] = job
+        if jid in dedup:
+            continue
+        cid = canonical_id(job)
+        if cid in seen_canonical:
+            continue
+        seen_canonical.add(cid)
+        dedup[jid] = job
 
     result = list(dedup.values())
     result.sort(key=lambda x: str(x.get("job_id", "")))
+    # Cross-board near-duplicates -> one representative with alternate_sources
+    result = cluster_jobs(result, cfg)
 
     # Apply enrichment transforms deterministically when enabled
     enrichment_enabled = bool(cfg.get("ENRICHMENT_ENABLED", True))
@@ -0,0 +1,253 @@
+"""
+Artifact encodings for the JSON store.
+
+- "jsonl": plain JSON Lines (default)
+- "gzip": gzip-compressed JSON Lines, streamed on write and read
+- "zstd": zstandard-compressed JSON Lines (needs `zstandard`, else gzip)
+- "columnar": Parquet via `pyarrow` when installed (mixed-type and nested-object
+  columns fall back to JSON text); otherwise a pure-Python
+  column file (one compressed block per field behind a JSON header), so a
+  projected read only decompresses the requested columns
+
+Readers take an optional `fields` projection; rows only carry the fields they
+actually had. Optional dependencies are imported lazily.
+"""
+
+import gzip
+import io
+import json
+import zlib
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+FORMATS = ("jsonl", "gzip", "zstd", "columnar")
+DEFAULT_FORMAT = "jsonl"
+EXTENSIONS = {
+    "jsonl": ".jsonl",
+    "gzip": ".jsonl.gz",
+    "zstd": ".jsonl.zst",
+    "parquet": ".parquet",
+    "cols": ".cols",
+}
+_ALIASES = {"gz": "gzip", "zst": "zstd", "parquet": "columnar", "cols": "columnar"}
+COLS_MAGIC = "strata-cols/1"
+PARQUET_META_KEY = "strata-rows/1"
+_BATCH = 512
+_dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def _zstd() -> Optional[Any]:
+    try:
+        import zstandard  # type: ignore
+
+        return zstandard
+    except Exception:
+        return None
+
+
+def _parquet() -> Optional[Any]:
+    try:
+        import pyarrow  # type: ignore
+        import pyarrow.parquet  # type: ignore
+
+        return pyarrow
+    except Exception:
+        return None
+
+
+def resolve_format(fmt: Optional[str]) -> str:
+    """Concrete encoding for a requested format, degrading when a dependency is missing.
+
+    Returns one of the EXTENSIONS keys.
+    """
+    fmt = str(fmt or DEFAULT_FORMAT).strip().lower()
+    fmt = _ALIASES.get(fmt, fmt)
+    if fmt == "zstd" and _zstd() is None:
+        fmt = "gzip"
+    if fmt == "columnar":
+        return "parquet" if _parquet() is not None else "cols"
+    return fmt if fmt in EXTENSIONS else DEFAULT_FORMAT
+
+
+def format_for_path(path: str) -> str:
+    for fmt, ext in sorted(EXTENSIONS.items(), key=lambda kv: -len(kv[1])):
+        if path.endswith(ext):
+            return fmt
+    return DEFAULT_FORMAT
+
+
+def _write_lines(f: IO[str], items: Iterable[Dict[str, Any]]) -> int:
+    count = 0
+    batch: List[str] = []
+    for it in items:
+        batch.append(_dumps(it))
+        count += 1
+        if len(batch) >= _BATCH:
+            f.write("\n".join(batch) + "\n")
+            batch = []
+    if batch:
+        f.write("\n".join(batch) + "\n")
+    return count
+
+
+def _project(row: Dict[str, Any], fields: Optional[Sequence[str]]) -> Dict[str, Any]:
+    if fields is None:
+        return row
+    return {k: row[k] for k in fields if k in row}
+
+
+def _read_lines(f: IO[str], fields: Optional[Sequence[str]]) -> Iterator[Dict[str, Any]]:
+    for line in f:
+        if line.strip():
+            yield _project(json.loads(line), fields)
+
+
+def _collect_columns(items: Iterable[Dict[str, Any]]) -> Tuple[List[str], Dict[str, List[Any]], Dict[str, List[int]], int]:
+    """Pivot rows into columns; `missing[k]` lists the rows that lacked key k."""
+    names: List[str] = []
+    values: Dict[str, List[Any]] = {}
+    missing: Dict[str, List[int]] = {}
+    count = 0
+    for i, it in enumerate(items):
+        for k in it:
+            if k not in values:
+                names.append(k)
+                values[k] = [None] * i
+                missing[k] = list(range(i))
+        for k in names:
+            if k in it:
+                values[k].append(it[k])
+            else:
+                values[k].append(None)
+                missing[k].append(i)
+        count = i + 1
+    return names, values, missing, count
+
+
+def _write_cols(path: str, items: Iterable[Dict[str, Any]]) -> int:
+    names, values, missing, count = _collect_columns(items)
+    blocks: List[bytes] = []
+    columns: List[Tuple[str, int, int]] = []
+    offset = 0
+    for k in names:
+        block = zlib.compress(_dumps({"v": values[k], "m": missing[k]}).encode("utf-8"), 6)
+        columns.append((k, offset, len(block)))
+        blocks.append(block)
+        offset += len(block)
+    header = _dumps({"format": COLS_MAGIC, "count": count, "columns": columns}).encode("utf-8") + b"\n"
+    with open(path, "wb") as f:
+        f.write(header)
+        for block in blocks:
+            f.write(block)
+    return count
+
+
+def _read_cols(path: str, fields: Optional[Sequence[str]]) -> Iterator[Dict[str, Any]]:
+    with open(path, "rb") as f:
+        header = json.loads(f.readline())
+        if header.get("format") != COLS_MAGIC:
+            raise ValueError(f"Not a column file: {path}")
+        start = f.tell()
+        wanted = set(fields) if fields is not None else None
+        cols: List[Tuple[str, List[Any], set]] = []
+        for name, offset, length in header["columns"]:
+            if wanted is not None and name not in wanted:
+                continue
+            f.seek(start + offset)
+            block = json.loads(zlib.decompress(f.read(length)))
+            cols.append((name, block["v"], set(block["m"])))
+    if fields is not None:
+        order = {k: i for i, k in enumerate(fields)}
+        cols.sort(key=lambda c: order[c[0]])
+    for i in range(int(header.get("count", 0))):
+        yield {name: vals[i] for name, vals, absent in cols if i not in absent}
+
+
+def _has_mapping(value: Any) -> bool:
+    return isinstance(value, dict) or (isinstance(value, list) and any(isinstance(v, dict) for v in value))
+
+
+def _write_parquet(path: str, items: Iterable[Dict[str, Any]]) -> int:
+    """Parquet with a per-column type; mixed-type or nested-object columns are stored as JSON text.
+
+    Which rows lacked a key and which columns hold JSON are kept in the schema
+    metadata, so explicit nulls survive the round trip.
+    """
+    pa = _parquet()
+    names, values, missing, count = _collect_columns(items)
+    arrays = []
+    json_columns: List[str] = []
+    for k in names:
+        column = values[k]
+        array = None
+        if not any(_has_mapping(v) for v in column):
+            try:
+                array = pa.array(column)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+                array = None
+        if array is None:
+            array = pa.array([None if v is None else _dumps(v) for v in column], type=pa.string())
+            json_columns.append(k)
+        arrays.append(array)
+    meta = {"json": json_columns, "missing": {k: m for k, m in missing.items() if m}}
+    table = pa.Table.from_arrays(arrays, names=names).replace_schema_metadata({PARQUET_META_KEY: _dumps(meta)})
+    pa.parquet.write_table(table, path, compression="zstd")
+    return count
+
+
+def _read_parquet(path: str, fields: Optional[Sequence[str]]) -> Iterator[Dict[str, Any]]:
+    pa = _parquet()
+    if pa is None:
+        raise RuntimeError("pyarrow is required to read .parquet artifacts")
+    schema = pa.parquet.read_schema(path)
+    raw = (schema.metadata or {}).get(PARQUET_META_KEY.encode("utf-8"))
+    meta = json.loads(raw) if raw else {}
+    json_columns = set(meta.get("json") or ())
+    missing = {k: set(m) for k, m in (meta.get("missing") or {}).items()}
+    columns = None if fields is None else [k for k in fields if k in schema.names]
+    for i, row in enumerate(pa.parquet.read_table(path, columns=columns).to_pylist()):
+        yield {
+            k: json.loads(v) if k in json_columns and v is not None else v
+            for k, v in row.items()
+            if i not in missing.get(k, ())
+        }
+
+
+def write_items(path: str, items: Iterable[Dict[str, Any]], fmt: str) -> int:
+    """Write items to `path` in a concrete format (see resolve_format); returns the row count."""
+    if fmt == "gzip":
+        with gzip.open(path, "wt", encoding="utf-8", compresslevel=6) as f:
+            return _write_lines(f, items)
+    if fmt == "zstd":
+        zstandard = _zstd()
+        with open(path, "wb") as raw:
+            with zstandard.ZstdCompressor(level=3).stream_writer(raw) as zf:
+                with io.TextIOWrapper(zf, encoding="utf-8") as f:
+                    return _write_lines(f, items)
+    if fmt == "parquet":
+        return _write_parquet(path, items)
+    if fmt == "cols":
+        return _write_cols(path, items)
+    with open(path, "w", encoding="utf-8") as f:
+        return _write_lines(f, items)
+
+
+def read_items(path: str, fields: Optional[Sequence[str]] = None) -> Iterator[Dict[str, Any]]:
+    """Stream rows from an artifact, optionally keeping only `fields`."""
+    fmt = format_for_path(path)
+    if fmt == "gzip":
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            yield from _read_lines(f, fields)
+    elif fmt == "zstd":
+        zstandard = _zstd()
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read .jsonl.zst artifacts")
+        with open(path, "rb") as raw:
+            with io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(raw), encoding="utf-8") as f:
+                yield from _read_lines(f, fields)
+    elif fmt == "parquet":
+        yield from _read_parquet(path, fields)
+    elif fmt == "cols":
+        yield from _read_cols(path, fields)
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            yield from _read_lines(f, fields)
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+"""
+Shared SQLite connection manager for the storage layer and the web backend.
+
+One manager per database path (and pragma set) hands out per-thread connections:
+- connection(): read/write, pragmas applied once when the connection opens
+- read_connection(): read-only (`mode=ro`, `query_only`) for API queries
+
+Connections are reused for the life of the thread, so sqlite3's per-connection
+statement cache (`cached_statements`) keeps prepared statements warm, and are
+closed when the thread exits (short-lived server worker threads would otherwise
+leave one open connection each). Pooled
+connections ignore close(): it rolls back any open transaction and leaves the
+connection in the pool, so existing `try/finally: conn.close()` call sites
+keep working. close_all() really closes them (tests, shutdown).
+"""
+
+import os
+import sqlite3
+import threading
+import weakref
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+DEFAULT_PRAGMAS = (
+    "PRAGMA foreign_keys = ON;",
+    "PRAGMA journal_mode = WAL;",
+    "PRAGMA synchronous = NORMAL;",
+    "PRAGMA cache_size = -65536;",
+    "PRAGMA temp_store = MEMORY;",
+)
+
+
+class PooledConnection(sqlite3.Connection):
+    """sqlite3 connection whose close() returns it to the pool."""
+
+    def close(self) -> None:  # type: ignore[override]
+        if self.in_transaction:
+            self.rollback()
+        self.row_factory = None
+
+    def really_close(self) -> None:
+        super().close()
+
+
+class _Slot:
+    """Per-thread holder; when its thread exits the slot is freed and the connection closed."""
+
+    __slots__ = ("pid", "conn", "__weakref__")
+
+    def __init__(self, conn: PooledConnection):
+        self.pid = os.getpid()
+        self.conn = conn
+
+
+def _release(pid: int, conn: PooledConnection) -> None:
+    # A forked child leaves the parent's connection alone
+    if os.getpid() == pid:
+        try:
+            conn.really_close()
+        except Exception:
+            pass
+
+
+class ConnectionManager:
+    """Per-thread pooled connections to one SQLite database file."""
+
+    def __init__(
+        self,
+        path: str,
+        pragmas: Sequence[str] = DEFAULT_PRAGMAS,
+        timeout: float = 30.0,
+        cached_statements: int = 256,
+    ):
+        self.path = path
+        self.pragmas = tuple(pragmas)
+        self.timeout = float(timeout)
+        self.cached_statements = int(cached_statements)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # Weak, so connections released with their thread drop out on their own
+        self._all: weakref.WeakSet[PooledConnection] = weakref.WeakSet()
+
+    def _open(self, readonly: bool) -> PooledConnection:
+        if readonly:
+            target, uri = f"file:{self.path}?mode=ro", True
+        else:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            target, uri = self.path, False
+        conn = sqlite3.connect(
+            target,
+            timeout=self.timeout,
+            uri=uri,
+            check_same_thread=False,
+            cached_statements=self.cached_statements,
+            factory=PooledConnection,
+        )
+        for pragma in self.pragmas:
+            if readonly and "journal_mode" in pragma:
+                continue  # read-only connections cannot switch journal mode
+            conn.execute(pragma)
+        if readonly:
+            conn.execute("PRAGMA query_only = ON;")
+        with self._lock:
+            self._all.add(conn)
+        return conn
+
+    def _get(self, attr: str, readonly: bool, row_factory: Optional[Any]) -> PooledConnection:
+        slot = getattr(self._local, attr, None)
+        # Forked workers must not reuse the parent's connection
+        if slot is None or slot.pid != os.getpid():
+            slot = _Slot(self._open(readonly))
+            weakref.finalize(slot, _release, slot.pid, slot.conn)
+            setattr(self._local, attr, slot)
+        conn = slot.conn
+        conn.row_factory = row_factory
+        return conn
+
+    def connection(self, row_factory: Optional[Any] = None) -> PooledConnection:
+        """Read/write connection for the calling thread."""
+        return self._get("rw", False, row_factory)
+
+    def read_connection(self, row_factory: Optional[Any] = None) -> PooledConnection:
+        """Read-only connection for the calling thread (database must exist)."""
+        return self._get("ro", True, row_factory)
+
+    def close_all(self) -> None:
+        with self._lock:
+            conns, self._all = list(self._all), weakref.WeakSet()
+        for conn in conns:
+            try:
+                conn.really_close()
+            except Exception:
+                pass
+        self._local = threading.local()
+
+
+_MANAGERS: Dict[Tuple[str, Tuple[str, ...]], ConnectionManager] = {}
+_MANAGERS_LOCK = threading.Lock()
+
+
+def get_manager(path: str, pragmas: Sequence[str] = DEFAULT_PRAGMAS) -> ConnectionManager:
+    """Return the process-wide manager for a database path and pragma set."""
+    abspath = os.path.abspath(path)
+    key = (abspath, tuple(pragmas))
+    with _MANAGERS_LOCK:
+        mgr = _MANAGERS.get(key)
+        if mgr is None:
+            mgr = ConnectionManager(abspath, pragmas)
+            _MANAGERS[key] = mgr
+        return mgr
+
+
+def close_all() -> None:
+    """Close every pooled connection in this process."""
+    with _MANAGERS_LOCK:
+        managers = list(_MANAGERS.values())
+        _MANAGERS.clear()
+    for mgr in managers:
+        mgr.close_all()
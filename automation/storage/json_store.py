@@ -3,14 +3,30 @@ from __future__ import annotations
 """
 JSON storage backend for Phase 3B.
 
-Writes run-scoped artifacts under deterministic filenames and maintains an index
-for discoverability. Retention logic removes older runs deterministically.
+Writes run-scoped artifacts under deterministic filenames and records them in an
+append-only manifest (`manifest.jsonl`) for discoverability. Retention logic
+removes older runs deterministically.
+
+Manifest records, one JSON object per line:
+- {"op": "run", "run_ts", "name": "summary.json", "bytes", "at"}
+- {"op": "artifact", "run_ts", "name", "bytes", "count", "at"}
+- {"op": "delete", "run_ts", "at"}
+Appends are single fsync'd writes, so a crash can at worst leave a partial last
+line, which readers skip. Readers fold records incrementally from the last
+offset they consumed; compact_manifest() rewrites the live state atomically.
 """
 
 import os
 import json
 import shutil
-from typing import Any, Dict, List
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from automation.storage import artifact_formats
+
+MANIFEST_NAME = "manifest.jsonl"
+_LEGACY_INDEX = "index.json"
 
 # Resolve repo root to locate default data directory and config
 _ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -32,6 +48,166 @@ def _base_dir() -> str:
     return str(cfg.get("json_dir", default_dir))
 
 
+def _artifact_format(kind: str) -> str:
+    """Configured encoding for an artifact kind (`storage.artifact_formats.<kind>`,
+    else `storage.artifact_format`)."""
+    cfg: Dict[str, Any] = {}
+    if config and hasattr(config, "get"):
+        try:
+            cfg = config.to_dict().get("storage", {}) or {}
+        except Exception:
+            cfg = {}
+    per_kind = cfg.get("artifact_formats") or {}
+    return str(per_kind.get(kind) or cfg.get("artifact_format") or artifact_formats.DEFAULT_FORMAT)
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S+00:00")
+
+
+def _manifest_path(base: str) -> str:
+    return os.path.join(base, MANIFEST_NAME)
+
+
+def _encode_record(record: Dict[str, Any]) -> bytes:
+    return (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _append_manifest(base: str, record: Dict[str, Any]) -> None:
+    """Append one record with a single write + fsync."""
+    os.makedirs(base, exist_ok=True)
+    path = _manifest_path(base)
+    line = _encode_record(record)
+    fd = os.open(path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        size = os.fstat(fd).st_size
+        # Terminate a partial line left by an interrupted writer
+        if size and os.pread(fd, 1, size - 1) != b"\n":
+            line = b"\n" + line
+        os.write(fd, line)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _artifact_kind(name: str) -> str:
+    return name.split(".", 1)[0]
+
+
+def _apply(runs: Dict[str, Dict[str, Any]], record: Dict[str, Any]) -> None:
+    op = record.get("op")
+    run_ts = str(record.get("run_ts", ""))
+    if not run_ts:
+        return
+    if op == "delete":
+        runs.pop(run_ts, None)
+        return
+    if op not in ("run", "artifact"):
+        return
+    entry = runs.setdefault(run_ts, {"run_ts": run_ts, "written_at": record.get("at"), "artifacts": {}})
+    name = str(record.get("name", ""))
+    if op == "artifact":
+        # A kind re-written in another encoding replaces the old file
+        for other in [n for n in entry["artifacts"] if n != name and _artifact_kind(n) == _artifact_kind(name)]:
+            entry["artifacts"].pop(other)
+    entry["artifacts"][name] = {
+        "bytes": int(record.get("bytes", 0) or 0),
+        "count": record.get("count"),
+    }
+    if record.get("format"):
+        entry["artifacts"][name]["format"] = record["format"]
+    entry["updated_at"] = record.get("at")
+
+
+class _ManifestState:
+    """Folded manifest for one base dir plus the byte offset consumed so far."""
+
+    def __init__(self) -> None:
+        self.inode: Optional[Tuple[int, int]] = None
+        self.offset = 0
+        self.records = 0
+        self.runs: Dict[str, Dict[str, Any]] = {}
+
+
+_STATES: Dict[str, _ManifestState] = {}
+_STATES_LOCK = threading.Lock()
+
+
+def _load_manifest(base: str) -> _ManifestState:
+    """Fold new manifest lines into the cached state (only bytes appended since last read)."""
+    path = _manifest_path(base)
+    with _STATES_LOCK:
+        state = _STATES.setdefault(path, _ManifestState())
+        if not os.path.exists(path):
+            if os.path.isdir(base):
+                _migrate_legacy(base)
+            if not os.path.exists(path):
+                _STATES[path] = _ManifestState()
+                return _STATES[path]
+        st = os.stat(path)
+        inode = (st.st_dev, st.st_ino)
+        if state.inode != inode or st.st_size < state.offset:
+            # Replaced by compaction (or truncated): refold from the start
+            state = _ManifestState()
+            state.inode = inode
+            _STATES[path] = state
+        if st.st_size > state.offset:
+            with open(path, "rb") as f:
+                f.seek(state.offset)
+                data = f.read(st.st_size - state.offset)
+            end = data.rfind(b"\n") + 1  # leave a partial trailing line for later
+            for raw in data[:end].splitlines():
+                if not raw.strip():
+                    continue
+                try:
+                    record = json.loads(raw)
+                except Exception:
+                    continue  # torn line from a crashed writer
+                if isinstance(record, dict):
+                    _apply(state.runs, record)
+                    state.records += 1
+            state.offset += end
+        return state
+
+
+def _migrate_legacy(base: str) -> None:
+    """One-time seed of the manifest from existing run directories / index.json."""
+    path = _manifest_path(base)
+    if os.path.exists(path) or not os.path.isdir(base):
+        return
+    run_ids = set()
+    legacy = os.path.join(base, _LEGACY_INDEX)
+    try:
+        with open(legacy, "r", encoding="utf-8") as f:
+            run_ids.update(str(r) for r in (json.load(f) or []))
+    except Exception:
+        pass
+    run_ids.update(d for d in os.listdir(base) if os.path.isdir(os.path.join(base, d)) and "_" in d)
+    lines: List[bytes] = []
+    at = _now_iso()
+    for run_ts in sorted(run_ids):
+        run_dir = os.path.join(base, run_ts)
+        if not os.path.isdir(run_dir):
+            continue
+        for name in sorted(os.listdir(run_dir)):
+            fp = os.path.join(run_dir, name)
+            if not os.path.isfile(fp):
+                continue
+            op = "run" if name == "summary.json" else "artifact"
+            lines.append(_encode_record({"op": op, "run_ts": run_ts, "name": name, "bytes": os.path.getsize(fp), "at": at}))
+    if lines:
+        _write_atomic(path, b"".join(lines))
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    tmp = f"{path}.tmp.{os.getpid()}"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
 def write_run(run_ts: str, summary: Dict[str, Any]) -> str:
     """Write a run summary for the given run timestamp.
 
@@ -43,51 +219,155 @@ def write_run(run_ts: str, summary: Dict[str, Any]) -> str:
         Path to the written summary file.
     """
     base = _base_dir()
+    _migrate_legacy(base)
     run_dir = os.path.join(base, run_ts)
     os.makedirs(run_dir, exist_ok=True)
     path = os.path.join(run_dir, "summary.json")
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(summary, f, ensure_ascii=False, separators=(",", ":"))
-    # Update index for discoverability
-    idx_path = os.path.join(base, "index.json")
+    data = json.dumps(summary, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    _write_atomic(path, data)
+    # Record in the manifest for discoverability (O(1) append)
     try:
-        idx = []
-        if os.path.exists(idx_path):
-            with open(idx_path, "r", encoding="utf-8") as f:
-                idx = json.load(f) or []
-        if run_ts not in idx:
-            idx.append(run_ts)
-            idx.sort()
-        with open(idx_path, "w", encoding="utf-8") as f:
-            json.dump(idx, f, ensure_ascii=False, separators=(",", ":"))
+        _append_manifest(base, {"op": "run", "run_ts": run_ts, "name": "summary.json", "bytes": len(data), "at": _now_iso()})
     except Exception:
         # Non-fatal
         pass
     return path
 
 
-def write_jsonl(kind: str, run_ts: str, items: List[Dict[str, Any]]) -> str:
-    """Write a JSONL artifact for a given run timestamp and kind.
+def write_jsonl(
+    kind: str,
+    run_ts: str,
+    items: Iterable[Dict[str, Any]],
+    fmt: Optional[str] = None,
+) -> str:
+    """Write an artifact for a given run timestamp and kind.
 
     Args:
         kind: One of {"jobs", "enriched", "scores"}.
         run_ts: UTC run timestamp (string form) shared across artifacts.
-        items: List of items to serialize.
+        items: Items to serialize (streamed for the JSON Lines encodings).
+        fmt: "jsonl", "gzip", "zstd" or "columnar"; defaults to the configured
+            `storage.artifact_formats.<kind>` / `storage.artifact_format`.
 
     Returns:
-        Path to the written artifact file.
+        Path to the written artifact file (extension reflects the encoding).
     """
     base = _base_dir()
+    _migrate_legacy(base)
     run_dir = os.path.join(base, run_ts)
     os.makedirs(run_dir, exist_ok=True)
-    path = os.path.join(run_dir, f"{kind}.jsonl")
-    with open(path, "w", encoding="utf-8") as f:
-        for it in items:
-            f.write(json.dumps(it, ensure_ascii=False, separators=(",", ":")))
-            f.write("\n")
+    resolved = artifact_formats.resolve_format(fmt or _artifact_format(kind))
+    path = os.path.join(run_dir, f"{kind}{artifact_formats.EXTENSIONS[resolved]}")
+    count = artifact_formats.write_items(path, items, resolved)
+    # Drop other encodings of the same kind so readers never see a stale copy
+    for ext in artifact_formats.EXTENSIONS.values():
+        other = os.path.join(run_dir, f"{kind}{ext}")
+        if other != path and os.path.exists(other):
+            os.remove(other)
+    try:
+        _append_manifest(
+            base,
+            {
+                "op": "artifact",
+                "run_ts": run_ts,
+                "name": os.path.basename(path),
+                "kind": kind,
+                "format": resolved,
+                "bytes": os.path.getsize(path),
+                "count": count,
+                "at": _now_iso(),
+            },
+        )
+    except Exception:
+        pass
     return path
 
 
+def read_artifact(
+    run_ts: str,
+    kind: str,
+    fields: Optional[Sequence[str]] = None,
+    base: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Stream the rows of a run's artifact in whatever encoding it was written.
+
+    `fields` projects each row onto the given keys; columnar artifacts then only
+    decode those columns. Yields nothing when the run has no such artifact.
+    """
+    base = base or _base_dir()
+    entry = _load_manifest(base).runs.get(run_ts) or {"artifacts": {}}
+    names = [n for n in entry["artifacts"] if _artifact_kind(n) == kind]
+    if not names:
+        # Artifacts written outside the manifest (e.g. copied in by hand)
+        names = [f"{kind}{ext}" for ext in artifact_formats.EXTENSIONS.values()]
+    for name in names:
+        path = os.path.join(base, run_ts, name)
+        if os.path.exists(path):
+            yield from artifact_formats.read_items(path, fields)
+            return
+
+
+def list_runs(base: Optional[str] = None) -> List[str]:
+    """Run timestamps recorded in the manifest, ascending (no directory scan)."""
+    return sorted(_load_manifest(base or _base_dir()).runs)
+
+
+def get_run(run_ts: str, base: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Manifest entry for a run: path, total bytes and per-artifact bytes/counts."""
+    base = base or _base_dir()
+    entry = _load_manifest(base).runs.get(run_ts)
+    if entry is None:
+        return None
+    out = json.loads(json.dumps(entry))
+    out["path"] = os.path.join(base, run_ts)
+    out["bytes"] = sum(a.get("bytes", 0) for a in out["artifacts"].values())
+    return out
+
+
+def locate(run_ts: str, name: str = "summary.json", base: Optional[str] = None) -> Optional[str]:
+    """Path of a recorded artifact (e.g. "jobs.jsonl"), or None when not in the manifest."""
+    base = base or _base_dir()
+    entry = _load_manifest(base).runs.get(run_ts)
+    if entry is None or name not in entry["artifacts"]:
+        return None
+    return os.path.join(base, run_ts, name)
+
+
+def compact_manifest(base: Optional[str] = None) -> Dict[str, int]:
+    """Rewrite the manifest as one record per live artifact (atomic replace).
+
+    Records appended while compacting are carried over verbatim.
+    """
+    base = base or _base_dir()
+    path = _manifest_path(base)
+    state = _load_manifest(base)
+    if not os.path.exists(path):
+        return {"records_before": 0, "records_after": 0}
+    before = state.records
+    consumed = state.offset
+    lines: List[bytes] = []
+    for run_ts in sorted(state.runs):
+        entry = state.runs[run_ts]
+        for name, art in sorted(entry["artifacts"].items()):
+            record: Dict[str, Any] = {
+                "op": "run" if name == "summary.json" else "artifact",
+                "run_ts": run_ts,
+                "name": name,
+                "bytes": art.get("bytes", 0),
+                "at": entry.get("updated_at") or entry.get("written_at"),
+            }
+            if art.get("count") is not None:
+                record["count"] = art["count"]
+            if art.get("format"):
+                record["format"] = art["format"]
+            lines.append(_encode_record(record))
+    with open(path, "rb") as f:
+        f.seek(consumed)
+        tail = f.read()
+    _write_atomic(path, b"".join(lines) + tail)
+    return {"records_before": before, "records_after": len(lines)}
+
+
 def prune(config: Dict[str, Any]) -> Dict[str, Any]:
     """Apply retention policy to JSON-backed runs deterministically.
 
@@ -103,13 +383,13 @@ def prune(config: Dict[str, Any]) -> Dict[str, Any]:
     base = _base_dir()
     if days is None or not os.path.isdir(base):
         return {"deleted_runs": [], "kept_runs": []}
-    # Determine run directories (names follow run_ts format)
-    run_dirs = [d for d in os.listdir(base) if os.path.isdir(os.path.join(base, d)) and "_" in d]
-    run_dirs.sort()  # Ascending by run_ts
-    from datetime import datetime, timezone, timedelta
+    # Runs come from the manifest (ascending by run_ts), not a directory scan
+    run_dirs = [ts for ts in list_runs(base) if "_" in ts]
+    from datetime import timedelta
 
     def _parse(ts: str) -> datetime:
-        return datetime.strptime(ts, "%Y%m%d_%H%M%S").replace(tzinfo=timezone.utc)
+        # Same-second runs carry a suffix (20260101_120000_2); the timestamp is the prefix
+        return datetime.strptime(ts[:15], "%Y%m%d_%H%M%S").replace(tzinfo=timezone.utc)
 
     now = datetime.now(timezone.utc)
     cutoff = now - timedelta(days=int(days))
@@ -118,14 +398,14 @@ def prune(config: Dict[str, Any]) -> Dict[str, Any]:
     to_delete = [ts for ts in eligible_by_age if ts not in latest_n]
     deleted = []
     for ts in to_delete:
+        # Record the delete first so a crash mid-rmtree never resurrects the run
+        _append_manifest(base, {"op": "delete", "run_ts": ts, "at": _now_iso()})
         shutil.rmtree(os.path.join(base, ts), ignore_errors=True)
         deleted.append(ts)
     kept = [ts for ts in run_dirs if ts not in deleted]
-    # Update index
-    idx_path = os.path.join(base, "index.json")
-    try:
-        with open(idx_path, "w", encoding="utf-8") as f:
-            json.dump(kept, f, ensure_ascii=False, separators=(",", ":"))
-    except Exception:
-        pass
+    if deleted:
+        try:
+            compact_manifest(base)
+        except Exception:
+            pass
     return {"deleted_runs": deleted, "kept_runs": kept}
@@ -12,7 +12,8 @@ import sqlite3
 import json
 import hashlib
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List, Tuple
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
 
 # Resolve repo root to locate default data directory and config
 _ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -21,80 +22,130 @@ try:
 except Exception:
     config = None  # type: ignore
 
+from automation.common import job_identity
+from automation.storage.connections import DEFAULT_PRAGMAS, get_manager
+
+
+_DB_PATH_CACHE: Tuple[Any, str] = (None, "")
+
 
 def _db_path() -> str:
-    """Resolve SQLite DB path from config or default."""
+    """Resolve SQLite DB path from config or default (cached per loaded config)."""
+    global _DB_PATH_CACHE
     default_path = os.path.join(_ROOT, "data", "jobs.db")
+    source: Any = None
     cfg = {}
     if config and hasattr(config, "get"):
         try:
-            cfg = config.to_dict().get("storage", {}) or {}
+            source = config.to_dict()
+            if source is not None and source is _DB_PATH_CACHE[0]:
+                return _DB_PATH_CACHE[1]
+            cfg = source.get("storage", {}) or {}
         except Exception:
             cfg = {}
-    return str(cfg.get("sqlite_path", default_path))
+    path = str(cfg.get("sqlite_path", default_path))
+    _DB_PATH_CACHE = (source, path)
+    return path
+
+
+# Connection pragmas: WAL lets readers proceed during ingest; NORMAL sync is
+# durable across app crashes in WAL mode; negative cache_size is in KiB.
+_PRAGMAS = DEFAULT_PRAGMAS
 
 
 def _get_conn() -> sqlite3.Connection:
-    path = _db_path()
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    conn = sqlite3.connect(path)
-    conn.execute("PRAGMA foreign_keys = ON;")
-    return conn
+    """Pooled per-thread connection; close() returns it to the pool."""
+    return get_manager(_db_path(), _PRAGMAS).connection()
 
 
 def init_schema() -> None:
     """Initialize or migrate the SQLite schema (idempotent)."""
     conn = _get_conn()
-    cur = conn.cursor()
-    cur.executescript(
-        """
-        CREATE TABLE IF NOT EXISTS runs (
-            run_ts TEXT PRIMARY KEY,
-            timestamp_iso TEXT NOT NULL,
-            summary_json TEXT NOT NULL
-        );
-
-        CREATE TABLE IF NOT EXISTS jobs (
-            run_ts TEXT NOT NULL,
-            job_id TEXT NOT NULL,
-            title TEXT,
-            location TEXT,
-            company TEXT,
-            source TEXT,
-            url TEXT,
-            posted_date TEXT,
-            PRIMARY KEY (run_ts, job_id),
-            FOREIGN KEY (run_ts) REFERENCES runs(run_ts) ON DELETE CASCADE
-        );
-
-        CREATE TABLE IF NOT EXISTS enriched (
-            run_ts TEXT NOT NULL,
-            job_id TEXT NOT NULL,
-            features_json TEXT NOT NULL,
-            PRIMARY KEY (run_ts, job_id),
-            FOREIGN KEY (run_ts, job_id) REFERENCES jobs(run_ts, job_id) ON DELETE CASCADE
-        );
-
-        CREATE TABLE IF NOT EXISTS scores (
-            run_ts TEXT NOT NULL,
-            job_id TEXT NOT NULL,
-            score REAL,
-            bucket TEXT,
-            PRIMARY KEY (run_ts, job_id),
-            FOREIGN KEY (run_ts, job_id) REFERENCES jobs(run_ts, job_id) ON DELETE CASCADE
-        );
-        """
-    )
-    conn.commit()
-    conn.close()
+    try:
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS runs (
+                run_ts TEXT PRIMARY KEY,
+                timestamp_iso TEXT NOT NULL,
+                summary_json TEXT NOT NULL
+            );
 
+            CREATE TABLE IF NOT EXISTS jobs (
+                run_ts TEXT NOT NULL,
+                job_id TEXT NOT NULL,
+                title TEXT,
+                location TEXT,
+                company TEXT,
+                source TEXT,
+                url TEXT,
+                posted_date TEXT,
+                PRIMARY KEY (run_ts, job_id),
+                FOREIGN KEY (run_ts) REFERENCES runs(run_ts) ON DELETE CASCADE
+            );
 
-def insert_run(run_summary: Dict[str, Any]) -> None:
-    """Insert a run summary row keyed by run timestamp string (run_ts).
+            CREATE TABLE IF NOT EXISTS enriched (
+                run_ts TEXT NOT NULL,
+                job_id TEXT NOT NULL,
+                features_json TEXT NOT NULL,
+                PRIMARY KEY (run_ts, job_id),
+                FOREIGN KEY (run_ts, job_id) REFERENCES jobs(run_ts, job_id) ON DELETE CASCADE
+            );
 
-    Expects either `run_summary["run_ts"]` (YYYYMMDD_%H%M%S) or derives it from
-    `run_summary["timestamp_utc"]` (ISO) if present.
-    """
+            CREATE TABLE IF NOT EXISTS scores (
+                run_ts TEXT NOT NULL,
+                job_id TEXT NOT NULL,
+                score REAL,
+                bucket TEXT,
+                PRIMARY KEY (run_ts, job_id),
+                FOREIGN KEY (run_ts, job_id) REFERENCES jobs(run_ts, job_id) ON DELETE CASCADE
+            );
+
+            CREATE TABLE IF NOT EXISTS job_state (
+                job_id TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                first_seen_run TEXT NOT NULL,
+                last_seen_run TEXT NOT NULL,
+                scored_json TEXT NOT NULL
+            );
+
+            -- Canonical job registry: one global_id per unique posting
+            CREATE TABLE IF NOT EXISTS job_registry (
+                global_id TEXT PRIMARY KEY,
+                canonical_key TEXT NOT NULL,
+                company TEXT,
+                title TEXT,
+                location TEXT,
+                simhash INTEGER,
+                first_seen_run TEXT,
+                last_seen_run TEXT
+            );
+
+            -- Every canonical_id (normalized URL hash) ever seen -> its global_id
+            CREATE TABLE IF NOT EXISTS job_aliases (
+                alias_id TEXT PRIMARY KEY,
+                global_id TEXT NOT NULL
+            ) WITHOUT ROWID;
+
+            -- SimHash band index (per company) for near-duplicate candidate lookup
+            CREATE TABLE IF NOT EXISTS job_simhash_bands (
+                company TEXT NOT NULL,
+                band INTEGER NOT NULL,
+                global_id TEXT NOT NULL,
+                PRIMARY KEY (company, band, global_id)
+            ) WITHOUT ROWID;
+            """
+        )
+        # Registries created before location was part of a posting's identity
+        registry_cols = {row[1] for row in conn.execute("PRAGMA table_info(job_registry)")}
+        if "location" not in registry_cols:
+            conn.execute("ALTER TABLE job_registry ADD COLUMN location TEXT")
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _resolve_run_ts(run_summary: Dict[str, Any]) -> Tuple[str, str]:
+    """Return (run_ts, timestamp_iso) for a run summary."""
     ts_iso = str(run_summary.get("timestamp_utc", ""))
     run_ts = str(run_summary.get("run_ts", ""))
     if not run_ts:
@@ -104,85 +155,418 @@ def insert_run(run_summary: Dict[str, Any]) -> None:
             run_ts = dt.strftime("%Y%m%d_%H%M%S")
         except Exception:
             raise ValueError("run_summary must include 'run_ts' or a valid 'timestamp_utc'")
-    conn = _get_conn()
-    cur = conn.cursor()
-    cur.execute(
-        "INSERT OR REPLACE INTO runs(run_ts, timestamp_iso, summary_json) VALUES (?, ?, ?)",
-        (run_ts, ts_iso or "", json.dumps(run_summary, separators=(",", ":"))),
-    )
-    conn.commit()
-    conn.close()
+    return run_ts, ts_iso
 
 
-def insert_jobs(run_ts: str, jobs: List[Dict[str, Any]]) -> None:
-    """Insert discovered jobs for a given run timestamp.
+def insert_run(run_summary: Dict[str, Any]) -> None:
+    """Insert a run summary row keyed by run timestamp string (run_ts).
 
-    Primary key is (run_ts, job_id) where job_id is a deterministic hash of
-    "source|url".
+    Expects either `run_summary["run_ts"]` (YYYYMMDD_%H%M%S) or derives it from
+    `run_summary["timestamp_utc"]` (ISO) if present.
     """
+    run_ts, ts_iso = _resolve_run_ts(run_summary)
     conn = _get_conn()
-    cur = conn.cursor()
-    for j in jobs:
-        src = str(j.get("source", ""))
-        url = str(j.get("url", ""))
-        job_id = hashlib.sha1(f"{src}|{url}".encode("utf-8")).hexdigest()
-        cur.execute(
+    try:
+        conn.execute(
+            "INSERT OR REPLACE INTO runs(run_ts, timestamp_iso, summary_json) VALUES (?, ?, ?)",
+            (run_ts, ts_iso or "", json.dumps(run_summary, separators=(",", ":"))),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+# Near-duplicate matching needs enough text for SimHash to be meaningful
+_MIN_SIMHASH_TOKENS = 12
+
+
+def _chunks(items: List[Any], size: int = 500):
+    # Stay under SQLite's bound-parameter limit
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _resolve_global_ids(
+    conn: sqlite3.Connection,
+    rows: List[Dict[str, Any]],
+    run_ts: str = "",
+    register: bool = True,
+) -> Dict[str, str]:
+    """Map each row's canonical_id to its registry global_id.
+
+    Known aliases resolve directly. Unseen ids are matched against registered
+    postings of the same company and location by SimHash over title + company
+    + description (candidates come from the per-company band index; thresholds
+    in job_identity.is_near_duplicate); otherwise the canonical_id becomes a
+    new global_id. The same role in two cities is two openings and never
+    merges. With `register`, new aliases/postings are written (caller
+    commits) and last_seen_run advanced; without it nothing is written.
+    """
+    by_cid: Dict[str, Dict[str, Any]] = {}
+    for row in rows:
+        by_cid.setdefault(job_identity.canonical_id(row), row)
+    cids = list(by_cid)
+    resolved: Dict[str, str] = {}
+    for chunk in _chunks(cids):
+        marks = ",".join("?" for _ in chunk)
+        resolved.update(conn.execute(f"SELECT alias_id, global_id FROM job_aliases WHERE alias_id IN ({marks})", chunk))
+
+    new_aliases: List[Tuple[str, str]] = []
+    new_postings: List[Tuple[Any, ...]] = []
+    new_bands: List[Tuple[str, int, str]] = []
+    # Postings registered earlier in this batch: (company, location, band) -> [(gid, simhash, title)]
+    batch_bands: Dict[Tuple[str, str, int], List[Tuple[str, int, str]]] = {}
+    for cid in cids:
+        if cid in resolved:
+            continue
+        row = by_cid[cid]
+        company = job_identity.normalize_text(row.get("company"))
+        title = job_identity.normalize_text(row.get("title"))
+        location = job_identity.normalize_text(row.get("location"))
+        text = job_identity.simhash_text(row)
+        fingerprint: Optional[int] = None
+        gid = cid
+        if company and len(text.split()) >= _MIN_SIMHASH_TOKENS:
+            fingerprint = job_identity.simhash(text)
+            bands = list(job_identity.simhash_bands(fingerprint))
+            candidates = [c for b in bands for c in batch_bands.get((company, location, b), [])]
+            marks = ",".join("?" for _ in bands)
+            candidates.extend(
+                (g, job_identity.from_sqlite_int(h), t or "")
+                for g, h, t in conn.execute(
+                    f"""
+                    SELECT r.global_id, r.simhash, r.title FROM job_simhash_bands b
+                    JOIN job_registry r ON r.global_id = b.global_id
+                    WHERE b.company = ? AND b.band IN ({marks}) AND r.location = ?
+                    """,
+                    [company, *bands, location],
+                )
+            )
+            best = None
+            for g, h, t in candidates:
+                distance = job_identity.hamming(fingerprint, h)
+                if job_identity.is_near_duplicate(distance, t == title) and (best is None or distance < best[0]):
+                    best = (distance, g)
+            if best is not None:
+                gid = best[1]
+            else:
+                for b in bands:
+                    batch_bands.setdefault((company, location, b), []).append((cid, fingerprint, title))
+                    new_bands.append((company, b, cid))
+        if gid == cid:
+            new_postings.append(
+                (
+                    cid,
+                    job_identity.canonical_key(row),
+                    company,
+                    title,
+                    location,
+                    job_identity.to_sqlite_int(fingerprint) if fingerprint is not None else None,
+                    run_ts,
+                    run_ts,
+                )
+            )
+        resolved[cid] = gid
+        new_aliases.append((cid, gid))
+
+    if register:
+        conn.executemany("INSERT OR IGNORE INTO job_aliases(alias_id, global_id) VALUES (?, ?)", new_aliases)
+        conn.executemany(
             """
-            INSERT OR IGNORE INTO jobs(run_ts, job_id, title, location, company, source, url, posted_date)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            INSERT OR IGNORE INTO job_registry(global_id, canonical_key, company, title, location, simhash, first_seen_run, last_seen_run)
+            VALUES (?, ?, ?, ?, ?, ?, NULLIF(?, ''), NULLIF(?, ''))
             """,
-            (
-                run_ts,
-                job_id,
-                j.get("title"),
-                j.get("location"),
-                j.get("company"),
-                src,
-                url,
-                j.get("posted_date"),
-            ),
+            new_postings,
+        )
+        conn.executemany("INSERT OR IGNORE INTO job_simhash_bands(company, band, global_id) VALUES (?, ?, ?)", new_bands)
+        if run_ts:
+            conn.executemany(
+                "UPDATE job_registry SET last_seen_run = ? WHERE global_id = ? AND (last_seen_run IS NULL OR last_seen_run < ?)",
+                [(run_ts, gid, run_ts) for gid in set(resolved.values())],
+            )
+    return resolved
+
+
+class _JobIds:
+    """Per-call job_id resolver: registry global_id of each row.
+
+    Canonical ids are memoized per (url, company, title, location) so rows
+    repeated across jobs/enriched/scores are normalized and hashed once.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, run_ts: str = "", *row_lists: Optional[List[Dict[str, Any]]]) -> None:
+        self._cids: Dict[Tuple[str, ...], str] = {}
+        rows = [r for lst in row_lists if lst for r in lst]
+        self._gids = _resolve_global_ids(conn, rows, run_ts)
+
+    def __call__(self, row: Dict[str, Any]) -> str:
+        key = tuple(str(row.get(k) or "") for k in ("url", "company", "title", "location"))
+        cid = self._cids.get(key)
+        if cid is None:
+            cid = job_identity.canonical_id(row)
+            self._cids[key] = cid
+        return self._gids.get(cid, cid)
+
+
+def _first_per_id(params):
+    """Drop rows whose job_id (index 1) repeats a near-duplicate earlier in the batch."""
+    seen = set()
+    for p in params:
+        if p[1] not in seen:
+            seen.add(p[1])
+            yield p
+
+
+_INSERT_JOB_SQL = """
+    INSERT OR IGNORE INTO jobs(run_ts, job_id, title, location, company, source, url, posted_date)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_INSERT_ENRICHED_SQL = "INSERT OR REPLACE INTO enriched(run_ts, job_id, features_json) VALUES (?, ?, ?)"
+_INSERT_SCORE_SQL = "INSERT OR REPLACE INTO scores(run_ts, job_id, score, bucket) VALUES (?, ?, ?, ?)"
+
+
+def _job_params(run_ts: str, jobs: List[Dict[str, Any]], ids: _JobIds):
+    for j in jobs:
+        yield (
+            run_ts,
+            ids(j),
+            j.get("title"),
+            j.get("location"),
+            j.get("company"),
+            str(j.get("source", "")),
+            str(j.get("url", "")),
+            j.get("posted_date"),
         )
-    conn.commit()
-    conn.close()
+
+
+# json.dumps builds a new encoder per call when options are passed; reuse one
+_COMPACT_JSON = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _enriched_params(run_ts: str, enriched: List[Dict[str, Any]], ids: _JobIds):
+    for e in enriched:
+        yield (run_ts, ids(e), _COMPACT_JSON(e))
+
+
+def _score_params(run_ts: str, scores: List[Dict[str, Any]], ids: _JobIds):
+    for sc in scores:
+        yield (run_ts, ids(sc), sc.get("score"), sc.get("bucket"))
+
+
+def insert_jobs(run_ts: str, jobs: List[Dict[str, Any]]) -> None:
+    """Insert discovered jobs for a given run timestamp.
+
+    Primary key is (run_ts, job_id) where job_id is the posting's global_id
+    from the canonical job registry.
+    """
+    conn = _get_conn()
+    try:
+        with conn:
+            ids = _JobIds(conn, run_ts, jobs)
+            conn.executemany(_INSERT_JOB_SQL, _first_per_id(_job_params(run_ts, jobs, ids)))
+    finally:
+        conn.close()
 
 
 def insert_enriched(run_ts: str, enriched: List[Dict[str, Any]]) -> None:
     """Insert enriched features for a given run timestamp.
 
-    Expects entries containing at least `source` and `url` to derive job_id.
-    Stores features as compact JSON.
+    Expects entries containing at least `url` (or company/title/location) to
+    derive job_id. Stores features as compact JSON.
     """
     conn = _get_conn()
-    cur = conn.cursor()
-    for e in enriched:
-        src = str(e.get("source", ""))
-        url = str(e.get("url", ""))
-        job_id = hashlib.sha1(f"{src}|{url}".encode("utf-8")).hexdigest()
-        cur.execute(
-            "INSERT OR REPLACE INTO enriched(run_ts, job_id, features_json) VALUES (?, ?, ?)",
-            (run_ts, job_id, json.dumps(e, separators=(",", ":"))),
-        )
-    conn.commit()
-    conn.close()
+    try:
+        with conn:
+            ids = _JobIds(conn, run_ts, enriched)
+            conn.executemany(_INSERT_ENRICHED_SQL, _first_per_id(_enriched_params(run_ts, enriched, ids)))
+    finally:
+        conn.close()
 
 
 def insert_scores(run_ts: str, scores: List[Dict[str, Any]]) -> None:
     """Insert scores for a given run timestamp.
 
-    Expects entries containing at least `source` and `url` to derive job_id.
+    Expects entries containing at least `url` (or company/title/location) to
+    derive job_id.
     """
     conn = _get_conn()
-    cur = conn.cursor()
-    for s in scores:
-        src = str(s.get("source", ""))
-        url = str(s.get("url", ""))
-        job_id = hashlib.sha1(f"{src}|{url}".encode("utf-8")).hexdigest()
+    try:
+        with conn:
+            ids = _JobIds(conn, run_ts, scores)
+            conn.executemany(_INSERT_SCORE_SQL, _first_per_id(_score_params(run_ts, scores, ids)))
+    finally:
+        conn.close()
+
+
+def ingest_run(
+    run_summary: Dict[str, Any],
+    jobs: List[Dict[str, Any]],
+    enriched: Optional[List[Dict[str, Any]]] = None,
+    scores: Optional[List[Dict[str, Any]]] = None,
+) -> str:
+    """Write a whole run (run row, jobs, enriched, scores) in one transaction.
+
+    Uses executemany per table; job_ids come from the canonical job registry
+    (resolved once across all three lists, registry updates included in the
+    same transaction). Re-ingesting a run_ts replaces that run's rows. Either
+    everything is written or, on error, nothing is. Returns the run_ts.
+    """
+    run_ts, ts_iso = _resolve_run_ts(run_summary)
+    by_job_id = itemgetter(1)
+    conn = _get_conn()
+    try:
+        with conn:
+            # Re-ingesting a run replaces it: drop its old child rows first so the
+            # run row replace can never leave orphans (foreign keys stay enforced)
+            for table in ("scores", "enriched", "jobs"):
+                conn.execute(f"DELETE FROM {table} WHERE run_ts = ?", (run_ts,))
+            conn.execute(
+                "INSERT OR REPLACE INTO runs(run_ts, timestamp_iso, summary_json) VALUES (?, ?, ?)",
+                (run_ts, ts_iso or "", _COMPACT_JSON(run_summary)),
+            )
+            # Registry writes share the transaction; near-duplicates collapse onto one job_id
+            ids = _JobIds(conn, run_ts, jobs, enriched, scores)
+            # Inserting in key order keeps primary-key B-tree writes sequential
+            conn.executemany(_INSERT_JOB_SQL, sorted(_first_per_id(_job_params(run_ts, jobs, ids)), key=by_job_id))
+            if enriched:
+                conn.executemany(
+                    _INSERT_ENRICHED_SQL, sorted(_first_per_id(_enriched_params(run_ts, enriched, ids)), key=by_job_id)
+                )
+            if scores:
+                conn.executemany(_INSERT_SCORE_SQL, sorted(_first_per_id(_score_params(run_ts, scores, ids)), key=by_job_id))
+    finally:
+        conn.close()
+    return run_ts
+
+
+def load_enriched(run_ts: Optional[str] = None) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+    """Load enriched feature rows for a run (latest run when run_ts is None).
+
+    Returns (run_ts, rows) with rows ordered by job_id; each row carries its
+    `job_id`. Returns (None, []) when nothing has been stored.
+    """
+    conn = _get_conn()
+    try:
+        cur = conn.cursor()
+        if run_ts is None:
+            cur.execute("SELECT MAX(run_ts) FROM enriched")
+            row = cur.fetchone()
+            run_ts = row[0] if row else None
+            if run_ts is None:
+                return None, []
         cur.execute(
-            "INSERT OR REPLACE INTO scores(run_ts, job_id, score, bucket) VALUES (?, ?, ?, ?)",
-            (run_ts, job_id, s.get("score"), s.get("bucket")),
+            "SELECT job_id, features_json FROM enriched WHERE run_ts = ? ORDER BY job_id",
+            (run_ts,),
+        )
+        rows: List[Dict[str, Any]] = []
+        for job_id, features_json in cur.fetchall():
+            try:
+                features = json.loads(features_json)
+            except Exception:
+                continue
+            if isinstance(features, dict):
+                features.setdefault("job_id", job_id)
+                rows.append(features)
+        return run_ts, rows
+    finally:
+        conn.close()
+
+
+# Fields that define a posting's content for change detection. Board-specific
+# source/url are left out so a re-post elsewhere still counts as unchanged.
+_CONTENT_FIELDS = ("title", "location", "company", "posted_date", "description")
+
+
+def job_id_for(job: Dict[str, Any]) -> str:
+    """Source-independent canonical id (normalized URL hash); see job_identity."""
+    return job_identity.canonical_id(job)
+
+
+def resolve_job_ids(jobs: List[Dict[str, Any]], run_ts: str = "") -> List[str]:
+    """Registry global_id per job (registering unseen postings)."""
+    conn = _get_conn()
+    try:
+        with conn:
+            gids = _resolve_global_ids(conn, jobs, run_ts)
+    finally:
+        conn.close()
+    return [gids[job_id_for(j)] for j in jobs]
+
+
+def content_hash(job: Dict[str, Any], salt: str = "") -> str:
+    """Hash of a job's content fields plus `salt` (e.g. an enrichment/scoring config signature)."""
+    payload = {k: job.get(k) for k in _CONTENT_FIELDS}
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str) + "|" + salt
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+def partition_seen(jobs: List[Dict[str, Any]], salt: str = "") -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """Split jobs into (delta, carried) against previously processed state.
+
+    - delta: jobs that are new or whose content hash changed; these need
+      enrichment and scoring.
+    - carried: mapping job_id_for(job) -> stored scored row for unchanged
+      jobs, ready to be carried forward. State is keyed by registry global_id,
+      so a posting already processed under another board/URL is carried too;
+      the job's own discovery fields are laid over the stored row.
+
+    Read-only: unseen postings are registered later by remember_processed/ingest.
+    """
+    stored: Dict[str, Tuple[str, str]] = {}
+    conn = _get_conn()
+    try:
+        gids = _resolve_global_ids(conn, jobs, register=False)
+        ids = list(set(gids.values()))
+        cur = conn.cursor()
+        for chunk in _chunks(ids):
+            marks = ",".join("?" for _ in chunk)
+            cur.execute(f"SELECT job_id, content_hash, scored_json FROM job_state WHERE job_id IN ({marks})", chunk)
+            for jid, h, scored_json in cur.fetchall():
+                stored[jid] = (h, scored_json)
+    finally:
+        conn.close()
+
+    delta: List[Dict[str, Any]] = []
+    carried: Dict[str, Dict[str, Any]] = {}
+    for job in jobs:
+        cid = job_id_for(job)
+        prev = stored.get(gids[cid])
+        if prev is not None and prev[0] == content_hash(job, salt):
+            try:
+                row = json.loads(prev[1])
+                row.update(job)
+                carried[cid] = row
+                continue
+            except Exception:
+                pass
+        delta.append(job)
+    return delta, carried
+
+
+def remember_processed(run_ts: str, scored_rows: List[Dict[str, Any]], salt: str = "") -> int:
+    """Upsert processed rows into job_state so later runs can skip them.
+
+    Returns the number of rows written.
+    """
+    conn = _get_conn()
+    try:
+        ids = _JobIds(conn, run_ts, scored_rows)
+        rows = [(ids(r), content_hash(r, salt), run_ts, run_ts, _COMPACT_JSON(r)) for r in scored_rows]
+        conn.executemany(
+            """
+            INSERT INTO job_state(job_id, content_hash, first_seen_run, last_seen_run, scored_json)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(job_id) DO UPDATE SET
+                content_hash = excluded.content_hash,
+                last_seen_run = excluded.last_seen_run,
+                scored_json = excluded.scored_json
+            """,
+            rows,
         )
-    conn.commit()
-    conn.close()
+        conn.commit()
+    finally:
+        conn.close()
+    return len(rows)
 
 
 def prune(config: Dict[str, Any]) -> Dict[str, Any]:
@@ -198,25 +582,28 @@ def prune(config: Dict[str, Any]) -> Dict[str, Any]:
     if days is None:
         return {"deleted_runs": [], "kept_runs": []}
     conn = _get_conn()
-    cur = conn.cursor()
-    cur.execute("SELECT run_ts, timestamp_iso FROM runs ORDER BY run_ts ASC")
-    rows: List[Tuple[str, str]] = cur.fetchall()
-    run_list = [r[0] for r in rows]
-    # Determine cutoff
-    now = datetime.now(timezone.utc)
-    cutoff = now - timedelta(days=int(days))
-    # Parse run_ts into datetimes
-    def _parse(ts: str) -> datetime:
-        return datetime.strptime(ts, "%Y%m%d_%H%M%S").replace(tzinfo=timezone.utc)
-
-    eligible_by_age = [ts for ts in run_list if _parse(ts) < cutoff]
-    latest_n = set(run_list[-keep_n:]) if keep_n > 0 else set()
-    to_delete = [ts for ts in eligible_by_age if ts not in latest_n]
-    deleted: List[str] = []
-    for ts in to_delete:
-        cur.execute("DELETE FROM runs WHERE run_ts = ?", (ts,))
-        deleted.append(ts)
-    conn.commit()
-    conn.close()
+    try:
+        cur = conn.cursor()
+        cur.execute("SELECT run_ts, timestamp_iso FROM runs ORDER BY run_ts ASC")
+        rows: List[Tuple[str, str]] = cur.fetchall()
+        run_list = [r[0] for r in rows]
+        # Determine cutoff
+        now = datetime.now(timezone.utc)
+        cutoff = now - timedelta(days=int(days))
+        # Parse run_ts into datetimes
+        def _parse(ts: str) -> datetime:
+            # Same-second runs carry a suffix (20260101_120000_2); the timestamp is the prefix
+            return datetime.strptime(ts[:15], "%Y%m%d_%H%M%S").replace(tzinfo=timezone.utc)
+
+        eligible_by_age = [ts for ts in run_list if _parse(ts) < cutoff]
+        latest_n = set(run_list[-keep_n:]) if keep_n > 0 else set()
+        to_delete = [ts for ts in eligible_by_age if ts not in latest_n]
+        deleted: List[str] = []
+        for ts in to_delete:
+            cur.execute("DELETE FROM runs WHERE run_ts = ?", (ts,))
+            deleted.append(ts)
+        conn.commit()
+    finally:
+        conn.close()
     kept = [ts for ts in run_list if ts not in deleted]
     return {"deleted_runs": deleted, "kept_runs": kept}
@@ -14,6 +14,9 @@ class Config:
 
     def __init__(self):
         self._json = {}
+        # Keys resolved from the .env/JSON files only, ignoring the process environment
+        self._file_only = frozenset()
+        self._file_env = {}
         self._mapping = {
             "SYSTEM_ENVIRONMENT": "system.environment",
             "SYSTEM_LOG_LEVEL": "system.log_level",
@@ -89,6 +92,10 @@ class Config:
             "AUTOMATION_REQUIRE_MANUAL_APPROVAL": "automation.require_manual_approval",
             # Enrichment toggle
             "ENRICHMENT_ENABLED": "ENRICHMENT_ENABLED",
+            "ENRICHMENT_WORKERS": "ENRICHMENT_WORKERS",
+            # Cross-board near-duplicate clustering
+            "SOURCES_CLUSTER_ENABLED": "SOURCES_CLUSTER_ENABLED",
+            "SOURCES_CLUSTER_THRESHOLD": "SOURCES_CLUSTER_THRESHOLD",
             # Resume
             "RESUME_BACKUP_ON_TAILOR": "resume.backup_on_tailor",
             # Excel
@@ -102,10 +109,35 @@ class Config:
             "SCRAPER_BACKOFF_BASE": "job_discovery.rate_limits.backoff_base",
             "SCRAPER_BACKOFF_MAX": "job_discovery.rate_limits.backoff_max",
             "SCRAPER_JITTER_MS": "job_discovery.rate_limits.jitter_ms",
+            "SCRAPER_BURST": "job_discovery.rate_limits.burst",
+            "SCRAPER_RATE_LIMIT_STORE": "job_discovery.rate_limits.store",
+            "SCRAPER_RATE_LIMIT_PATH": "job_discovery.rate_limits.store_path",
+            "SCRAPER_BREAKER_ENABLED": "job_discovery.rate_limits.circuit_breaker.enabled",
+            "SCRAPER_BREAKER_THRESHOLD": "job_discovery.rate_limits.circuit_breaker.failure_threshold",
+            "SCRAPER_BREAKER_COOLDOWN_SECONDS": "job_discovery.rate_limits.circuit_breaker.cooldown_seconds",
+            "SCRAPER_BREAKER_PATH": "job_discovery.rate_limits.circuit_breaker.state_path",
+            "HTTP_POOL_CONNECTIONS": "job_discovery.http.pool_connections",
+            "HTTP_POOL_MAXSIZE": "job_discovery.http.pool_maxsize",
+            "HTTP_CACHE_ENABLED": "job_discovery.http.cache.enabled",
+            "HTTP_CACHE_PATH": "job_discovery.http.cache.path",
+            "HTTP_CACHE_TTL_SECONDS": "job_discovery.http.cache.ttl_seconds",
+            "HTTP_CACHE_FRESH_SECONDS": "job_discovery.http.cache.fresh_seconds",
+            "HTTP_CACHE_MAX_BYTES": "job_discovery.http.cache.max_bytes",
+            "STORAGE_INCREMENTAL": "storage.incremental",
+            "STORAGE_PERSIST_RUNS": "storage.persist_runs",
+            "STORAGE_ARTIFACT_FORMAT": "storage.artifact_format",
             "LOG_SUPPRESS_STDOUT_IF_JSONL": "system.log_suppress_stdout_if_jsonl",
         }
 
-    def initialize(self, env_path: str = ".env", json_path: str = "config/env.sample.json") -> None:
+    def initialize(self, env_path: str = ".env", json_path: str = "config/env.sample.json", file_only_keys=()) -> None:
+        """Load the .env and JSON files.
+
+        `file_only_keys` are read from the files alone: values already in the
+        process environment (e.g. stale ones inherited by a long-lived server)
+        are ignored for them, and the environment itself is left untouched.
+        """
+        self._file_only = frozenset(file_only_keys)
+        self._file_env = {}
         self._load_env_file(env_path)
         self._load_json_config(json_path)
 
@@ -123,7 +155,9 @@ class Config:
                     key, value = s.split("=", 1)
                     key = key.strip()
                     value = value.strip()
-                    if key and key not in os.environ:
+                    if key in self._file_only:
+                        self._file_env[key] = value
+                    elif key and key not in os.environ:
                         os.environ[key] = value
         except Exception:
             pass
@@ -139,6 +173,8 @@ class Config:
             self._json = {}
 
     def get_env(self, key: str, default=None):
+        if key in self._file_only:
+            return self._file_env.get(key, default)
         return os.environ.get(key, default)
 
     def get_json(self, path: str, default=None):
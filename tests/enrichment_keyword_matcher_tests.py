@@ -0,0 +1,50 @@
+"""
+Compiled keyword matcher used by enrichment_transforms.
+
+The matcher must report exactly the keys a `key in text` scan would, including
+overlapping and nested keys.
+"""
+
+import os
+import sys
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+_SCRIPTS_DIR = os.path.join(_REPO_ROOT, "automation", "job-discovery", "scripts")
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+import enrichment_transforms as et  # type: ignore
+
+
+def _naive(keys, text):
+    t = text.lower()
+    return {k for k in keys if k in t}
+
+
+def test_matcher_reports_overlapping_and_nested_keys():
+    keys = ["node", "nodejs", "sql", "mysql", "go ", "django", "rest", "restful", "c#"]
+    matcher = et._KeywordMatcher(keys)
+    for text in (
+        "NodeJS and MySQL",
+        "django services built over restful apis",
+        "C# developer; interest in go and rust",
+        "",
+    ):
+        assert set(matcher.scan(text.lower())) == _naive(keys, text)
+
+
+def test_infer_functions_share_single_scan():
+    et._scan.cache_clear()
+    text = "Senior Backend Engineer (Python, Kafka, GitHub Actions) - Agile team"
+    assert et.infer_seniority(text) == "senior"
+    assert et.infer_domain_tags(text) == ["backend", "data-platform"]
+    assert et.infer_stack(text) == ["GitHub Actions", "Kafka", "Python"]
+    assert et.extract_skills(text) == ["Agile", "CI/CD", "GitHub Actions", "Kafka", "Python"]
+    info = et._scan.cache_info()
+    assert info.misses == 1 and info.hits == 3
+
+
+def test_enrich_job_defaults_for_empty_text():
+    enriched = et.enrich_job({"title": ""})
+    assert enriched["seniority"] == "mid"
+    assert enriched["stack"] == [] and enriched["skills"] == [] and enriched["domain_tags"] == []
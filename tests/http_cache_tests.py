@@ -0,0 +1,99 @@
+"""
+Conditional GET response cache: ETag/Last-Modified revalidation, TTL and LRU bounds.
+"""
+
+import json
+import types
+
+from automation.common import http_cache, http_client
+
+
+class _Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class _Response:
+    def __init__(self, status, payload=None, headers=None):
+        self.status_code = status
+        self._payload = payload
+        self.text = json.dumps(payload) if payload is not None else ""
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def json(self):
+        return self._payload
+
+
+class _ScriptedSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, params=None, timeout=None, headers=None):
+        self.sent_headers.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+def test_conditional_get_replays_body_on_304(monkeypatch, tmp_path):
+    clock = _Clock()
+    cache = http_cache.HttpCache(path=str(tmp_path / "cache.db"), now_fn=clock)
+    session = _ScriptedSession([
+        _Response(200, [{"title": "SWE"}], {"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2026 00:00:00 GMT"}),
+        _Response(304),
+    ])
+    monkeypatch.setattr(http_client, "_CACHE", cache)
+    monkeypatch.setattr(http_client, "get_session", lambda: session)
+
+    first = http_client.get_json("https://api.test/jobs", params={"q": "python"})
+    clock.now += 60
+    second = http_client.get_json("https://api.test/jobs", params={"q": "python"})
+
+    assert first == second == [{"title": "SWE"}]
+    assert "If-None-Match" not in session.sent_headers[0]
+    assert session.sent_headers[1]["If-None-Match"] == '"v1"'
+    assert session.sent_headers[1]["If-Modified-Since"].startswith("Wed, 01 Jan 2026")
+    assert cache.lookup("https://api.test/jobs", {"q": "python"})["stored_at"] == clock.now
+
+
+def test_fresh_entries_skip_the_network(monkeypatch, tmp_path):
+    cache = http_cache.HttpCache(path=str(tmp_path / "cache.db"), fresh_seconds=300, now_fn=_Clock())
+    session = _ScriptedSession([_Response(200, {"jobs": []})])
+    monkeypatch.setattr(http_client, "_CACHE", cache)
+    monkeypatch.setattr(http_client, "get_session", lambda: session)
+
+    http_client.get_json("https://api.test/feed")
+    assert http_client.get_json("https://api.test/feed") == {"jobs": []}
+    assert len(session.sent_headers) == 1
+
+
+def test_ttl_expiry_and_lru_size_bound(tmp_path):
+    clock = _Clock()
+    cache = http_cache.HttpCache(path=str(tmp_path / "cache.db"), ttl_seconds=100, max_bytes=30, now_fn=clock)
+    cache.store("https://a", None, "x" * 10, etag="a")
+    clock.now += 1
+    cache.store("https://b", None, "y" * 10, etag="b")
+    clock.now += 1
+    cache.lookup("https://a")  # a becomes most recently used
+    clock.now += 1
+    cache.store("https://c", None, "z" * 15, etag="c")
+
+    assert cache.lookup("https://b") is None  # least recently used evicted
+    assert cache.lookup("https://a") is not None
+    assert cache.stats()["bytes"] <= 30
+
+    clock.now += 200
+    assert cache.lookup("https://c") is None
+
+
+def test_responses_without_validators_are_not_cached(tmp_path):
+    cache = http_cache.HttpCache(path=str(tmp_path / "cache.db"))
+    cache.store("https://a", {"page": 1}, "[]")
+    assert cache.stats()["entries"] == 0
+    assert http_cache.cache_key("https://a", {"x": 1, "y": 2}) == http_cache.cache_key("https://a", {"y": 2, "x": 1})
@@ -0,0 +1,131 @@
+"""
+Shared pooled HTTP client: sync requests session and per-loop httpx.AsyncClient.
+"""
+
+import asyncio
+import types
+
+import pytest
+
+from automation.common import http_client
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return self._payload
+
+
+class _FakeSession:
+    instances = 0
+
+    def __init__(self):
+        _FakeSession.instances += 1
+        self.headers = {}
+        self.mounted = {}
+        self.calls = []
+        self.closed = False
+
+    def mount(self, prefix, adapter):
+        self.mounted[prefix] = adapter
+
+    def get(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return _FakeResponse({"url": url})
+
+    def close(self):
+        self.closed = True
+
+
+def _fake_requests(monkeypatch):
+    _FakeSession.instances = 0
+    monkeypatch.setattr(http_client, "requests", types.SimpleNamespace(Session=_FakeSession))
+    monkeypatch.setattr(http_client, "HTTPAdapter", lambda **kw: dict(kw))
+    http_client.close()
+
+
+def test_session_is_shared_and_pooled(monkeypatch):
+    _fake_requests(monkeypatch)
+    http_client.configure(pool_connections=4, pool_maxsize=16)
+
+    assert http_client.get_json("https://a.test/jobs") == {"url": "https://a.test/jobs"}
+    http_client.get_json("https://a.test/jobs", params={"page": 2})
+    session = http_client.get_session()
+
+    assert _FakeSession.instances == 1
+    assert len(session.calls) == 2
+    assert session.mounted["https://"] == {"pool_connections": 4, "pool_maxsize": 16}
+    assert "gzip" in session.headers["Accept-Encoding"]
+    assert session.headers["Connection"] == "keep-alive"
+    http_client.configure(**http_client.DEFAULT_SETTINGS)
+
+
+def test_configure_rebuilds_session(monkeypatch):
+    _fake_requests(monkeypatch)
+    first = http_client.get_session()
+    http_client.configure(pool_maxsize=2)
+    second = http_client.get_session()
+
+    assert first is not second
+    assert first.closed
+    assert second.mounted["http://"]["pool_maxsize"] == 2
+    http_client.configure(**http_client.DEFAULT_SETTINGS)
+
+
+def test_brotli_advertised_only_when_decodable(monkeypatch):
+    monkeypatch.setattr(http_client, "_brotli_available", lambda: False)
+    assert "br" not in http_client.accept_encoding()
+    monkeypatch.setattr(http_client, "_brotli_available", lambda: True)
+    assert http_client.accept_encoding().endswith("br")
+
+
+class _FakeAsyncClient:
+    def __init__(self, limits=None, headers=None, follow_redirects=False):
+        self.limits = limits
+        self.headers = headers
+        self.follow_redirects = follow_redirects
+        self.calls = []
+        self.is_closed = False
+
+    async def get(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return types.SimpleNamespace(status_code=200, text="{}", headers={}, raise_for_status=lambda: None, json=lambda: {"url": url})
+
+    async def aclose(self):
+        self.is_closed = True
+
+
+def test_async_client_is_shared_per_loop(monkeypatch):
+    fake_httpx = types.SimpleNamespace(Limits=lambda **kw: dict(kw), AsyncClient=_FakeAsyncClient)
+    monkeypatch.setattr(http_client, "httpx", fake_httpx)
+    http_client.configure(pool_connections=2, pool_maxsize=3)
+
+    async def run():
+        first = await http_client.async_get_json("https://a.test/jobs", use_cache=False)
+        await http_client.async_get_json("https://a.test/jobs", params={"page": 2}, use_cache=False)
+        client = http_client.get_async_client()
+        await http_client.aclose()
+        return first, client
+
+    first, client = asyncio.run(run())
+    assert first == {"url": "https://a.test/jobs"}
+    assert [c[1]["params"] for c in client.calls] == [{}, {"page": 2}]
+    assert client.limits == {"max_connections": 6, "max_keepalive_connections": 6}
+    assert client.follow_redirects and "gzip" in client.headers["Accept-Encoding"]
+    assert client.is_closed
+    http_client.configure(**http_client.DEFAULT_SETTINGS)
+
+
+def test_async_client_requires_httpx(monkeypatch):
+    monkeypatch.setattr(http_client, "httpx", None)
+
+    async def run():
+        return http_client.get_async_client()
+
+    with pytest.raises(http_client.LibraryUnavailable):
+        asyncio.run(run())
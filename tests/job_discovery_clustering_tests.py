@@ -0,0 +1,111 @@
+"""
+Cross-board near-duplicate clustering after fetch.
+"""
+
+import json
+import os
+import sys
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+_SCRIPTS_DIR = os.path.join(_REPO_ROOT, "automation", "job-discovery", "scripts")
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+import clustering  # type: ignore
+import job_discovery_v1 as orchestrator  # type: ignore
+import sources  # type: ignore
+
+
+def _job(source, url, title="Senior Software Engineer", company="Acme", location="Remote", **extra):
+    job = {"title": title, "company": company, "location": location, "source": source, "url": url, "posted_date": "2026-01-09"}
+    job.update(extra)
+    return job
+
+
+def test_cross_posts_collapse_to_most_complete_representative():
+    jobs = [
+        _job("greenhouse", "https://boards.greenhouse.io/acme/1", title="Senior Software Engineer - Remote", company="Acme Inc."),
+        _job("indeed", "https://indeed.com/viewjob?jk=1", title="Sr. Software Engineer", company="ACME", description="Full text"),
+        _job("lever", "https://jobs.lever.co/acme/2", title="Data Engineer"),
+        _job("ziprecruiter", "https://ziprecruiter.com/j/3", company="Globex"),
+    ]
+    out = clustering.cluster_postings(jobs)
+    assert [j["url"] for j in out] == [jobs[1]["url"], jobs[2]["url"], jobs[3]["url"]]
+    assert out[0]["alternate_sources"] == [{"source": "greenhouse", "url": jobs[0]["url"]}]
+    assert out[0]["cluster_size"] == 2
+    assert "alternate_sources" not in out[1]
+
+
+def test_same_source_listings_are_never_merged():
+    jobs = [_job("indeed", f"https://indeed.com/viewjob?jk={i}") for i in range(3)]
+    assert clustering.cluster_postings(jobs) == jobs
+    # A third board can join only one of the identical same-source listings
+    out = clustering.cluster_postings(jobs[:2] + [_job("lever", "https://jobs.lever.co/acme/1")])
+    assert len(out) == 2 and sum(j.get("cluster_size", 1) for j in out) == 3
+
+
+def test_fetch_all_sources_clusters_when_enabled(monkeypatch):
+    adapters = {
+        "lever": lambda cfg: [dict(_job("lever", "https://jobs.lever.co/acme/1"), job_id="a")],
+        "greenhouse": lambda cfg: [dict(_job("greenhouse", "https://boards.greenhouse.io/acme/1"), job_id="b")],
+    }
+    monkeypatch.setattr(sources, "_load_adapter_fetch", lambda entry: adapters.get(entry["adapter"], lambda cfg: []))
+    cfg = {"LEVER_ENABLED": True, "GREENHOUSE_ENABLED": True, "ENRICHMENT_ENABLED": False}
+    assert len(sources.fetch_all_sources(cfg)) == 2
+    out = sources.fetch_all_sources(dict(cfg, SOURCES_CLUSTER_ENABLED=True))
+    assert len(out) == 1 and out[0]["cluster_size"] == 2
+
+
+def test_main_reports_clustered_duplicates(tmp_path, monkeypatch):
+    jobs = [_job("indeed", "https://indeed.com/viewjob?jk=1"), _job("linkedin", "https://linkedin.com/jobs/view/1")]
+    monkeypatch.setattr(orchestrator, "iter_discovered_jobs", lambda: list(jobs))
+    monkeypatch.setenv("SOURCES_CLUSTER_ENABLED", "true")
+    orchestrator.main(["--out-dir", str(tmp_path)])
+    summary = json.loads(next(tmp_path.glob("*.summary.json")).read_text(encoding="utf-8"))
+    assert summary["counts"]["duplicates_clustered"] == 1
+    assert summary["counts"]["exported"] == 1
+
+
+def test_different_levels_are_never_merged():
+    loc = "New York, NY 10001, United States (Hybrid)"
+    pairs = [
+        ("Senior Software Engineer", "Software Engineer"),
+        ("Senior Software Engineer", "Staff Software Engineer"),
+        ("Principal Software Engineer", "Lead Software Engineer"),
+        ("Software Engineer II", "Software Engineer III"),
+        ("Junior Data Engineer", "Data Engineer"),
+    ]
+    for a, b in pairs:
+        jobs = [_job("greenhouse", "https://boards.greenhouse.io/acme/1", title=a, location=loc), _job("indeed", "https://indeed.com/viewjob?jk=1", title=b, location=loc)]
+        assert clustering.cluster_postings(jobs, threshold=0.5) == jobs, (a, b)
+    # Level spelled differently is still the same level
+    same = [_job("greenhouse", "https://boards.greenhouse.io/acme/1", title="Sr Software Engineer II"), _job("indeed", "https://indeed.com/viewjob?jk=1", title="Senior Software Engineer 2")]
+    assert len(clustering.cluster_postings(same)) == 1
+
+
+def test_location_does_not_lift_title_similarity():
+    loc = "San Francisco Bay Area, California, United States"
+    jobs = [
+        _job("greenhouse", "https://boards.greenhouse.io/acme/1", title="Backend Software Engineer", location=loc),
+        _job("indeed", "https://indeed.com/viewjob?jk=1", title="Frontend Software Engineer", location=loc),
+    ]
+    assert clustering.cluster_postings(jobs) == jobs
+    # Same title in two cities: two openings
+    cities = [_job("greenhouse", "https://boards.greenhouse.io/acme/1", location="New York, NY"), _job("indeed", "https://indeed.com/viewjob?jk=1", location="Austin, TX")]
+    assert clustering.cluster_postings(cities) == cities
+
+
+def test_nearby_cities_and_missing_companies_are_never_merged():
+    cities = [
+        _job("greenhouse", "https://boards.greenhouse.io/acme/1", location="San Francisco, CA"),
+        _job("indeed", "https://indeed.com/viewjob?jk=1", location="San Diego, CA"),
+    ]
+    assert clustering.cluster_postings(cities) == cities
+    anonymous = [
+        _job("greenhouse", "https://boards.greenhouse.io/x/1", title="Software Engineer", company=""),
+        _job("indeed", "https://indeed.com/viewjob?jk=2", title="Software Engineer", company=None),
+    ]
+    assert clustering.cluster_postings(anonymous) == anonymous
+    # Location spelling differences that normalize away still match
+    same = [_job("greenhouse", "https://boards.greenhouse.io/acme/1", location="New York, NY"), _job("indeed", "https://indeed.com/viewjob?jk=1", location="new york ny")]
+    assert len(clustering.cluster_postings(same)) == 1
@@ -29,11 +29,11 @@ def test_discover_jobs_handles_source_exception(monkeypatch, caplog):
         raise TimeoutError("simulated timeout")
 
     monkeypatch.setattr(orchestrator, "config", DummyConfig())
-    monkeypatch.setattr(sources, "fetch_linkedin_jobs", boom)
+    monkeypatch.setattr(sources, "iter_linkedin_jobs", boom)
     # The other source returns malformed and valid entries
     monkeypatch.setattr(
         sources,
-        "fetch_indeed_jobs",
+        "iter_indeed_jobs",
         lambda: [
             {"title": "Bad"},  # malformed
             {
@@ -64,8 +64,8 @@ def test_discover_jobs_handles_empty_results(monkeypatch, caplog):
             return True  # enable both
 
     monkeypatch.setattr(orchestrator, "config", DummyConfig())
-    monkeypatch.setattr(sources, "fetch_linkedin_jobs", lambda: [])
-    monkeypatch.setattr(sources, "fetch_indeed_jobs", lambda: [])
+    monkeypatch.setattr(sources, "iter_linkedin_jobs", lambda: [])
+    monkeypatch.setattr(sources, "iter_indeed_jobs", lambda: [])
 
     caplog.set_level("INFO")
     jobs = orchestrator.discover_jobs()
@@ -80,11 +80,11 @@ def test_discover_jobs_handles_non_list_return(monkeypatch, caplog):
 
     monkeypatch.setattr(orchestrator, "config", DummyConfig())
     # Return a dict instead of list to simulate incorrect source output
-    monkeypatch.setattr(sources, "fetch_linkedin_jobs", lambda: {"oops": True})
+    monkeypatch.setattr(sources, "iter_linkedin_jobs", lambda: {"oops": True})
     # Provide one valid list from indeed
     monkeypatch.setattr(
         sources,
-        "fetch_indeed_jobs",
+        "iter_indeed_jobs",
         lambda: [
             {
                 "title": "Backend Engineer",
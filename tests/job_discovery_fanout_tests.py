@@ -0,0 +1,143 @@
+"""
+Concurrent source fan-out tests for fetch_all_sources.
+No network calls; adapters are replaced via the registry loader seam.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+_SCRIPTS_DIR = os.path.join(_REPO_ROOT, "automation", "job-discovery", "scripts")
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+import pytest
+
+import sources  # type: ignore
+from automation.common.http_client import LibraryUnavailable
+
+
+@pytest.fixture(autouse=True)
+def _no_abandoned_workers(monkeypatch):
+    monkeypatch.setattr(sources, "_ABANDONED", {})
+
+
+def _job(jid: str, source: str) -> dict:
+    return {"job_id": jid, "title": f"Engineer {jid}", "company": "Acme", "url": f"https://x/{jid}", "source": source}
+
+
+def _install_fakes(monkeypatch, behaviours):
+    def fake_loader(entry):
+        return behaviours[entry["adapter"]]
+
+    monkeypatch.setattr(sources, "_load_adapter_fetch", fake_loader)
+
+
+def test_concurrent_matches_sequential(monkeypatch):
+    behaviours = {
+        "lever": lambda cfg: [_job("b", "lever"), _job("a", "lever")],
+        "greenhouse": lambda cfg: [_job("a", "greenhouse"), _job("c", "greenhouse")],
+        "ashby": lambda cfg: [_job("d", "ashby")],
+    }
+    _install_fakes(monkeypatch, behaviours)
+    base = {"LEVER_ENABLED": True, "GREENHOUSE_ENABLED": True, "ASHBY_ENABLED": True, "ENRICHMENT_ENABLED": False}
+
+    seq = sources.fetch_all_sources(dict(base))
+    conc = sources.fetch_all_sources(dict(base, SOURCES_CONCURRENT=True))
+
+    assert seq == conc
+    assert [j["job_id"] for j in conc] == ["a", "b", "c", "d"]
+    # First adapter in registry order wins on duplicate job_id
+    assert conc[0]["source"] == "lever"
+
+
+def test_concurrent_runs_adapters_in_parallel(monkeypatch):
+    barrier = threading.Barrier(3, timeout=2)
+
+    def slow(name):
+        def _fetch(cfg):
+            barrier.wait()  # only passes if all three run at once
+            return [_job(name, name)]
+        return _fetch
+
+    _install_fakes(monkeypatch, {"lever": slow("lever"), "greenhouse": slow("greenhouse"), "ashby": slow("ashby")})
+    cfg = {"LEVER_ENABLED": True, "GREENHOUSE_ENABLED": True, "ASHBY_ENABLED": True, "SOURCES_CONCURRENT": True, "ENRICHMENT_ENABLED": False}
+    out = sources.fetch_all_sources(cfg)
+    assert [j["job_id"] for j in out] == ["ashby", "greenhouse", "lever"]
+
+
+def test_concurrent_deadline_and_failure_isolated(monkeypatch):
+    release = threading.Event()
+
+    def hangs(cfg):
+        release.wait(5)
+        return [_job("late", "greenhouse")]
+
+    def boom(cfg):
+        raise RuntimeError("adapter down")
+
+    _install_fakes(monkeypatch, {"lever": lambda cfg: [_job("ok", "lever")], "greenhouse": hangs, "ashby": boom})
+    cfg = {
+        "LEVER_ENABLED": True,
+        "GREENHOUSE_ENABLED": True,
+        "ASHBY_ENABLED": True,
+        "SOURCES_CONCURRENT": True,
+        "SOURCES_DEADLINE_SECONDS": 5,
+        "GREENHOUSE_DEADLINE_SECONDS": 0.05,
+        "ENRICHMENT_ENABLED": False,
+    }
+    started = time.monotonic()
+    try:
+        out = sources.fetch_all_sources(cfg)
+    finally:
+        release.set()
+    assert time.monotonic() - started < 2
+    assert [j["job_id"] for j in out] == ["ok"]
+
+
+@pytest.mark.parametrize("concurrent", [False, True])
+def test_both_paths_share_the_error_contract(monkeypatch, concurrent):
+    def down(cfg):
+        raise ConnectionError("board down")
+
+    cfg = {"LEVER_ENABLED": True, "GREENHOUSE_ENABLED": True, "SOURCES_CONCURRENT": concurrent, "ENRICHMENT_ENABLED": False}
+    _install_fakes(monkeypatch, {"lever": lambda cfg: [_job("ok", "lever")], "greenhouse": down})
+    assert [j["job_id"] for j in sources.fetch_all_sources(cfg)] == ["ok"]
+
+    def missing_library(cfg):
+        raise LibraryUnavailable("requests library not available")
+
+    _install_fakes(monkeypatch, {"lever": lambda cfg: [_job("ok", "lever")], "greenhouse": missing_library})
+    with pytest.raises(LibraryUnavailable):
+        sources.fetch_all_sources(cfg)
+
+
+def test_late_adapter_is_not_restarted_while_still_running(monkeypatch):
+    release = threading.Event()
+    calls = []
+
+    def hangs(cfg):
+        calls.append(1)
+        release.wait(5)
+        return [_job("late", "greenhouse")]
+
+    _install_fakes(monkeypatch, {"lever": lambda cfg: [_job("ok", "lever")], "greenhouse": hangs})
+    cfg = {
+        "LEVER_ENABLED": True,
+        "GREENHOUSE_ENABLED": True,
+        "SOURCES_CONCURRENT": True,
+        "GREENHOUSE_DEADLINE_SECONDS": 0.05,
+        "ENRICHMENT_ENABLED": False,
+    }
+    try:
+        assert [j["job_id"] for j in sources.fetch_all_sources(cfg)] == ["ok"]
+        assert [j["job_id"] for j in sources.fetch_all_sources(cfg)] == ["ok"]
+        assert len(calls) == 1
+    finally:
+        release.set()
+    sources._ABANDONED["greenhouse"].result(timeout=2)
+    sources.fetch_all_sources(cfg)
+    assert len(calls) == 2
@@ -0,0 +1,79 @@
+"""
+Incremental discovery: only new/changed jobs are enriched and scored.
+"""
+
+import json
+import os
+import sys
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+_SCRIPTS_DIR = os.path.join(_REPO_ROOT, "automation", "job-discovery", "scripts")
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+import job_discovery_v1 as orchestrator  # type: ignore
+from automation.storage import sqlite_store
+
+
+def _job(n, title="Senior Software Engineer"):
+    return {
+        "title": title,
+        "location": "Remote",
+        "company": "Acme",
+        "source": "sample",
+        "url": f"https://example.com/jobs/{n}",
+        "posted_date": "2026-01-09",
+    }
+
+
+def test_partition_seen_detects_new_changed_and_unchanged(tmp_path, monkeypatch):
+    monkeypatch.setattr(sqlite_store, "_db_path", lambda: str(tmp_path / "jobs.db"))
+    sqlite_store.init_schema()
+
+    first = [_job(1), _job(2)]
+    delta, carried = sqlite_store.partition_seen(first)
+    assert delta == first and carried == {}
+    scored = [dict(j, score=0.5, bucket="Moderate") for j in first]
+    assert sqlite_store.remember_processed("20260101_000000", scored) == 2
+
+    second = [_job(1), _job(2, title="Staff Software Engineer"), _job(3)]
+    delta, carried = sqlite_store.partition_seen(second)
+    assert [j["url"] for j in delta] == [second[1]["url"], second[2]["url"]]
+    assert list(carried) == [sqlite_store.job_id_for(second[0])]
+    assert carried[sqlite_store.job_id_for(second[0])]["score"] == 0.5
+
+    # A different salt (e.g. new scoring weights) invalidates carried rows
+    delta, carried = sqlite_store.partition_seen(second, salt="weights-v2")
+    assert len(delta) == 3 and carried == {}
+
+
+def test_main_incremental_only_enriches_delta(tmp_path, monkeypatch):
+    monkeypatch.setattr(sqlite_store, "_db_path", lambda: str(tmp_path / "jobs.db"))
+    jobs = [_job(1), _job(2)]
+    monkeypatch.setattr(orchestrator, "iter_discovered_jobs", lambda: list(jobs))
+
+    calls = []
+    real_batch = orchestrator.enrichment.extract_features_batch
+
+    def counting_batch(batch, cfg, **kwargs):
+        calls.extend(j["url"] for j in batch)
+        return real_batch(batch, cfg, **kwargs)
+
+    monkeypatch.setattr(orchestrator.enrichment, "extract_features_batch", counting_batch)
+
+    out1 = tmp_path / "run1"
+    orchestrator.main(["--out-dir", str(out1), "--enrich", "--incremental"])
+    assert len(calls) == 2
+
+    jobs.append(_job(3))
+    calls.clear()
+    out2 = tmp_path / "run2"
+    orchestrator.main(["--out-dir", str(out2), "--enrich", "--incremental"])
+    assert calls == [_job(3)["url"]]
+
+    enriched = json.loads(next(out2.glob("jobs_enriched_*.json")).read_text(encoding="utf-8"))
+    assert [e["url"] for e in enriched] == [j["url"] for j in jobs]
+    summary = json.loads(next(out2.glob("*.summary.json")).read_text(encoding="utf-8"))
+    assert summary["incremental"] == {"processed": 1, "carried_forward": 2}
@@ -45,9 +45,9 @@ def test_config_enable_disable_and_malformed_filtered(monkeypatch):
             {"title": "Bad"},
         ]
 
-    monkeypatch.setattr(sources, "fetch_linkedin_jobs", fake_linkedin)
+    monkeypatch.setattr(sources, "iter_linkedin_jobs", fake_linkedin)
     # Ensure indeed isn't used
-    monkeypatch.setattr(sources, "fetch_indeed_jobs", lambda: pytest.fail("indeed should be disabled"))
+    monkeypatch.setattr(sources, "iter_indeed_jobs", lambda: pytest.fail("indeed should be disabled"))
 
     jobs = orchestrator.discover_jobs()
     assert isinstance(jobs, list)
@@ -140,7 +140,7 @@ def test_main_filters_and_csv_export_deterministic(monkeypatch, tmp_path):
             return default or []
 
         def get_bool(self, key, default=False):
-            # No fetching; we'll stub discover_jobs directly
+            # No fetching; we'll stub iter_discovered_jobs directly
             return False
 
     monkeypatch.setattr(orchestrator, "config", DummyConfig())
@@ -175,7 +175,7 @@ def test_main_filters_and_csv_export_deterministic(monkeypatch, tmp_path):
             "posted_date": "2026-01-09",
         },
     ]
-    monkeypatch.setattr(orchestrator, "discover_jobs", lambda: jobs)
+    monkeypatch.setattr(orchestrator, "iter_discovered_jobs", lambda: jobs)
 
     # Run main to generate CSV
     orchestrator.main(["--out-dir", str(tmp_path)])
@@ -0,0 +1,117 @@
+"""
+Pagination tests for the LinkedIn/Indeed fetchers.
+No network calls; monkeypatch HTTP, rate limiter and retry.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import types
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+_SCRIPTS_DIR = os.path.join(_REPO_ROOT, "automation", "job-discovery", "scripts")
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+import sources  # type: ignore
+
+
+def _config(values):
+    class DummyConfig:
+        def get(self, k, d=None):
+            return values.get(k, d)
+
+        def get_int(self, k, d=0):
+            return values.get(k, d)
+
+        def get_float(self, k, d=0.0):
+            return values.get(k, d)
+
+    return DummyConfig()
+
+
+def _item(n):
+    return {"title": f"SWE {n}", "location": "Remote", "company": "Co", "url": f"http://x/{n}", "posted_date": "2026-01-09"}
+
+
+def _patch_common(monkeypatch, values, fake_http):
+    monkeypatch.setattr(sources, "config", _config(values))
+    monkeypatch.setattr(sources, "RateLimiter", lambda rpm=60: types.SimpleNamespace(acquire=lambda: None))
+    monkeypatch.setattr(sources, "with_retry", lambda f, **kwargs: f())
+    monkeypatch.setattr(sources, "_http_get_json", fake_http)
+    sources.reset_metrics()
+
+
+def test_cursor_envelope_is_followed(monkeypatch):
+    calls = []
+    pages = {
+        None: {"jobs": [_item(1), _item(2)], "next_page_token": "t2"},
+        "t2": {"jobs": [_item(3)], "next_page_token": "t3"},
+        "t3": {"jobs": [_item(4)]},
+    }
+
+    def fake_http(url, params=None, timeout=10):
+        token = (params or {}).get("cursor")
+        calls.append(token)
+        return pages[token]
+
+    _patch_common(monkeypatch, {"INDEED_API_URL": "http://fake.indeed"}, fake_http)
+    jobs = sources.fetch_indeed_jobs()
+    assert [j["url"] for j in jobs] == ["http://x/1", "http://x/2", "http://x/3", "http://x/4"]
+    assert calls == [None, "t2", "t3"]
+    assert sources.get_metrics().to_dict()["jobs_fetched"]["indeed"] == 4
+
+
+def test_offset_pagination_streams_lazily(monkeypatch):
+    calls = []
+
+    def fake_http(url, params=None, timeout=10):
+        calls.append(dict(params or {}))
+        start = params["offset"]
+        return [_item(n) for n in range(start, min(start + 2, 5))]
+
+    values = {"LINKEDIN_API_URL": "http://fake.linkedin", "LINKEDIN_PAGINATION": "offset", "LINKEDIN_PAGE_SIZE": 2}
+    _patch_common(monkeypatch, values, fake_http)
+
+    gen = sources.iter_linkedin_jobs()
+    first = next(gen)
+    # Only the first page has been requested when the first job is yielded
+    assert first["url"] == "http://x/0"
+    assert len(calls) == 1
+
+    rest = list(gen)
+    assert len(rest) == 4
+    assert calls == [{"offset": 0, "limit": 2}, {"offset": 2, "limit": 2}, {"offset": 4, "limit": 2}]
+
+
+def test_repeated_cursor_and_max_pages_stop(monkeypatch):
+    calls = {"n": 0}
+
+    def fake_http(url, params=None, timeout=10):
+        calls["n"] += 1
+        return {"results": [_item(calls["n"])], "cursor": "same"}
+
+    _patch_common(monkeypatch, {"INDEED_API_URL": "http://fake.indeed", "INDEED_MAX_PAGES": 5}, fake_http)
+    jobs = sources.fetch_indeed_jobs()
+    assert calls["n"] == 2
+    assert len(jobs) == 2
+
+
+def test_later_page_failure_keeps_earlier_pages(monkeypatch):
+    def fake_http(url, params=None, timeout=10):
+        if params:
+            raise TimeoutError("page 2 down")
+        return {"data": [_item(1)], "nextCursor": "p2"}
+
+    _patch_common(monkeypatch, {"INDEED_API_URL": "http://fake.indeed"}, fake_http)
+
+    def _with_retry(f, **kwargs):
+        try:
+            return f()
+        except Exception:
+            return None
+
+    monkeypatch.setattr(sources, "with_retry", _with_retry)
+    jobs = sources.fetch_indeed_jobs()
+    assert [j["url"] for j in jobs] == ["http://x/1"]
+    assert sources.get_metrics().to_dict()["scraper_failures"] == 1
@@ -121,7 +121,7 @@ def test_summary_artifact_created(monkeypatch, tmp_path):
     monkeypatch.setattr(orchestrator, "datetime", FixedDT)
 
     # Provide jobs to export (already filtered by keywords/locations)
-    monkeypatch.setattr(orchestrator, "discover_jobs", lambda: [
+    monkeypatch.setattr(orchestrator, "iter_discovered_jobs", lambda: [
         {"title": "Engineer - Remote", "location": "Remote", "company": "A", "source": "x", "url": "http://a", "posted_date": "2026-01-09"}
     ])
 
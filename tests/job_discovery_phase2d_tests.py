@@ -54,7 +54,7 @@ def test_logs_emitted_to_jsonl(monkeypatch, tmp_path):
     monkeypatch.setattr(orchestrator, "datetime", FixedDT)
 
     # Cause scrapers to emit structured logs by returning malformed entry
-    monkeypatch.setattr(orchestrator, "discover_jobs", lambda: [
+    monkeypatch.setattr(orchestrator, "iter_discovered_jobs", lambda: [
         {"title": "Engineer", "location": "Remote", "company": "Co", "source": "x", "url": "http://x", "posted_date": "2026-01-09"}
     ])
 
@@ -0,0 +1,135 @@
+"""
+In-process pipeline API (run_pipeline) used by the control-center backend.
+"""
+
+import json
+import os
+import sys
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+_SCRIPTS_DIR = os.path.join(_REPO_ROOT, "automation", "job-discovery", "scripts")
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+import job_discovery_v1 as orchestrator  # type: ignore
+
+
+def _jobs():
+    return [
+        {
+            "title": "Senior Software Engineer",
+            "location": "Remote",
+            "company": "Acme",
+            "source": "sample",
+            "url": f"https://example.com/jobs/{i}",
+            "posted_date": "2026-01-09",
+        }
+        for i in range(3)
+    ]
+
+
+def test_run_pipeline_returns_rows_and_artifact_paths(tmp_path, monkeypatch):
+    monkeypatch.setattr(orchestrator, "iter_discovered_jobs", _jobs)
+    lines = []
+    result = orchestrator.run_pipeline(str(tmp_path), enrich=True, echo=lines.append)
+
+    assert result["status"] == "completed"
+    assert [j["url"] for j in result["jobs"]] == [j["url"] for j in _jobs()]
+    assert len(result["enriched"]) == len(result["scored"]) == 3
+    assert all("score" in r and "bucket" in r for r in result["scored"])
+    assert all("score" not in r for r in result["enriched"])
+    artifacts = result["artifacts"]
+    assert all(os.path.exists(artifacts[k]) for k in ("summary", "discovered_csv", "enriched_json", "scored_csv"))
+    with open(artifacts["enriched_json"], "r", encoding="utf-8") as f:
+        assert json.load(f) == result["enriched"]
+    assert result["summary"]["counts"]["exported"] == 3
+    with open(result["manifest"], "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    assert os.path.basename(result["manifest"]) == f"jobs_run_{result['run_ts']}.manifest.json"
+    assert manifest["run_ts"] == result["run_ts"]
+    assert manifest["artifacts"]["scored_csv"] == {"path": os.path.abspath(artifacts["scored_csv"]), "rows": 3}
+    assert manifest["artifacts"]["summary"]["rows"] is None
+    # Output goes through echo, not stdout
+    assert any(line.startswith("Summary: ") for line in lines)
+
+
+def test_runs_in_the_same_second_get_their_own_artifacts(tmp_path, monkeypatch):
+    class FixedDT:
+        @staticmethod
+        def now(tz):
+            class T:
+                def strftime(self, fmt):
+                    return "20260109_010203"
+            return T()
+
+    monkeypatch.setattr(orchestrator, "datetime", FixedDT)
+    monkeypatch.setattr(orchestrator, "iter_discovered_jobs", _jobs)
+    first = orchestrator.run_pipeline(str(tmp_path), echo=lambda _: None)
+    second = orchestrator.run_pipeline(str(tmp_path), echo=lambda _: None)
+
+    assert (first["run_ts"], second["run_ts"]) == ("20260109_010203", "20260109_010203_2")
+    assert first["artifacts"]["discovered_csv"] != second["artifacts"]["discovered_csv"]
+    assert first["manifest"] != second["manifest"]
+    with open(first["manifest"], "r", encoding="utf-8") as f:
+        assert json.load(f)["artifacts"]["discovered_csv"]["path"] == os.path.abspath(first["artifacts"]["discovered_csv"])
+
+
+def test_main_delegates_to_run_pipeline(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(orchestrator, "run_pipeline", lambda out_dir, **kw: calls.append((out_dir, kw)))
+    orchestrator.main(["--out-dir", str(tmp_path), "--enrich", "--incremental"])
+    assert calls == [(str(tmp_path), {"manifest_path": None, "summary_only": False, "enrich": True, "schedule": False, "incremental": True})]
+
+
+def test_manifest_path_override_and_summary_only(tmp_path, monkeypatch):
+    monkeypatch.setattr(orchestrator, "iter_discovered_jobs", _jobs)
+    target = tmp_path / "manifests" / "run_7.json"
+    orchestrator.main(["--out-dir", str(tmp_path / "out"), "--summary-only", "--manifest", str(target)])
+    with open(target, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    assert manifest["artifacts"]["discovered_csv"] is None
+    assert os.path.exists(manifest["artifacts"]["summary"]["path"])
+    assert not [p for p in os.listdir(target.parent) if ".tmp." in p]
+
+
+def test_run_pipeline_filters_the_stream_as_it_arrives(tmp_path, monkeypatch):
+    pulled = []
+
+    def stream():
+        for i in range(50):
+            title = "Senior Software Engineer" if i % 10 == 0 else "Volunteer Coordinator"
+            job = dict(_jobs()[0], title=title, url=f"https://example.com/jobs/{i}")
+            pulled.append(job)
+            yield job
+
+    monkeypatch.setattr(orchestrator, "iter_discovered_jobs", stream)
+    result = orchestrator.run_pipeline(str(tmp_path), summary_only=True, echo=lambda line: None)
+    assert len(pulled) == 50
+    assert [j["url"] for j in result["jobs"]] == [f"https://example.com/jobs/{i}" for i in range(0, 50, 10)]
+    counts = result["summary"]["counts"]
+    assert (counts["total_discovered"], counts["filtered_out"], counts["exported"]) == (50, 45, 5)
+
+
+def test_source_failing_mid_stream_keeps_earlier_pages(monkeypatch):
+    import sources  # type: ignore
+
+    def linkedin():
+        yield dict(_jobs()[0], source="linkedin")
+        raise TimeoutError("page 2 timed out")
+
+    monkeypatch.setattr(orchestrator.config, "get_bool", lambda key, default=False: key == "LINKEDIN_ENABLED" or default)
+    monkeypatch.setattr(sources, "iter_linkedin_jobs", linkedin)
+    monkeypatch.setattr(sources, "iter_indeed_jobs", lambda: iter([dict(_jobs()[1], source="indeed")]))
+    assert [j["source"] for j in orchestrator.discover_jobs()] == ["linkedin", "indeed"]
+
+
+def test_run_pipeline_leaves_the_host_environment_alone(tmp_path, monkeypatch):
+    monkeypatch.setattr(orchestrator, "iter_discovered_jobs", _jobs)
+    monkeypatch.setenv("JOB_FILTER_KEYWORDS", "nothing-matches-this")
+    monkeypatch.setenv("INDEED_ENABLED", "false")
+    result = orchestrator.run_pipeline(str(tmp_path), summary_only=True, echo=lambda line: None)
+    assert os.environ["JOB_FILTER_KEYWORDS"] == "nothing-matches-this"
+    assert os.environ["INDEED_ENABLED"] == "false"
+    # Stale process values are still ignored for discovery keys: file config wins
+    assert result["summary"]["counts"]["exported"] == 3
+    assert result["summary"]["enabled_sources"]["indeed"] is True
@@ -0,0 +1,126 @@
+"""
+Retry policy tests: error classification, Retry-After and circuit breaker.
+No real sleeping; time is injected.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import types
+
+import pytest
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+_SCRIPTS_DIR = os.path.join(_REPO_ROOT, "automation", "job-discovery", "scripts")
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+import scrape_utils  # type: ignore
+
+
+class HTTPError(Exception):
+    def __init__(self, status, headers=None):
+        super().__init__(f"HTTP {status}")
+        self.response = types.SimpleNamespace(status_code=status, headers=headers or {})
+
+
+def _raising(exc, counter):
+    def _f():
+        counter["n"] += 1
+        raise exc
+    return _f
+
+
+def test_client_errors_are_fatal_without_retry():
+    calls = {"n": 0}
+    slept = []
+    out = scrape_utils.with_retry(_raising(HTTPError(404), calls), max_retries=5, jitter_ms=0, sleep_fn=slept.append)
+    assert out is None
+    assert calls["n"] == 1 and slept == []
+
+
+def test_throttling_is_retried_and_honors_retry_after():
+    calls = {"n": 0}
+    slept = []
+
+    def _f():
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise HTTPError(429, {"Retry-After": "7"})
+        return "ok"
+
+    out = scrape_utils.with_retry(_f, max_retries=3, backoff_base=0.1, jitter_ms=0, sleep_fn=slept.append)
+    assert out == "ok"
+    assert slept == [7.0]
+
+
+def test_retry_after_is_capped():
+    calls = {"n": 0}
+    slept = []
+    scrape_utils.with_retry(
+        _raising(HTTPError(503, {"Retry-After": "3600"}), calls),
+        max_retries=1,
+        jitter_ms=0,
+        retry_after_max=30,
+        sleep_fn=slept.append,
+    )
+    assert slept == [30]
+
+
+def test_keyboard_interrupt_propagates():
+    def _f():
+        raise KeyboardInterrupt()
+
+    with pytest.raises(KeyboardInterrupt):
+        scrape_utils.with_retry(_f, max_retries=3, sleep_fn=lambda s: None)
+
+
+def test_circuit_breaker_opens_and_recovers(tmp_path):
+    now = {"t": 1000.0}
+    store = scrape_utils.JsonBreakerStore(str(tmp_path / "breakers.json"))
+    breaker = scrape_utils.CircuitBreaker("indeed", failure_threshold=2, cooldown_seconds=60, now_fn=lambda: now["t"], store=store)
+    calls = {"n": 0}
+    dead = _raising(RuntimeError("down"), calls)
+
+    for _ in range(2):
+        assert scrape_utils.with_retry(dead, max_retries=1, jitter_ms=0, sleep_fn=lambda s: None, breaker=breaker) is None
+    assert breaker.state == "open"
+    assert calls["n"] == 4
+
+    # While open, the source is skipped without any attempt or sleep
+    assert scrape_utils.with_retry(dead, max_retries=1, sleep_fn=pytest.fail, breaker=breaker) is None
+    assert calls["n"] == 4
+
+    # State survives into a new process (new breaker instance on the same file)
+    reloaded = scrape_utils.CircuitBreaker("indeed", failure_threshold=2, cooldown_seconds=60, now_fn=lambda: now["t"], store=store)
+    assert reloaded.state == "open"
+
+    # After cool-down a half-open probe succeeds and closes the breaker
+    now["t"] += 61
+    assert scrape_utils.with_retry(lambda: "ok", breaker=reloaded) == "ok"
+    assert reloaded.state == "closed" and reloaded.failures == 0
+
+
+def test_missing_library_and_config_errors_are_fatal():
+    class MissingSchema(ValueError):
+        pass
+
+    unavailable = type("LibraryUnavailable", (RuntimeError, ImportError), {})("requests library not available")
+    for exc in (unavailable, ModuleNotFoundError("requests"), MissingSchema("no scheme"), TypeError("bad arg")):
+        calls = {"n": 0}
+        assert scrape_utils.with_retry(_raising(exc, calls), max_retries=3, sleep_fn=pytest.fail) is None
+        assert calls["n"] == 1
+    assert scrape_utils.classify_error(RuntimeError("connection reset")) == "retry"
+    assert scrape_utils.classify_error(ConnectionError("refused")) == "retry"
+
+
+def test_memory_breaker_path_keeps_state_in_process(monkeypatch):
+    import sources  # type: ignore
+
+    seen = {}
+    monkeypatch.setattr(sources, "_load_breaker_factory", lambda: lambda name, **kw: seen.setdefault(name, kw))
+    cfg = {"SCRAPER_BREAKER_ENABLED": True, "SCRAPER_BREAKER_PATH": "memory"}
+    sources._source_breaker("indeed", cfg)
+    assert seen["indeed"]["path"] is None
+    # Disabled unless configured
+    assert sources._source_breaker("linkedin", {}) is None and "linkedin" not in seen
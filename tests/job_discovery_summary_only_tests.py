@@ -11,12 +11,14 @@ OUT_DIR = os.path.join(ROOT, "output")
 def test_summary_only_creates_summary_not_csv(tmp_path):
     out_dir = tmp_path / "out"
     out_dir.mkdir()
-    # Run summary-only
+    # Run summary-only; breaker state stays in the child process, never in data/
+    env = dict(os.environ, SCRAPER_BREAKER_PATH="memory")
     proc = subprocess.run(
         [sys.executable, SCRIPT, "--out-dir", str(out_dir), "--summary-only"],
         capture_output=True,
         text=True,
         check=True,
+        env=env,
     )
     # Ensure summary file exists
     summaries = sorted(out_dir.glob("*.summary.json"))
@@ -0,0 +1,153 @@
+"""
+Canonical job identity: URL normalization, global ids and the near-duplicate registry.
+"""
+
+import os
+import sqlite3
+import sys
+
+import pytest
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+_SCRIPTS_DIR = os.path.join(_REPO_ROOT, "automation", "job-discovery", "scripts")
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+import sources  # type: ignore
+from automation.common import job_identity
+from automation.storage import sqlite_store
+
+_DESCRIPTION = (
+    "We are hiring a platform engineer to build and operate our Kubernetes clusters, "
+    "own the CI/CD pipelines, and improve observability across Python and Go services."
+)
+
+
+def _posting(url, source="greenhouse", description=_DESCRIPTION, company="Acme", title="Platform Engineer"):
+    return {
+        "title": title,
+        "company": company,
+        "location": "Remote",
+        "source": source,
+        "url": url,
+        "posted_date": "2026-01-09",
+        "description": description,
+    }
+
+
+def test_normalize_url_drops_tracking_and_cosmetic_differences():
+    a = job_identity.normalize_url("HTTP://www.Example.com:443/jobs/42/?utm_source=li&b=2&a=1#apply")
+    b = job_identity.normalize_url("https://example.com/jobs/42?a=1&b=2&gclid=xyz")
+    assert a == b == "https://example.com/jobs/42?a=1&b=2"
+    assert job_identity.normalize_url("https://example.com/jobs/43") != b
+    assert job_identity.normalize_url("") == ""
+
+
+def test_canonical_id_is_source_independent():
+    assert job_identity.canonical_id(_posting("https://x.io/j/1", "lever")) == job_identity.canonical_id(
+        _posting("https://www.x.io/j/1/?ref=board", "indeed")
+    )
+    no_url = {"company": " Acme ", "title": "Data  Engineer", "location": "Remote"}
+    assert job_identity.canonical_key(no_url) == "acme|data engineer|remote"
+
+
+def test_simhash_separates_edits_from_different_postings():
+    base = job_identity.simhash(job_identity.simhash_text(_posting("u")))
+    edited = job_identity.simhash(job_identity.simhash_text(_posting("u", description=_DESCRIPTION + " Apply today.")))
+    other = job_identity.simhash(
+        job_identity.simhash_text(_posting("u", title="Sales Lead", description="Own enterprise accounts and quarterly revenue targets in EMEA."))
+    )
+    assert job_identity.is_near_duplicate(job_identity.hamming(base, edited), same_title=True)
+    assert job_identity.hamming(base, other) > job_identity.SAME_TITLE_DISTANCE
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "jobs.db")
+    monkeypatch.setattr(sqlite_store, "_db_path", lambda: path)
+    sqlite_store.init_schema()
+    return path
+
+
+def test_registry_maps_reposts_onto_one_global_id(db_path):
+    first = _posting("https://boards.greenhouse.io/acme/jobs/1")
+    repost = _posting("https://indeed.com/viewjob?jk=99", "indeed", description=_DESCRIPTION + " Apply today.")
+    other_company = _posting("https://globex.com/careers/7", company="Globex")
+    ids = sqlite_store.resolve_job_ids([first], "20260109_080000")
+    later = sqlite_store.resolve_job_ids([repost, other_company, dict(first, url=first["url"] + "?utm_medium=x")], "20260110_080000")
+    assert later[0] == ids[0] == later[2]
+    assert later[1] not in ids
+
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM job_registry").fetchone()[0] == 2
+        assert conn.execute("SELECT last_seen_run FROM job_registry WHERE global_id = ?", (ids[0],)).fetchone()[0] == "20260110_080000"
+    finally:
+        conn.close()
+
+
+def test_ingest_run_stores_near_duplicates_once(db_path):
+    jobs = [_posting("https://a.example/1"), _posting("https://b.example/9", "indeed", description=_DESCRIPTION + " Apply today.")]
+    sqlite_store.ingest_run({"run_ts": "r1"}, jobs, jobs, [dict(j, score=0.5, bucket="Moderate") for j in jobs])
+    conn = sqlite3.connect(db_path)
+    try:
+        assert [conn.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0] for t in ("jobs", "enriched", "scores")] == [1, 1, 1]
+        assert conn.execute("SELECT url FROM jobs").fetchone()[0] == "https://a.example/1"
+    finally:
+        conn.close()
+
+
+def test_partition_seen_carries_repost_from_another_board(db_path):
+    original = _posting("https://a.example/1")
+    sqlite_store.remember_processed("r1", [dict(original, score=0.9, bucket="Exceptional")])
+    repost = _posting("https://b.example/9", "indeed")
+    delta, carried = sqlite_store.partition_seen([repost])
+    assert delta == []
+    row = carried[sqlite_store.job_id_for(repost)]
+    assert row["score"] == 0.9 and row["url"] == repost["url"] and row["source"] == "indeed"
+
+
+def test_fetch_all_sources_dedups_by_canonical_url(monkeypatch):
+    jobs = {
+        "lever": lambda cfg: [dict(_posting("https://acme.com/jobs/1?utm_source=lever", "lever"), job_id="l1")],
+        "greenhouse": lambda cfg: [dict(_posting("https://www.acme.com/jobs/1", "greenhouse"), job_id="g1")],
+    }
+    monkeypatch.setattr(sources, "_load_adapter_fetch", lambda entry: jobs.get(entry["adapter"], lambda cfg: []))
+    out = sources.fetch_all_sources({"LEVER_ENABLED": True, "GREENHOUSE_ENABLED": True, "ENRICHMENT_ENABLED": False})
+    assert [j["job_id"] for j in out] == ["l1"]
+
+
+def test_same_role_in_another_city_keeps_its_own_id(db_path):
+    nyc = dict(_posting("https://acme.com/jobs/1"), location="New York, NY")
+    austin = dict(_posting("https://acme.com/jobs/2"), location="Austin, TX")
+    sqlite_store.ingest_run({"run_ts": "r1"}, [nyc, austin], [nyc, austin], [dict(j, score=0.5, bucket="Moderate") for j in (nyc, austin)])
+    conn = sqlite3.connect(db_path)
+    try:
+        assert [conn.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0] for t in ("jobs", "enriched", "scores")] == [2, 2, 2]
+    finally:
+        conn.close()
+
+
+def test_partition_seen_does_not_write_the_registry(db_path):
+    delta, carried = sqlite_store.partition_seen([_posting("https://a.example/1"), _posting("https://b.example/2")])
+    assert len(delta) == 2 and carried == {}
+    conn = sqlite3.connect(db_path)
+    try:
+        assert [conn.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0] for t in ("job_registry", "job_aliases", "job_simhash_bands")] == [0, 0, 0]
+    finally:
+        conn.close()
+
+
+def test_init_schema_adds_location_to_existing_registry(tmp_path, monkeypatch):
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE job_registry (global_id TEXT PRIMARY KEY, canonical_key TEXT NOT NULL, company TEXT, title TEXT, simhash INTEGER, first_seen_run TEXT, last_seen_run TEXT)")
+    conn.close()
+    monkeypatch.setattr(sqlite_store, "_db_path", lambda: path)
+    sqlite_store.init_schema()
+    sqlite_store.init_schema()
+    conn = sqlite3.connect(path)
+    try:
+        assert "location" in {row[1] for row in conn.execute("PRAGMA table_info(job_registry)")}
+    finally:
+        conn.close()
@@ -0,0 +1,68 @@
+"""
+Artifact encodings and projected reads for json_store.
+"""
+
+import gzip
+import os
+
+import pytest
+
+from automation.storage import artifact_formats, json_store
+
+ROWS = [
+    {"title": "Engineer", "company": "Acme", "description": "x" * 200, "stack": ["python"]},
+    {"title": "Analyst", "company": "Beta", "score": None},
+    {"title": "Manager"},
+]
+
+
+@pytest.fixture
+def base(tmp_path, monkeypatch):
+    path = str(tmp_path / "json-store")
+    monkeypatch.setattr(json_store, "_base_dir", lambda: path)
+    return path
+
+
+@pytest.mark.parametrize("fmt", ["jsonl", "gzip", "zstd", "columnar"])
+def test_round_trip_and_projection(base, fmt):
+    path = json_store.write_jsonl("enriched", "20260101_080000", iter(ROWS), fmt=fmt)
+    assert os.path.exists(path)
+    assert list(json_store.read_artifact("20260101_080000", "enriched")) == ROWS
+    projected = list(json_store.read_artifact("20260101_080000", "enriched", fields=["company", "title"]))
+    assert projected == [{"title": "Engineer", "company": "Acme"}, {"title": "Analyst", "company": "Beta"}, {"title": "Manager"}]
+    info = json_store.get_run("20260101_080000")["artifacts"][os.path.basename(path)]
+    assert info["count"] == 3 and info["bytes"] == os.path.getsize(path)
+
+
+def test_gzip_is_plain_gzip_jsonl(base):
+    path = json_store.write_jsonl("jobs", "20260101_080000", ROWS, fmt="gzip")
+    assert path.endswith(".jsonl.gz")
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        assert len(f.read().splitlines()) == 3
+
+
+def test_pure_python_columns_decode_only_requested_fields(tmp_path):
+    path = str(tmp_path / "rows.cols")
+    artifact_formats.write_items(path, ROWS, "cols")
+    assert artifact_formats.format_for_path(path) == "cols"
+    assert list(artifact_formats.read_items(path, fields=["score"])) == [{}, {"score": None}, {}]
+
+
+def test_parquet_keeps_nulls_and_mixed_type_columns(tmp_path):
+    pytest.importorskip("pyarrow")
+    rows = ROWS + [
+        {"title": 7, "score": 0.5, "meta": {"a": 1}},
+        {"title": None, "stack": ["go", 3], "meta": {"b": [True]}},
+    ]
+    path = str(tmp_path / "rows.parquet")
+    assert artifact_formats.write_items(path, rows, "parquet") == 5
+    assert list(artifact_formats.read_items(path)) == rows
+    assert list(artifact_formats.read_items(path, fields=["score", "missing"])) == [{}, {"score": None}, {}, {"score": 0.5}, {}]
+
+
+def test_rewrite_in_another_format_replaces_artifact(base):
+    first = json_store.write_jsonl("scores", "20260101_080000", ROWS)
+    second = json_store.write_jsonl("scores", "20260101_080000", ROWS[:1], fmt="gzip")
+    assert not os.path.exists(first)
+    assert list(json_store.get_run("20260101_080000")["artifacts"]) == [os.path.basename(second)]
+    assert list(json_store.read_artifact("20260101_080000", "scores")) == ROWS[:1]
@@ -0,0 +1,81 @@
+"""
+Append-only manifest for json_store.
+"""
+
+import json
+import os
+
+import pytest
+
+from automation.storage import json_store
+
+
+@pytest.fixture
+def base(tmp_path, monkeypatch):
+    path = str(tmp_path / "json-store")
+    monkeypatch.setattr(json_store, "_base_dir", lambda: path)
+    return path
+
+
+def _manifest_lines(base):
+    with open(os.path.join(base, json_store.MANIFEST_NAME), "r", encoding="utf-8") as f:
+        return [line for line in f.read().splitlines() if line]
+
+
+def test_writes_append_records_and_reader_locates_runs(base):
+    json_store.write_run("20260101_080000", {"ok": True})
+    path = json_store.write_jsonl("jobs", "20260101_080000", [{"a": 1}, {"a": 2}])
+    json_store.write_run("20260102_080000", {"ok": True})
+
+    assert json_store.list_runs() == ["20260101_080000", "20260102_080000"]
+    assert json_store.locate("20260101_080000", "jobs.jsonl") == path
+    assert json_store.locate("20260102_080000", "jobs.jsonl") is None
+    info = json_store.get_run("20260101_080000")
+    assert info["artifacts"]["jobs.jsonl"]["bytes"] == os.path.getsize(path)
+    assert info["artifacts"]["jobs.jsonl"]["count"] == 2
+    assert info["bytes"] == sum(os.path.getsize(os.path.join(info["path"], n)) for n in info["artifacts"])
+    assert len(_manifest_lines(base)) == 3
+    assert not os.path.exists(os.path.join(base, "index.json"))
+
+
+def test_torn_last_line_is_skipped_and_repaired(base):
+    json_store.write_run("20260101_080000", {})
+    with open(os.path.join(base, json_store.MANIFEST_NAME), "ab") as f:
+        f.write(b'{"op":"run","run_ts":"2026')  # crash mid-append
+    assert json_store.list_runs() == ["20260101_080000"]
+    json_store.write_run("20260102_080000", {})
+    assert json_store.list_runs() == ["20260101_080000", "20260102_080000"]
+
+
+def test_prune_records_deletes_and_compacts(base):
+    for day in range(1, 5):
+        ts = f"2020010{day}_080000"
+        json_store.write_run(ts, {})
+        json_store.write_jsonl("jobs", ts, [{}])
+    result = json_store.prune({"retention": {"days": 1, "keep_latest_n_runs": 2}})
+    assert result["deleted_runs"] == ["20200101_080000", "20200102_080000"]
+    assert json_store.list_runs() == ["20200103_080000", "20200104_080000"]
+    assert not os.path.exists(os.path.join(base, "20200101_080000"))
+    # Compacted: one record per live artifact, no delete records left
+    records = [json.loads(line) for line in _manifest_lines(base)]
+    assert len(records) == 4 and all(r["op"] != "delete" for r in records)
+
+
+def test_prune_handles_same_second_run_suffix(base):
+    for ts in ("20200101_080000", "20200101_080000_2", "20200102_080000", "20200103_080000"):
+        json_store.write_run(ts, {})
+        json_store.write_jsonl("jobs", ts, [{}])
+    result = json_store.prune({"retention": {"days": 1, "keep_latest_n_runs": 1}})
+    assert result["deleted_runs"] == ["20200101_080000", "20200101_080000_2", "20200102_080000"]
+    assert json_store.list_runs() == ["20200103_080000"]
+
+
+def test_legacy_store_is_migrated_once(base):
+    run_dir = os.path.join(base, "20260101_080000")
+    os.makedirs(run_dir)
+    with open(os.path.join(run_dir, "summary.json"), "w", encoding="utf-8") as f:
+        f.write("{}")
+    with open(os.path.join(base, "index.json"), "w", encoding="utf-8") as f:
+        json.dump(["20260101_080000"], f)
+    assert json_store.list_runs() == ["20260101_080000"]
+    assert json_store.get_run("20260101_080000")["artifacts"]["summary.json"]["bytes"] == 2
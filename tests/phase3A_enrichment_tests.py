@@ -6,8 +6,11 @@ from automation.enrichment.scripts.enrichment import (
     detect_role_tags,
     is_remote_friendly,
     extract_features,
+    extract_features_batch,
+    SeniorityClassifier,
 )
-from automation.enrichment.scripts.scoring import score_job, bucket_score
+from automation.enrichment.scripts import scoring
+from automation.enrichment.scripts.scoring import score_job, bucket_score, score_jobs
 
 
 def test_normalize_title():
@@ -99,3 +102,140 @@ def test_integration_determinism():
     assert scored[0]["bucket"] in {"Strong", "Exceptional"}
     # Second should be lower due to fewer matching features
     assert scored[1]["score"] <= scored[0]["score"]
+
+
+def test_extract_features_batch_matches_single_and_preserves_order():
+    config = {
+        "enrichment": {
+            "keywords": {"role": ["Engineer"], "stack": ["Python", "AWS"]},
+            "remote_aliases": ["remote"],
+            "seniority_patterns": {r"\b(sr|senior)\b": "Senior"},
+        }
+    }
+    jobs = [
+        {"title": f"{'Senior ' if i % 3 == 0 else ''}Python Engineer {i}", "description": "AWS, remote" if i % 2 else ""}
+        for i in range(25)
+    ]
+    expected = [extract_features(j, config) for j in jobs]
+    # Inline path
+    assert extract_features_batch(jobs, config, max_workers=1) == expected
+    # Process pool path: several chunks across workers, same order
+    assert extract_features_batch(jobs, config, max_workers=2, chunk_size=4) == expected
+    assert extract_features_batch([], config) == []
+
+
+def test_extract_features_batch_spawns_workers(monkeypatch):
+    from automation.enrichment.scripts import enrichment
+
+    contexts = []
+
+    class RecordingPool(enrichment.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            contexts.append(kwargs.get("mp_context"))
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(enrichment, "ProcessPoolExecutor", RecordingPool)
+    jobs = [{"title": f"Engineer {i}"} for i in range(4)]
+    assert extract_features_batch(jobs, {}, max_workers=2, chunk_size=2) == [extract_features(j, {}) for j in jobs]
+    # Forking a multi-threaded server (in-process dashboard runs) can deadlock
+    assert [c.get_start_method() for c in contexts] == ["spawn"]
+
+
+def test_compiled_path_normalizes_each_job_once(monkeypatch):
+    from automation.enrichment.scripts import enrichment
+
+    cfg = {
+        "enrichment": {
+            "keywords": {"role": ["Engineer"], "stack": ["Python", " AWS "]},
+            "remote_aliases": ["Remote"],
+            "seniority_patterns": {r"\bsenior\b": "Senior"},
+        }
+    }
+    compiled = enrichment.compile_config(cfg)
+    jobs = [
+        {"title": "Senior Python Engineer", "description": "Remote, AWS"},
+        {"title": "Data Analyst", "description": None},
+        {"title": "", "description": "python"},
+    ]
+    expected = [
+        {
+            "stack_tags": detect_stack(j["title"], j["description"], ["Python", " AWS "]),
+            "role_tags": detect_role_tags(j["title"], ["Engineer"]),
+            "remote_friendly": is_remote_friendly(j["title"], j["description"], ["Remote"]),
+            "seniority": infer_seniority(j["title"], {r"\bsenior\b": "Senior"}),
+        }
+        for j in jobs
+    ]
+    calls = {"terms": 0, "title": 0}
+    real_title = enrichment.normalize_title
+
+    def count_terms(values):
+        calls["terms"] += 1
+        return values
+
+    def count_title(value):
+        calls["title"] += 1
+        return real_title(value)
+
+    monkeypatch.setattr(enrichment, "normalize_terms", count_terms)
+    monkeypatch.setattr(enrichment, "normalize_title", count_title)
+    out = [enrichment.extract_features_compiled(j, compiled) for j in jobs]
+    assert [{k: o[k] for k in expected[0]} for o in out] == expected
+    assert calls == {"terms": 0, "title": 2 * len(jobs)}
+
+
+def test_seniority_classifier_first_pattern_in_order_wins():
+    patterns = {r"\bstaff\b": "Staff", r"\blead\b": "Lead", r"^principal": "Principal"}
+    clf = SeniorityClassifier(patterns)
+    # "lead" appears first in the title but "staff" is earlier in config order
+    assert clf.classify("Lead / Staff Engineer") == "Staff"
+    assert clf.classify("Principal Engineer") == "Principal"
+    assert clf.classify("Engineer, Principal") == "Mid"
+    # Default heuristics still apply after configured patterns
+    assert clf.classify("Sr Engineer") == "Senior"
+    assert clf.classify("") == "Mid"
+
+
+def test_seniority_classifier_memoizes_by_normalized_title():
+    clf = SeniorityClassifier({r"\bsenior\b": "Senior"})
+    assert clf.classify("  Senior   Engineer ") == "Senior"
+    assert clf.classify("senior engineer") == "Senior"
+    assert len(clf._memo) == 1
+
+
+def test_seniority_classifier_backreference_patterns_fall_back():
+    clf = SeniorityClassifier({r"(a)\1": "Double"})
+    assert clf.classify("aa engineer") == "Double"
+    assert clf.classify("a engineer") == "Mid"
+
+
+def _scoring_rows():
+    rows = []
+    for i in range(60):
+        rows.append(
+            {
+                "role_tags": ["engineer"] if i % 2 else [],
+                "stack_tags": ["python", "aws"][: i % 3],
+                "remote_friendly": i % 5 == 0,
+                "custom": (i % 7) / 3.0,
+            }
+        )
+    return rows
+
+
+def test_score_jobs_is_bit_identical_to_score_job():
+    rows = _scoring_rows()
+    weights = {"role_fit": 0.1, "stack": 0.7, "remote": 0.2, "custom": -0.3, "missing": 0.05}
+    thresholds = {"exceptional": 0.7, "strong": 0.5, "moderate": 0.3}
+    expected = [score_job(e, weights, thresholds) for e in rows]
+    got = score_jobs(rows, weights, thresholds)
+    assert [g["bucket"] for g in got] == [e["bucket"] for e in expected]
+    assert [g["score"].hex() for g in got] == [e["score"].hex() for e in expected]
+    assert score_jobs(rows[:3], {}, None) == [score_job(e, {}, None) for e in rows[:3]]
+
+
+def test_score_jobs_pure_python_fallback(monkeypatch):
+    monkeypatch.setattr(scoring, "np", None)
+    rows = _scoring_rows()
+    weights = {"role_fit": 0.5, "stack": 0.3, "remote": 0.2}
+    assert score_jobs(rows, weights) == [score_job(e, weights) for e in rows]
@@ -0,0 +1,85 @@
+"""
+What-if scoring sweep over stored enriched features.
+"""
+
+import json
+
+import pytest
+
+from automation.enrichment.scripts import scoring, sweep
+from automation.storage import sqlite_store
+
+
+def _rows():
+    return [
+        {"url": "https://example.com/1", "role_tags": ["engineer"], "stack_tags": ["python"], "remote_friendly": True},
+        {"url": "https://example.com/2", "role_tags": ["engineer"], "stack_tags": [], "remote_friendly": False},
+        {"url": "https://example.com/3", "role_tags": [], "stack_tags": ["aws"], "remote_friendly": True},
+    ]
+
+
+def test_expand_grid_cartesian_and_limits():
+    grid = {"weights": {"role_fit": [0.4, 0.6], "stack": 0.3}, "thresholds": {"strong": [0.5, 0.7]}}
+    candidates = sweep.expand_grid(grid)
+    assert len(candidates) == 4
+    assert candidates[0] == {"weights": {"role_fit": 0.4, "stack": 0.3}, "thresholds": {"strong": 0.5}}
+    with pytest.raises(ValueError):
+        sweep.expand_grid(grid, max_candidates=3)
+    with pytest.raises(ValueError):
+        sweep.expand_grid({"candidates": []})
+
+
+def test_sweep_matches_score_job_buckets_and_reports_rank_changes():
+    rows = _rows()
+    baseline = {"weights": {"role_fit": 0.5, "stack": 0.3, "remote": 0.2}, "thresholds": {"exceptional": 0.8, "strong": 0.6, "moderate": 0.4}}
+    candidate = {"weights": {"role_fit": 0.1, "stack": 0.1, "remote": 0.8}, "thresholds": {"exceptional": 0.9, "strong": 0.6, "moderate": 0.4}}
+    out = sweep.sweep(rows, [candidate], baseline, top_n=2)
+
+    expected = [scoring.score_job(r, candidate["weights"], candidate["thresholds"])["bucket"] for r in rows]
+    result = out["results"][0]
+    assert sum(result["bucket_counts"].values()) == 3
+    for bucket in sweep.BUCKETS:
+        assert result["bucket_counts"][bucket] == expected.count(bucket)
+    assert out["baseline"]["bucket_counts"]["Exceptional"] == 1
+    # Remote-heavy weights move job 3 above job 2
+    assert result["top"] == ["https://example.com/1", "https://example.com/3"]
+    assert result["rank_changes"] == 2 and result["max_rank_shift"] == 1
+
+
+def test_sweep_run_reads_latest_enriched_run(tmp_path, monkeypatch):
+    monkeypatch.setattr(sqlite_store, "_db_path", lambda: str(tmp_path / "jobs.db"))
+    sqlite_store.init_schema()
+    for ts in ("20260101_000000", "20260102_000000"):
+        sqlite_store.insert_run({"run_ts": ts, "timestamp_utc": "2026-01-01T00:00:00+00:00"})
+        jobs = [dict(r, source="sample", title="t", location="Remote", company="c", posted_date="") for r in _rows()]
+        sqlite_store.insert_jobs(ts, jobs)
+        sqlite_store.insert_enriched(ts, jobs if ts.endswith("2_000000") else jobs[:1])
+
+    run_ts, rows = sqlite_store.load_enriched()
+    assert run_ts == "20260102_000000" and len(rows) == 3
+    assert all("job_id" in r for r in rows)
+
+    grid = {"weights": {"remote": [0.5, 1.0]}}
+    out = sweep.sweep_run(grid, cfg={"scoring": {"weights": {"remote": 1.0}}})
+    assert out["run_ts"] == "20260102_000000"
+    assert out["jobs"] == 3 and len(out["results"]) == 2
+
+    grid_path = tmp_path / "grid.json"
+    grid_path.write_text(json.dumps(grid), encoding="utf-8")
+    assert sweep.main(["--grid", str(grid_path), "--run-ts", "20260101_000000"]) == 0
+
+
+def test_partial_candidates_keep_baseline_weights_and_thresholds():
+    rows = _rows()
+    baseline = {"weights": {"role_fit": 0.5, "stack": 0.3, "remote": 0.2}, "thresholds": {"exceptional": 0.95, "strong": 0.6, "moderate": 0.4}}
+    # Re-stating the baseline value for one knob is a no-op
+    same = sweep.sweep(rows, sweep.expand_grid({"weights": {"stack": [0.3]}}), baseline)["results"][0]
+    assert same["weights"] == baseline["weights"] and same["thresholds"] == baseline["thresholds"]
+    assert same["bucket_changes"] == same["rank_changes"] == 0
+
+    out = sweep.sweep(rows, sweep.expand_grid({"thresholds": {"strong": [0.9]}}), baseline)["results"][0]
+    assert out["weights"] == baseline["weights"]
+    assert out["thresholds"] == {"exceptional": 0.95, "strong": 0.9, "moderate": 0.4}
+    expected = [scoring.score_job(r, baseline["weights"], out["thresholds"])["bucket"] for r in rows]
+    for bucket in sweep.BUCKETS:
+        assert out["bucket_counts"][bucket] == expected.count(bucket)
@@ -0,0 +1,117 @@
+"""
+Bulk run ingestion for sqlite_store.
+"""
+
+import os
+import sqlite3
+import sys
+
+import pytest
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+_SCRIPTS_DIR = os.path.join(_REPO_ROOT, "automation", "job-discovery", "scripts")
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+import job_discovery_v1 as orchestrator  # type: ignore
+from automation.storage import sqlite_store
+
+
+def _jobs(n):
+    return [
+        {
+            "title": f"Engineer {i}",
+            "location": "Remote",
+            "company": "Acme",
+            "source": "sample",
+            "url": f"https://example.com/jobs/{i}",
+            "posted_date": "2026-01-09",
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "jobs.db")
+    monkeypatch.setattr(sqlite_store, "_db_path", lambda: path)
+    sqlite_store.init_schema()
+    return path
+
+
+def _count(path, table):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_ingest_run_writes_all_tables_in_one_call(db_path):
+    jobs = _jobs(50)
+    enriched = [dict(j, stack_tags=["python"]) for j in jobs]
+    scores = [dict(j, score=0.5, bucket="Moderate") for j in jobs]
+    run_ts = sqlite_store.ingest_run({"timestamp_utc": "2026-01-09T08:00:00+00:00"}, jobs, enriched, scores)
+    assert run_ts == "20260109_080000"
+    assert [_count(db_path, t) for t in ("runs", "jobs", "enriched", "scores")] == [1, 50, 50, 50]
+
+    # Same job_id scheme as the per-table inserts and the incremental state
+    conn = sqlite3.connect(db_path)
+    try:
+        ids = {r[0] for r in conn.execute("SELECT job_id FROM scores")}
+        assert sqlite_store.job_id_for(jobs[0]) in ids
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    finally:
+        conn.close()
+
+    # Re-ingesting the same run is idempotent
+    sqlite_store.ingest_run({"run_ts": run_ts}, jobs, enriched, scores)
+    assert _count(db_path, "jobs") == 50
+
+
+def test_reingest_replaces_run_rows_without_orphans(db_path):
+    jobs = _jobs(5)
+    scores = [dict(j, score=0.5, bucket="Moderate") for j in jobs]
+    sqlite_store.ingest_run({"run_ts": "r1"}, jobs, jobs, scores)
+    sqlite_store.ingest_run({"run_ts": "r1"}, jobs[:2], jobs[:2], scores[:2])
+    assert [_count(db_path, t) for t in ("runs", "jobs", "enriched", "scores")] == [1, 2, 2, 2]
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("PRAGMA foreign_key_check").fetchall() == []
+    finally:
+        conn.close()
+
+
+def test_prune_handles_same_second_run_suffix(db_path):
+    for ts in ("20200101_080000", "20200101_080000_2", "20200102_080000"):
+        sqlite_store.ingest_run({"run_ts": ts}, _jobs(1))
+    result = sqlite_store.prune({"retention": {"days": 1, "keep_latest_n_runs": 1}})
+    assert result["deleted_runs"] == ["20200101_080000", "20200101_080000_2"]
+    assert _count(db_path, "runs") == 1 and _count(db_path, "jobs") == 1
+
+
+def test_ingest_run_is_atomic(db_path):
+    jobs = _jobs(3)
+    bad_scores = [dict(j, score=object(), bucket="Weak") for j in jobs]
+    with pytest.raises(sqlite3.Error):
+        sqlite_store.ingest_run({"run_ts": "20260109_080000"}, jobs, None, bad_scores)
+    assert _count(db_path, "runs") == 0 and _count(db_path, "jobs") == 0
+
+
+def test_per_table_inserts_still_work(db_path):
+    jobs = _jobs(2)
+    sqlite_store.insert_run({"run_ts": "r1"})
+    sqlite_store.insert_jobs("r1", jobs)
+    sqlite_store.insert_enriched("r1", jobs)
+    sqlite_store.insert_scores("r1", [dict(j, score=1.0, bucket="Exceptional") for j in jobs])
+    assert [_count(db_path, t) for t in ("jobs", "enriched", "scores")] == [2, 2, 2]
+
+
+def test_main_persists_run_when_enabled(db_path, tmp_path, monkeypatch):
+    jobs = [dict(j, title="Senior Software Engineer") for j in _jobs(3)]
+    monkeypatch.setattr(orchestrator, "iter_discovered_jobs", lambda: list(jobs))
+    monkeypatch.setenv("STORAGE_PERSIST_RUNS", "true")
+    orchestrator.main(["--out-dir", str(tmp_path / "out"), "--enrich"])
+    assert [_count(db_path, t) for t in ("runs", "jobs", "enriched", "scores")] == [1, 3, 3, 3]
+    _, rows = sqlite_store.load_enriched()
+    assert {r["url"] for r in rows} == {j["url"] for j in jobs}
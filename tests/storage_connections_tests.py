@@ -0,0 +1,100 @@
+"""
+Pooled per-thread SQLite connections shared by sqlite_store and the webapp.
+"""
+
+import gc
+import sqlite3
+import threading
+
+import pytest
+
+from automation.storage import connections, sqlite_store
+
+
+@pytest.fixture
+def manager(tmp_path):
+    mgr = connections.ConnectionManager(str(tmp_path / "pool.db"))
+    yield mgr
+    mgr.close_all()
+
+
+def test_connection_reused_per_thread_and_pragmas_applied(manager):
+    conn = manager.connection()
+    assert manager.connection() is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+    seen = []
+    t = threading.Thread(target=lambda: seen.append(manager.connection()))
+    t.start()
+    t.join()
+    assert seen and seen[0] is not conn
+
+
+def test_connections_of_exited_threads_are_released(manager):
+    conn = manager.connection()
+    seen = []
+
+    def worker():
+        c = manager.connection()
+        c.execute("SELECT 1")
+        seen.append(c)
+
+    for _ in range(50):
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+    with pytest.raises(sqlite3.ProgrammingError):
+        seen[0].execute("SELECT 1")
+    del seen
+    gc.collect()
+    assert list(manager._all) == [conn]
+
+
+def test_close_rolls_back_and_keeps_connection_pooled(manager):
+    conn = manager.connection(sqlite3.Row)
+    conn.execute("CREATE TABLE t (x INTEGER)")
+    conn.commit()
+    conn.execute("INSERT INTO t VALUES (1)")
+    conn.close()
+    assert conn.row_factory is None
+    assert manager.connection().execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+
+def test_read_connection_rejects_writes(manager):
+    rw = manager.connection()
+    rw.execute("CREATE TABLE t (x INTEGER)")
+    rw.execute("INSERT INTO t VALUES (1)")
+    rw.commit()
+    ro = manager.read_connection()
+    assert ro is not rw
+    assert ro.execute("SELECT x FROM t").fetchall() == [(1,)]
+    with pytest.raises(sqlite3.OperationalError):
+        ro.execute("INSERT INTO t VALUES (2)")
+
+
+def test_close_all_really_closes(manager):
+    conn = manager.connection()
+    manager.close_all()
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+    assert manager.connection() is not conn
+
+
+def test_get_manager_shared_per_path_and_pragmas(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    try:
+        assert connections.get_manager(path) is connections.get_manager(path)
+        assert connections.get_manager(path, ()) is not connections.get_manager(path)
+    finally:
+        connections.close_all()
+
+
+def test_sqlite_store_restores_foreign_keys_after_ingest(tmp_path, monkeypatch):
+    monkeypatch.setattr(sqlite_store, "_db_path", lambda: str(tmp_path / "jobs.db"))
+    sqlite_store.init_schema()
+    sqlite_store.ingest_run({"run_ts": "r1"}, [{"source": "s", "url": "u"}])
+    conn = sqlite_store._get_conn()
+    assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    with pytest.raises(sqlite3.IntegrityError):
+        sqlite_store.insert_jobs("missing-run", [{"source": "s", "url": "u2"}])
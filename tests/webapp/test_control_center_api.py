@@ -3,10 +3,12 @@ from __future__ import annotations
 import csv
 import json
 import os
+import sqlite3
 import tempfile
 from pathlib import Path
 from subprocess import CompletedProcess
 
+import pytest
 from fastapi.testclient import TestClient
 
 from webapp.backend import app as app_module
@@ -20,6 +22,19 @@ def _write_csv(path: Path, rows: list[dict[str, str]]) -> None:
         writer.writerows(rows)
 
 
+def _write_run_manifest(command: list[str], output_dir: Path, ts: str) -> None:
+    manifest_path = Path(command[command.index("--manifest") + 1])
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    names = {
+        "summary": f"jobs_discovered_{ts}.summary.json",
+        "discovered_csv": f"jobs_discovered_{ts}.csv",
+        "enriched_json": f"jobs_enriched_{ts}.json",
+        "scored_csv": f"jobs_scored_{ts}.csv",
+    }
+    manifest = {"run_ts": ts, "artifacts": {kind: {"path": str(output_dir / name), "rows": 1} for kind, name in names.items()}}
+    manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+
+
 def _make_fake_prompt_subprocess(prompt_path: Path, prompt_text: str = "Prompt body", returncode: int = 0, stdout_suffix: str = ""):
     prompt_path.parent.mkdir(parents=True, exist_ok=True)
     if returncode == 0:
@@ -123,6 +138,7 @@ def test_control_center_api_smoke(monkeypatch, tmp_path: Path):
                 json.dumps({"counts": {"total_discovered": 1, "exported": 1}}),
                 encoding="utf-8",
             )
+            _write_run_manifest(command, output_dir, ts)
             return CompletedProcess(command, 0, stdout="discovery complete\n", stderr="")
 
         if "resume_tailor_v1.py" in command_text:
@@ -133,22 +149,42 @@ def test_control_center_api_smoke(monkeypatch, tmp_path: Path):
 
         return CompletedProcess(command, 1, stdout="", stderr="unexpected command")
 
+    monkeypatch.setattr(app_module, "DISCOVERY_MODE", "subprocess")
     monkeypatch.setattr(app_module, "_run_subprocess", fake_run)
     monkeypatch.setattr(app_module, "generate_artifact", lambda prompt_text, kind: generation.ArtifactResult(ok=True, content=f"Finished {kind} body"))
 
+    # A newer artifact from another run must not be picked up (resolved via the run manifest)
+    _write_csv(
+        output_dir / "jobs_scored_29991231_000000.csv",
+        [{"title": "Other", "location": "Remote", "company": "Other", "source": "sample", "url": "https://example.com/other", "posted_date": "2026-07-20", "score": "0.1", "bucket": "Weak"}],
+    )
+
     with TestClient(app_module.app) as client:
         health = client.get("/api/health")
         assert health.status_code == 200
 
-        run = client.post("/api/runs/job-discovery")
+        run = client.post("/api/runs/job-discovery?wait=true")
         assert run.status_code == 200
         assert run.json()["mirrored_jobs"] == 1
+        manifest = client.get(f"/api/runs/{run.json()['run_id']}/artifacts")
+        assert manifest.status_code == 200
+        assert manifest.json()["artifacts"]["scored_csv"]["path"].endswith("jobs_scored_20260720_210000.csv")
 
         jobs = client.get("/api/jobs")
         assert jobs.status_code == 200
         payload = jobs.json()
         assert len(payload) == 1
         assert payload[0]["bucket"] == "Exceptional"
+        assert client.get("/api/jobs?bucket=Weak,Moderate").json() == []
+        slim = client.get("/api/jobs?min_score=0.8&include_raw=false&limit=1")
+        assert "raw_json" not in slim.json()[0]
+        assert slim.headers["X-Next-Before-Id"] == str(payload[0]["id"])
+
+        found = client.get("/api/jobs/search?q=platf*")
+        assert found.status_code == 200
+        assert [j["id"] for j in found.json()] == [payload[0]["id"]]
+        assert client.get("/api/jobs/search?q=kubernetes&seniority=junior").json() == []
+        assert client.get("/api/jobs/search").status_code == 400
 
         job_id = payload[0]["id"]
 
@@ -273,6 +309,7 @@ def test_resume_prompt_failure_is_sanitized(monkeypatch, tmp_path: Path):
             )
             (output_dir / f"jobs_enriched_{ts}.json").write_text(json.dumps([{"title": "Senior Platform Engineer", "company": "Acme", "location": "Remote", "url": "https://example.com/job/1"}]), encoding="utf-8")
             (output_dir / f"jobs_discovered_{ts}.summary.json").write_text(json.dumps({"counts": {"total_discovered": 1, "exported": 1}}), encoding="utf-8")
+            _write_run_manifest(command, output_dir, ts)
             return CompletedProcess(command, 0, stdout="discovery complete\n", stderr="")
 
         if "resume_tailor_v1.py" in command_text:
@@ -280,11 +317,12 @@ def test_resume_prompt_failure_is_sanitized(monkeypatch, tmp_path: Path):
 
         return CompletedProcess(command, 1, stdout="", stderr="unexpected command")
 
+    monkeypatch.setattr(app_module, "DISCOVERY_MODE", "subprocess")
     monkeypatch.setattr(app_module, "_run_subprocess", fake_run)
     monkeypatch.setattr(app_module, "generate_artifact", lambda prompt_text, kind: generation.ArtifactResult(ok=True, content=f"Finished {kind} body"))
 
     with TestClient(app_module.app) as client:
-        assert client.post("/api/runs/job-discovery").status_code == 200
+        assert client.post("/api/runs/job-discovery?wait=true").status_code == 200
         job_id = client.get("/api/jobs").json()[0]["id"]
         resume = client.post("/api/prompts/resume", json={"job_id": job_id, "no_sources": True})
         assert resume.status_code == 200
@@ -293,3 +331,171 @@ def test_resume_prompt_failure_is_sanitized(monkeypatch, tmp_path: Path):
         assert body["error"]["code"] == "prompt_build_failed"
         assert "raw stdout leak" not in json.dumps(body)
         assert "raw stderr leak" not in json.dumps(body)
+
+
+def test_scoring_sweep_endpoint(monkeypatch, tmp_path: Path):
+	from automation.storage import sqlite_store
+
+	monkeypatch.setattr(app_module, "DB_PATH", tmp_path / "webapp.db")
+	monkeypatch.setattr(sqlite_store, "_db_path", lambda: str(tmp_path / "store.db"))
+	sqlite_store.init_schema()
+	ts = "20260720_210000"
+	job = {"title": "Senior Platform Engineer", "location": "Remote", "company": "Acme", "source": "sample", "url": "https://example.com/job/1", "posted_date": "2026-07-20", "role_tags": ["engineer"], "remote_friendly": True}
+	sqlite_store.insert_run({"run_ts": ts, "timestamp_utc": "2026-07-20T21:00:00+00:00"})
+	sqlite_store.insert_jobs(ts, [job])
+	sqlite_store.insert_enriched(ts, [job])
+	# Pin the configured baseline; candidates are merged over it
+	baseline = {"weights": {"role_fit": 0.4, "stack": 0.4, "remote": 0.2}, "thresholds": {"exceptional": 0.85, "strong": 0.7, "moderate": 0.5, "weak": 0.0}}
+	monkeypatch.setattr(generation.config, "to_dict", lambda: {"scoring": baseline})
+
+	with TestClient(app_module.app) as client:
+		res = client.post("/api/scoring/sweep", json={"weights": {"role_fit": [0.5, 1.0], "remote": 0.5}})
+		assert res.status_code == 200
+		payload = res.json()
+		assert payload["run_ts"] == ts
+		assert len(payload["results"]) == 2
+		first = payload["results"][0]
+		assert first["weights"] == {"role_fit": 0.5, "stack": 0.4, "remote": 0.5}
+		assert first["bucket_counts"] == {"Exceptional": 0, "Strong": 1, "Moderate": 0, "Weak": 0}
+
+		bad = client.post("/api/scoring/sweep", json={"candidates": []})
+		assert bad.status_code == 400
+
+
+def test_read_endpoints_use_read_only_pooled_connection(monkeypatch, tmp_path: Path):
+	monkeypatch.setattr(app_module, "DB_PATH", tmp_path / "pool.db")
+	app_module.init_db()
+	conn = app_module.connect_db()
+	assert conn is app_module.connect_db()
+	assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+	ro = app_module.connect_db(readonly=True)
+	with pytest.raises(sqlite3.OperationalError):
+		ro.execute("INSERT INTO runs(run_type, status, started_at) VALUES('x', 'queued', 'now')")
+	ro.close()
+
+	with TestClient(app_module.app) as client:
+		assert client.get("/api/runs").json() == []
+		assert client.get("/api/jobs").json() == []
+
+
+def test_in_process_discovery_mirrors_returned_rows(monkeypatch, tmp_path: Path):
+	from webapp.backend import pipeline
+	from webapp.backend.schemas import DiscoveryResult
+
+	monkeypatch.setattr(app_module, "OUTPUT_DIR", tmp_path / "output")
+	monkeypatch.setattr(app_module, "DB_PATH", tmp_path / "inprocess.db")
+	monkeypatch.setattr(app_module, "DISCOVERY_MODE", "inprocess")
+	monkeypatch.setattr(app_module, "_run_subprocess", lambda command: pytest.fail("no subprocess expected"))
+	row = {"title": "Senior Platform Engineer", "location": "Remote", "company": "Acme", "source": "sample", "url": "https://example.com/job/1", "posted_date": "2026-07-20", "skills": ["Python"]}
+	calls = []
+
+	def fake_run_discovery(out_dir, enrich=True, progress=None, manifest_path=None):
+		calls.append((out_dir, enrich, manifest_path))
+		return DiscoveryResult(
+			ok=True,
+			run_ts="20260720_210000",
+			jobs=[row],
+			enriched=[row],
+			scored=[dict(row, score=0.85, bucket="Exceptional")],
+			artifacts={"summary": str(tmp_path / "output" / "summary.json"), "discovered_csv": None},
+			stdout="Summary: ok\n",
+		)
+
+	monkeypatch.setattr(pipeline, "run_discovery", fake_run_discovery)
+
+	with TestClient(app_module.app) as client:
+		run = client.post("/api/runs/job-discovery?wait=true")
+		assert run.status_code == 200
+		assert run.json()["mirrored_jobs"] == 1
+		assert calls == [(tmp_path / "output", True, tmp_path / "output" / "manifests" / f"run_{run.json()['run_id']}.json")]
+		job = client.get("/api/jobs").json()[0]
+		assert job["score"] == 0.85 and job["bucket"] == "Exceptional"
+		assert job["raw_json"]["skills"] == ["Python"] and "score" not in job["raw_json"]
+		assert client.get("/api/runs").json()[0]["status"] == "success"
+
+		monkeypatch.setattr(pipeline, "run_discovery", lambda out_dir, enrich=True, progress=None, manifest_path=None: DiscoveryResult(ok=False, stderr="Traceback"))
+		failed = client.post("/api/runs/job-discovery?wait=true")
+		assert failed.status_code == 500
+		assert failed.json()["detail"]["stderr"] == "Traceback"
+
+
+def test_queued_discovery_reports_status_and_streams_progress(monkeypatch, tmp_path: Path):
+	import threading
+
+	from webapp.backend import pipeline
+	from webapp.backend.schemas import DiscoveryResult
+
+	monkeypatch.setattr(app_module, "OUTPUT_DIR", tmp_path / "output")
+	monkeypatch.setattr(app_module, "DB_PATH", tmp_path / "queue.db")
+	monkeypatch.setattr(app_module, "DISCOVERY_MODE", "inprocess")
+	release = threading.Event()
+
+	def slow_run_discovery(out_dir, enrich=True, progress=None, manifest_path=None):
+		progress("fetch", {"total": 2, "per_source": {"lever": 1, "indeed": 1}})
+		release.wait(5)
+		progress("score", {"scored": 0, "buckets": {}})
+		return DiscoveryResult(ok=True, run_ts="20260720_210000")
+
+	monkeypatch.setattr(pipeline, "run_discovery", slow_run_discovery)
+
+	with TestClient(app_module.app) as client:
+		queued = client.post("/api/runs/job-discovery")
+		assert queued.status_code == 202
+		run_id = queued.json()["run_id"]
+		assert queued.json()["events_url"] == f"/api/runs/{run_id}/events"
+		assert client.get(f"/api/runs/{run_id}").json()["status"] in ("queued", "running")
+		# The API stays responsive while the run is in flight
+		assert client.get("/api/health").status_code == 200
+
+		release.set()
+		with client.stream("GET", f"/api/runs/{run_id}/events") as stream:
+			body = "".join(stream.iter_text())
+		stages = [json.loads(line[len("data: "):])["stage"] for line in body.splitlines() if line.startswith("data: {\"seq\"")]
+		assert stages == ["started", "fetch", "score", "mirror", "finished"]
+		assert "event: end" in body
+
+		status = client.get(f"/api/runs/{run_id}").json()
+		assert status["status"] == "success" and status["stage"] == "finished"
+		assert status["result"]["mirrored_jobs"] == 0
+		assert client.get("/api/runs/999/events").status_code == 404
+
+
+def test_activity_cursor_and_category_filter(monkeypatch, tmp_path: Path):
+	log_path = tmp_path / "events.jsonl"
+	log_path.write_text(
+		"".join(json.dumps({"category": c, "event": str(i)}) + "\n" for i, c in enumerate(["resume", "outreach", "resume"])),
+		encoding="utf-8",
+	)
+	monkeypatch.setattr(app_module, "DB_PATH", tmp_path / "activity.db")
+	monkeypatch.setattr(app_module, "LOG_PATH", log_path)
+
+	with TestClient(app_module.app) as client:
+		latest = client.get("/api/activity?limit=2")
+		assert [e["event"] for e in latest.json()] == ["1", "2"]
+		cursor = latest.headers["X-Activity-Cursor"]
+		assert client.get("/api/activity?category=resume").json() == [{"category": "resume", "event": "0"}, {"category": "resume", "event": "2"}]
+
+		with log_path.open("a", encoding="utf-8") as f:
+			f.write(json.dumps({"category": "outreach", "event": "3"}) + "\n")
+		newer = client.get(f"/api/activity?since={cursor}")
+		assert newer.json() == [{"category": "outreach", "event": "3"}]
+		assert client.get(f"/api/activity?since={newer.headers['X-Activity-Cursor']}").json() == []
+
+
+def test_search_unavailable_without_fts5(monkeypatch, tmp_path: Path):
+	monkeypatch.setattr(app_module, "DB_PATH", tmp_path / "nofts.db")
+	monkeypatch.setattr(app_module, "SEARCH_UNAVAILABLE", None)
+
+	def _no_fts5(conn):
+		raise sqlite3.OperationalError("no such module: fts5")
+
+	monkeypatch.setattr(app_module.job_queries, "ensure_search_index", _no_fts5)
+	with TestClient(app_module.app) as client:
+		health = client.get("/api/health")
+		assert health.status_code == 200
+		assert health.json()["search"] is False
+		assert client.get("/api/jobs").json() == []
+		resp = client.get("/api/jobs/search?q=platform")
+		assert resp.status_code == 503
+		assert "fts5" in resp.json()["detail"]
@@ -0,0 +1,90 @@
+"""
+Tail-seeking reads and the ring buffer behind GET /api/activity.
+"""
+
+import json
+
+import pytest
+
+from webapp.backend import activity
+
+
+def _append(path, *events, newline=True):
+    with path.open("ab") as f:
+        for i, event in enumerate(events):
+            f.write(json.dumps(event).encode("utf-8"))
+            if newline or i < len(events) - 1:
+                f.write(b"\n")
+
+
+def _events(n, start=0):
+    return [{"seq": i, "category": "resume" if i % 2 else "outreach", "pad": "x" * 40} for i in range(start, start + n)]
+
+
+def test_read_tail_walks_blocks_backwards(tmp_path):
+    log = tmp_path / "events.jsonl"
+    _append(log, *_events(50))
+    events, cursor = activity.read_tail(log, 5, block_size=64)
+    assert [e["seq"] for e in events] == [45, 46, 47, 48, 49]
+    assert cursor == log.stat().st_size
+
+    resume, _ = activity.read_tail(log, 3, {"resume"}, block_size=64)
+    assert [e["seq"] for e in resume] == [45, 47, 49]
+    everything, _ = activity.read_tail(log, 1000, block_size=64)
+    assert [e["seq"] for e in everything] == list(range(50))
+    assert activity.read_tail(tmp_path / "missing.jsonl", 5) == ([], 0)
+
+
+def test_partial_last_line_is_left_for_the_next_read(tmp_path):
+    log = tmp_path / "events.jsonl"
+    _append(log, *_events(3))
+    complete = log.stat().st_size
+    _append(log, {"seq": 3, "category": "resume"}, newline=False)
+    events, cursor = activity.read_tail(log, 10, block_size=16)
+    assert [e["seq"] for e in events] == [0, 1, 2] and cursor == complete
+
+    with log.open("ab") as f:
+        f.write(b"\n")
+    newer, cursor = activity.read_since(log, cursor, 10)
+    assert [e["seq"] for e in newer] == [3] and cursor == log.stat().st_size
+
+
+def test_read_since_pages_forward_and_recovers_from_truncation(tmp_path):
+    log = tmp_path / "events.jsonl"
+    _append(log, *_events(6))
+    _, cursor = activity.read_tail(log, 1)
+    _append(log, *_events(5, start=6))
+    page, cursor = activity.read_since(log, cursor, 3)
+    assert [e["seq"] for e in page] == [6, 7, 8]
+    page, cursor = activity.read_since(log, cursor, 3)
+    assert [e["seq"] for e in page] == [9, 10]
+    assert activity.read_since(log, cursor, 3) == ([], cursor)
+
+    log.write_text(json.dumps({"seq": 0, "category": "new"}) + "\n", encoding="utf-8")
+    events, _ = activity.read_since(log, cursor, 3)
+    assert events == [{"seq": 0, "category": "new"}]
+
+
+@pytest.mark.parametrize("capacity", [4, 100])
+def test_ring_buffer_serves_latest_and_since(tmp_path, capacity):
+    log = tmp_path / "events.jsonl"
+    _append(log, *_events(10))
+    buffer = activity.ActivityBuffer(log, capacity=capacity)
+    events, cursor = buffer.latest(3)
+    assert [e["seq"] for e in events] == [7, 8, 9]
+
+    _append(log, *_events(2, start=10))
+    newer, cursor = buffer.since(cursor, 10)
+    assert [e["seq"] for e in newer] == [10, 11]
+    assert buffer.since(cursor, 10) == ([], cursor)
+    # Older than the ring (or filtered past it) falls back to the file
+    assert [e["seq"] for e in buffer.since(0, 2)[0]] == [0, 1]
+    assert [e["seq"] for e in buffer.latest(5, {"outreach"})[0]] == [2, 4, 6, 8, 10]
+
+    log.write_text(json.dumps({"seq": 0, "category": "rotated"}) + "\n", encoding="utf-8")
+    assert buffer.latest(5)[0] == [{"seq": 0, "category": "rotated"}]
+
+
+def test_parse_categories():
+    assert activity.parse_categories(" resume, outreach ,") == {"resume", "outreach"}
+    assert activity.parse_categories("") is None
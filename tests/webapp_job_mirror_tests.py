@@ -0,0 +1,104 @@
+"""
+Streaming artifact merge and bulk load behind the control-center job mirror.
+"""
+
+import csv
+import json
+import sqlite3
+
+from webapp.backend import job_mirror
+
+
+def _job(i, **extra):
+    job = {
+        "title": f"Engineer {i}",
+        "company": "Acme",
+        "location": "Remote",
+        "source": "sample",
+        "url": f"https://example.com/jobs/{i}?utm_source=x",
+        "posted_date": "2026-07-20",
+    }
+    job.update(extra)
+    return job
+
+
+def _write_csv(path, rows):
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def test_aligned_streams_are_merged_in_one_pass():
+    consumed = []
+
+    def tracked(rows, name):
+        for row in rows:
+            consumed.append(name)
+            yield row
+
+    discovered = [_job(i) for i in range(3)]
+    scored = [dict(_job(i), score=str(0.5 + i / 10), bucket="Moderate") for i in range(3)]
+    enriched = [dict(_job(i), url=f"https://example.com/jobs/{i}", skills=["python"]) for i in range(3)]
+    merged = job_mirror.merge_artifact_rows(tracked(discovered, "d"), tracked(scored, "s"), tracked(enriched, "e"))
+
+    first = next(merged)
+    assert consumed == ["d", "s", "e"]  # emitted before reading further
+    assert first["score"] == 0.5 and first["bucket"] == "Moderate"
+    assert first["raw_json"]["skills"] == ["python"]
+    rest = list(merged)
+    assert [r["title"] for r in [first] + rest] == ["Engineer 0", "Engineer 1", "Engineer 2"]
+
+
+def test_misaligned_and_missing_rows_still_join_on_canonical_key():
+    discovered = [_job(0), _job(1), _job(2)]
+    scored = [dict(_job(2), score="0.9", bucket="Exceptional"), dict(_job(0), score="0.1", bucket="Weak")]
+    merged = list(job_mirror.merge_artifact_rows(discovered, scored, None))
+    by_title = {r["title"]: r for r in merged}
+    assert len(merged) == 3
+    assert by_title["Engineer 2"]["score"] == 0.9
+    assert by_title["Engineer 1"]["score"] is None and by_title["Engineer 1"]["bucket"] is None
+    assert by_title["Engineer 0"]["raw_json"] == discovered[0]
+
+
+def test_load_artifacts_streams_csv_and_json_array(tmp_path, monkeypatch):
+    monkeypatch.setattr(job_mirror, "_CHUNK", 7)  # force elements across chunk boundaries
+    rows = [_job(i, description="x" * 30, score_hint=12345) for i in range(5)]
+    _write_csv(tmp_path / "d.csv", [_job(i) for i in range(5)])
+    _write_csv(tmp_path / "s.csv", [dict(_job(i), score="0.7", bucket="Strong") for i in range(5)])
+    (tmp_path / "e.json").write_text(json.dumps(rows, indent=1), encoding="utf-8")
+
+    assert list(job_mirror.iter_json_array(tmp_path / "e.json")) == rows
+    merged = list(
+        job_mirror.load_artifacts(
+            {"discovered_csv": tmp_path / "d.csv", "scored_csv": tmp_path / "s.csv", "enriched_json": tmp_path / "e.json", "summary": None}
+        )
+    )
+    assert [m["raw_json"] for m in merged] == rows
+    assert all(m["bucket"] == "Strong" for m in merged)
+    assert job_mirror.iter_json_array(tmp_path / "missing.json") is None
+    (tmp_path / "obj.json").write_text('{"a": 1}', encoding="utf-8")
+    assert list(job_mirror.iter_json_array(tmp_path / "obj.json")) == []
+
+
+def test_replace_jobs_bulk_loads_in_one_transaction():
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        "CREATE TABLE jobs (id INTEGER PRIMARY KEY, run_id INTEGER, title TEXT, company TEXT, location TEXT,"
+        " source TEXT, url TEXT, posted_date TEXT, score REAL, bucket TEXT, raw_json TEXT)"
+    )
+    rows = job_mirror.from_pipeline_rows([dict(_job(i), score=0.5, bucket="Moderate", skills=["go"]) for i in range(4)])
+    assert job_mirror.replace_jobs(conn, 7, rows) == 4
+    raw = conn.execute("SELECT raw_json FROM jobs WHERE run_id=7 ORDER BY id").fetchone()[0]
+    assert ", " not in raw and json.loads(raw)["skills"] == ["go"] and "score" not in json.loads(raw)
+
+    def failing():
+        yield {"title": "ok"}
+        raise RuntimeError("stream broke")
+
+    try:
+        job_mirror.replace_jobs(conn, 7, failing())
+    except RuntimeError:
+        pass
+    # Rolled back: the previous mirror is intact
+    assert conn.execute("SELECT COUNT(*) FROM jobs WHERE run_id=7").fetchone()[0] == 4
@@ -0,0 +1,141 @@
+"""
+Indexed filtering and keyset pagination behind GET /api/jobs.
+"""
+
+import json
+import sqlite3
+
+import pytest
+
+from webapp.backend import job_queries
+
+_SCHEMA = """
+CREATE TABLE jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id INTEGER NOT NULL,
+    title TEXT, company TEXT, location TEXT, source TEXT, url TEXT,
+    posted_date TEXT, score REAL, bucket TEXT, raw_json TEXT
+);
+"""
+
+
+def _db():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.executescript(_SCHEMA)
+    job_queries.ensure_indexes(conn)
+    buckets = ["Exceptional", "Strong", "Moderate", "Weak"]
+    conn.executemany(
+        "INSERT INTO jobs(run_id, title, company, source, posted_date, score, bucket, raw_json) VALUES (?,?,?,?,?,?,?,?)",
+        [
+            (
+                1 + i % 2,
+                f"Engineer {i}",
+                "Acme" if i % 3 == 0 else "Globex",
+                "remoteok" if i % 2 else "greenhouse",
+                f"2026-01-{1 + i % 28:02d}",
+                i / 40,
+                buckets[i % 4],
+                json.dumps({"n": i}),
+            )
+            for i in range(40)
+        ],
+    )
+    return conn
+
+
+def _ids(rows):
+    return [r["id"] for r in rows]
+
+
+def test_filters_combine_and_keep_id_desc_order():
+    conn = _db()
+    rows = job_queries.fetch_jobs(conn, bucket="Exceptional,Strong", company="acme", min_score=0.2)
+    assert rows and all(r["bucket"] in {"Exceptional", "Strong"} for r in rows)
+    assert all(r["company"] == "Acme" and r["score"] >= 0.2 for r in rows)
+    assert _ids(rows) == sorted(_ids(rows), reverse=True)
+
+    dated = job_queries.fetch_jobs(conn, posted_after="2026-01-10", posted_before="2026-01-12", source="remoteok")
+    assert {r["posted_date"] for r in dated} <= {"2026-01-10", "2026-01-11", "2026-01-12"}
+    assert all(r["source"] == "remoteok" for r in dated)
+
+
+def test_keyset_pagination_walks_all_rows_once():
+    conn = _db()
+    seen, before = [], None
+    while True:
+        page = job_queries.fetch_jobs(conn, limit=7, run_id=1, before_id=before, include_raw=False)
+        if not page:
+            break
+        seen.extend(_ids(page))
+        before = page[-1]["id"]
+    everything = job_queries.fetch_jobs(conn, limit=1000, run_id=1)
+    assert seen == _ids(everything) and len(seen) == 20
+
+
+def test_include_raw_opt_out_skips_raw_json():
+    conn = _db()
+    assert job_queries.fetch_jobs(conn, limit=1)[0]["raw_json"] == {"n": 39}
+    assert "raw_json" not in job_queries.fetch_jobs(conn, limit=1, include_raw=False)[0]
+
+
+def test_filtered_queries_use_indexes():
+    conn = _db()
+    sql, params = job_queries.build_job_query(bucket="Strong", before_id=30)
+    plan = " ".join(str(r[3]) for r in conn.execute("EXPLAIN QUERY PLAN " + sql, params))
+    assert "idx_jobs_bucket" in plan and "TEMP B-TREE" not in plan
+
+
+def _search_db():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.executescript(_SCHEMA)
+    # Rows written before the index existed are backfilled
+    conn.execute(
+        "INSERT INTO jobs(run_id, title, company, bucket, score, raw_json) VALUES (1, 'Data Engineer', 'Initech', 'Strong', 0.7, ?)",
+        (json.dumps({"description": "Kafka pipelines", "stack": ["Kafka", "Python"], "seniority": "mid"}),),
+    )
+    job_queries.ensure_search_index(conn)
+    rows = [
+        ("Senior Kubernetes Platform Engineer", "Acme", {"description": "Run k8s clusters", "stack": ["Kubernetes", "Go"], "domain_tags": ["platform"], "seniority": "senior"}),
+        ("Backend Engineer", "Kubera Labs", {"description": "Python APIs on Kubernetes", "stack_tags": ["python"], "seniority": "mid"}),
+        ("C# Developer", "Globex", {"description": "Desktop apps", "stack": ["C#"], "seniority": "junior"}),
+    ]
+    for title, company, raw in rows:
+        conn.execute(
+            "INSERT INTO jobs(run_id, title, company, bucket, score, raw_json) VALUES (2, ?, ?, 'Moderate', 0.5, ?)",
+            (title, company, json.dumps(raw)),
+        )
+    return conn
+
+
+def _titles(rows):
+    return [r["title"] for r in rows]
+
+
+def test_search_ranks_title_matches_first_and_supports_prefix():
+    conn = _search_db()
+    assert _titles(job_queries.search_jobs(conn, "kubernetes")) == ["Senior Kubernetes Platform Engineer", "Backend Engineer"]
+    assert set(_titles(job_queries.search_jobs(conn, "kube*"))) == {"Senior Kubernetes Platform Engineer", "Backend Engineer"}
+    assert _titles(job_queries.search_jobs(conn, "c#")) == ["C# Developer"]
+    assert _titles(job_queries.search_jobs(conn, "kafka")) == ["Data Engineer"]
+
+
+def test_search_filters_on_enriched_fields_and_index_tracks_writes():
+    conn = _search_db()
+    assert set(_titles(job_queries.search_jobs(conn, stack="python", seniority="mid"))) == {"Data Engineer", "Backend Engineer"}
+    assert _titles(job_queries.search_jobs(conn, "engineer", domain_tags="platform")) == ["Senior Kubernetes Platform Engineer"]
+    assert _titles(job_queries.search_jobs(conn, stack="python", run_id=1, bucket="Strong")) == ["Data Engineer"]
+
+    conn.execute("INSERT INTO jobs(run_id, title, raw_json) VALUES (3, 'Kubernetes SRE', 'not json')")
+    assert _titles(job_queries.search_jobs(conn, "sre")) == ["Kubernetes SRE"]
+    conn.execute("DELETE FROM jobs WHERE run_id IN (2, 3)")
+    assert job_queries.search_jobs(conn, "kubernetes") == []
+
+
+def test_build_match_quotes_terms_and_requires_input():
+    assert job_queries.build_match('acme "x" OR', seniority="senior,staff") == (
+        '"acme" AND """x""" AND "OR" AND seniority : ("senior" OR "staff")'
+    )
+    with pytest.raises(ValueError):
+        job_queries.build_match("  ")
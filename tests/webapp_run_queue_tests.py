@@ -0,0 +1,82 @@
+"""
+Background run queue behind POST /api/runs/job-discovery.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from webapp.backend.run_queue import QueueFull, RunQueue
+
+
+def test_runs_execute_in_background_and_record_progress():
+    queue = RunQueue(max_workers=1)
+    release = threading.Event()
+
+    def work(progress):
+        progress("fetch", {"per_source": {"lever": 3}})
+        release.wait(5)
+        return {"status": "success", "mirrored_jobs": 3}
+
+    future = queue.submit(1, "job-discovery", work)
+    events, finished = queue.wait_events(1, 0, timeout=5)
+    assert not finished and events[0]["stage"] == "started"
+    release.set()
+    assert future.result(5)["mirrored_jobs"] == 3
+
+    events, finished = queue.wait_events(1, 0, timeout=0)
+    assert finished
+    assert [e["stage"] for e in events] == ["started", "fetch", "finished"]
+    assert [e["seq"] for e in events] == [1, 2, 3]
+    assert events[1]["data"] == {"per_source": {"lever": 3}}
+    assert queue.get(1)["status"] == "success"
+    queue.shutdown(wait=True)
+
+
+def test_failures_are_captured_and_pending_runs_are_bounded():
+    queue = RunQueue(max_workers=1, max_pending=1)
+    release = threading.Event()
+    blocker = queue.submit(1, "job-discovery", lambda progress: release.wait(5) and {"status": "success"})
+    queue.wait_events(1, 0, timeout=5)  # first run is now running, not pending
+
+    def boom(progress):
+        raise RuntimeError("source exploded")
+
+    failing = queue.submit(2, "job-discovery", boom)
+    with pytest.raises(QueueFull):
+        queue.submit(3, "job-discovery", boom)
+    release.set()
+    assert blocker.result(5)["status"] == "success"
+    assert failing.result(5) == {"run_id": 2, "status": "failed", "error": "source exploded"}
+    assert queue.get(2)["status"] == "failed"
+    assert queue.wait_events(99, 0) == ([], True)
+    queue.shutdown(wait=True)
+
+
+def test_async_readers_wait_on_the_event_loop():
+    queue = RunQueue(max_workers=1)
+    release = threading.Event()
+    queue.submit(1, "job-discovery", lambda progress: release.wait(5) and {"status": "success"})
+
+    async def read_all():
+        seen, seq, finished = [], 0, False
+        while not finished:
+            events, finished = await queue.wait_events_async(1, seq, timeout=5)
+            seen.extend(e["stage"] for e in events)
+            seq = events[-1]["seq"] if events else seq
+        return seen
+
+    async def main():
+        reader = asyncio.create_task(read_all())
+        # The loop keeps serving other work while the reader waits
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+        assert not reader.done() and queue._waiters
+        release.set()
+        return await asyncio.wait_for(reader, 5)
+
+    assert asyncio.run(main()) == ["started", "finished"]
+    assert not queue._waiters
+    assert asyncio.run(queue.wait_events_async(99)) == ([], True)
+    queue.shutdown(wait=True)
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+"""
+Tail reads over the append-only activity log (logs/events.jsonl).
+
+- read_tail(): newest events, found by reading fixed-size blocks backwards
+  from the end of the file, so cost follows `limit`, not the log size
+- read_since(): events appended after a byte-offset cursor (forward read of
+  the new bytes only)
+- ActivityBuffer: optional in-memory ring of recent events that follows the
+  file incrementally; dashboard polls are then served from memory
+
+Every read returns a cursor: the byte offset just past the last complete line
+consumed, to be passed back as `since`. A trailing line without its newline is
+still being written and is left for the next read. Offsets past the end of the
+file (truncated or rotated log) fall back to a tail read.
+"""
+
+import json
+import os
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable
+
+BLOCK_SIZE = 1 << 16
+
+# (start offset, end offset, event)
+Entry = tuple[int, int, dict[str, Any]]
+
+
+def parse_categories(value: str | None) -> set[str] | None:
+	categories = {v.strip() for v in (value or "").split(",") if v.strip()}
+	return categories or None
+
+
+def _parse(raw: bytes) -> dict[str, Any] | None:
+	if not raw.strip():
+		return None
+	try:
+		parsed = json.loads(raw)
+	except Exception:
+		return None
+	return parsed if isinstance(parsed, dict) else None
+
+
+def _matches(event: dict[str, Any], categories: set[str] | None) -> bool:
+	return categories is None or event.get("category") in categories
+
+
+def _tail_entries(f: BinaryIO, end: int, limit: int, categories: set[str] | None, block_size: int) -> tuple[list[Entry], int]:
+	entries: list[Entry] = []
+	pos = end
+	carry = b""
+	cursor: int | None = None
+	while pos > 0 and len(entries) < limit:
+		step = min(block_size, pos)
+		pos -= step
+		f.seek(pos)
+		data = f.read(step) + carry
+		lines = data.split(b"\n")
+		starts: list[int] = []
+		offset = pos
+		for line in lines:
+			starts.append(offset)
+			offset += len(line) + 1
+		carry = lines[0]  # may continue in the previous block
+		last = len(lines) - 1
+		if cursor is None:
+			if len(lines) == 1:
+				continue  # still inside an unterminated final line
+			cursor = starts[last]  # just past the last newline
+			last -= 1
+		for k in range(last, 0, -1):
+			event = _parse(lines[k])
+			if event is not None and _matches(event, categories):
+				entries.append((starts[k], starts[k] + len(lines[k]) + 1, event))
+				if len(entries) >= limit:
+					break
+	if pos == 0 and cursor is not None and len(entries) < limit:
+		event = _parse(carry)
+		if event is not None and _matches(event, categories):
+			entries.append((0, len(carry) + 1, event))
+	entries.reverse()
+	return entries, cursor or 0
+
+
+def _entries_since(f: BinaryIO, offset: int, limit: int | None, categories: set[str] | None) -> tuple[list[Entry], int]:
+	entries: list[Entry] = []
+	pos = offset
+	f.seek(offset)
+	for raw in f:
+		if not raw.endswith(b"\n"):
+			break  # partial line still being written
+		start, pos = pos, pos + len(raw)
+		event = _parse(raw)
+		if event is not None and _matches(event, categories):
+			entries.append((start, pos, event))
+			if limit is not None and len(entries) >= limit:
+				break
+	return entries, pos
+
+
+def _events(entries: Iterable[Entry]) -> list[dict[str, Any]]:
+	return [event for _, _, event in entries]
+
+
+def read_tail(path: Path, limit: int, categories: set[str] | None = None, block_size: int = BLOCK_SIZE) -> tuple[list[dict[str, Any]], int]:
+	"""Newest `limit` events (oldest first) and the cursor at the end of the log."""
+	if not path.exists():
+		return [], 0
+	with path.open("rb") as f:
+		end = f.seek(0, os.SEEK_END)
+		entries, cursor = _tail_entries(f, end, limit, categories, block_size)
+	return _events(entries), cursor
+
+
+def read_since(path: Path, offset: int, limit: int, categories: set[str] | None = None) -> tuple[list[dict[str, Any]], int]:
+	"""Up to `limit` events appended after `offset`, oldest first, and the next cursor."""
+	if not path.exists():
+		return [], 0
+	if offset > path.stat().st_size:
+		return read_tail(path, limit, categories)
+	with path.open("rb") as f:
+		entries, cursor = _entries_since(f, offset, limit, categories)
+	return _events(entries), cursor
+
+
+class ActivityBuffer:
+	"""Ring buffer of the most recent `capacity` events, refreshed from the file's new bytes."""
+
+	def __init__(self, path: Path, capacity: int = 1000):
+		self.path = path
+		self.capacity = max(1, int(capacity))
+		self._entries: deque[Entry] = deque(maxlen=self.capacity)
+		self._pos = 0
+		self._inode: tuple[int, int] | None = None
+		self._lock = threading.Lock()
+
+	def _refresh(self) -> bool:
+		"""Catch up with the file; False when it does not exist."""
+		try:
+			st = self.path.stat()
+		except FileNotFoundError:
+			self._entries.clear()
+			self._pos, self._inode = 0, None
+			return False
+		inode = (st.st_dev, st.st_ino)
+		with self.path.open("rb") as f:
+			if inode != self._inode or st.st_size < self._pos:
+				# First read, rotation or truncation: seed from the tail
+				entries, self._pos = _tail_entries(f, st.st_size, self.capacity, None, BLOCK_SIZE)
+				self._entries.clear()
+				self._inode = inode
+			elif st.st_size > self._pos:
+				entries, self._pos = _entries_since(f, self._pos, None, None)
+			else:
+				entries = []
+		self._entries.extend(entries)
+		return True
+
+	def latest(self, limit: int, categories: set[str] | None = None) -> tuple[list[dict[str, Any]], int]:
+		with self._lock:
+			if not self._refresh():
+				return [], 0
+			picked: list[Entry] = []
+			for entry in reversed(self._entries):
+				if _matches(entry[2], categories):
+					picked.append(entry)
+					if len(picked) >= limit:
+						break
+			full = len(self._entries) == self.capacity
+			cursor = self._pos
+		if len(picked) < limit and full:
+			# Older matches may have been evicted from the ring
+			return read_tail(self.path, limit, categories)
+		picked.reverse()
+		return _events(picked), cursor
+
+	def since(self, offset: int, limit: int, categories: set[str] | None = None) -> tuple[list[dict[str, Any]], int]:
+		with self._lock:
+			if not self._refresh():
+				return [], 0
+			if offset > self._pos:
+				offset = -1  # cursor from a truncated/rotated log
+			elif not self._entries or offset >= self._entries[0][0]:
+				picked: list[Entry] = []
+				for entry in self._entries:
+					if entry[0] >= offset and _matches(entry[2], categories):
+						picked.append(entry)
+						if len(picked) >= limit:
+							return _events(picked), entry[1]
+				return _events(picked), self._pos
+		if offset < 0:
+			return self.latest(limit, categories)
+		return read_since(self.path, offset, limit, categories)
+
+
+_BUFFERS: dict[tuple[str, int], ActivityBuffer] = {}
+_BUFFERS_LOCK = threading.Lock()
+
+
+def get_buffer(path: Path, capacity: int) -> ActivityBuffer:
+	"""Process-wide buffer for a log path."""
+	key = (str(path), int(capacity))
+	with _BUFFERS_LOCK:
+		buf = _BUFFERS.get(key)
+		if buf is None:
+			buf = ActivityBuffer(path, capacity)
+			_BUFFERS[key] = buf
+		return buf
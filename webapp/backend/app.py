@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import csv
-import glob
 import json
 import os
 import re
@@ -11,16 +9,23 @@ import sys
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, Header, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 
+from automation.enrichment.scripts import sweep as sweep_module
+from automation.storage.connections import DEFAULT_PRAGMAS, close_all as close_all_connections, get_manager
+
+from . import activity
 from . import generation as generation_module
+from . import job_mirror, job_queries
+from . import pipeline as discovery_pipeline
 from .generation import generate_artifact
-from .schemas import ArtifactResult, PromptArtifact, PromptError, PromptGenerationResponse, PromptRequest, SetupOpenAIKeyRequest
+from .run_queue import Progress, QueueFull, RunQueue
+from .schemas import ArtifactResult, PromptArtifact, PromptError, PromptGenerationResponse, PromptRequest, ScoringSweepRequest, SetupOpenAIKeyRequest
 
 
 ROOT = Path(__file__).resolve().parents[2]
@@ -40,6 +45,13 @@ DEFAULT_RESUME_CONTEXT = ROOT / "config" / "resume_context.sample.json"
 DEFAULT_OUTREACH_CONTEXT = ROOT / "config" / "outreach_context.sample.json"
 
 PYTHON_BIN = os.environ.get("STRATAOS_PYTHON", sys.executable)
+# "inprocess" calls the orchestrator directly; "subprocess" runs DISCOVERY_SCRIPT
+# under PYTHON_BIN and reads its artifacts back (process isolation)
+DISCOVERY_MODE = os.environ.get("STRATAOS_DISCOVERY_MODE", "inprocess").strip().lower()
+RUN_QUEUE = RunQueue(max_workers=int(os.environ.get("STRATAOS_RUN_WORKERS", "1") or 1))
+SSE_KEEPALIVE_SECONDS = 15.0
+# Recent activity events kept in memory for /api/activity polling (0 = read the file each time)
+ACTIVITY_BUFFER_SIZE = int(os.environ.get("STRATAOS_ACTIVITY_BUFFER", "1000") or 0)
 
 SCORING_THRESHOLDS = {
 	"exceptional": 0.8,
@@ -59,14 +71,26 @@ def utc_now() -> str:
 	return datetime.now(timezone.utc).isoformat()
 
 
-def connect_db() -> sqlite3.Connection:
+# The control-center schema has never enforced foreign keys (jobs are replaced
+# per run while prompt_runs keep their job_id), so leave that pragma off here.
+DB_PRAGMAS = tuple(p for p in DEFAULT_PRAGMAS if "foreign_keys" not in p)
+
+# Set by init_db when the SQLite build cannot create the FTS5 index; only
+# /api/jobs/search is disabled, the rest of the API keeps working.
+SEARCH_UNAVAILABLE: str | None = None
+
+
+def connect_db(readonly: bool = False) -> sqlite3.Connection:
+	"""Pooled per-thread connection; close() hands it back to the pool."""
+	manager = get_manager(str(DB_PATH), DB_PRAGMAS)
+	if readonly and DB_PATH.exists():
+		return manager.read_connection(sqlite3.Row)
 	DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-	conn = sqlite3.connect(DB_PATH)
-	conn.row_factory = sqlite3.Row
-	return conn
+	return manager.connection(sqlite3.Row)
 
 
 def init_db() -> None:
+	global SEARCH_UNAVAILABLE
 	conn = connect_db()
 	try:
 		conn.executescript(
@@ -112,6 +136,12 @@ def init_db() -> None:
 			);
 			"""
 		)
+		job_queries.ensure_indexes(conn)
+		try:
+			job_queries.ensure_search_index(conn)
+			SEARCH_UNAVAILABLE = None
+		except sqlite3.OperationalError as e:
+			SEARCH_UNAVAILABLE = str(e)
 		conn.commit()
 	finally:
 		conn.close()
@@ -121,13 +151,6 @@ def _run_subprocess(command: list[str]) -> subprocess.CompletedProcess[str]:
 	return subprocess.run(command, cwd=ROOT, capture_output=True, text=True, check=False)
 
 
-def _latest_path(pattern: str) -> Path | None:
-	paths = [Path(p) for p in glob.glob(pattern)]
-	if not paths:
-		return None
-	return max(paths, key=lambda p: p.stat().st_mtime)
-
-
 def _extract_saved_prompt_path(stdout: str) -> str | None:
 	m = re.search(r"Saved:\s*(.+)", stdout)
 	if not m:
@@ -206,71 +229,36 @@ def _build_setup_status() -> dict[str, Any]:
 	}
 
 
-def _discover_artifacts() -> dict[str, Path | None]:
-	return {
-		"summary": _latest_path(str(OUTPUT_DIR / "jobs_discovered_*.summary.json")),
-		"discovered_csv": _latest_path(str(OUTPUT_DIR / "jobs_discovered_*.csv")),
-		"enriched_json": _latest_path(str(OUTPUT_DIR / "jobs_enriched_*.json")),
-		"scored_csv": _latest_path(str(OUTPUT_DIR / "jobs_scored_*.csv")),
-	}
+ARTIFACT_KINDS = ("summary", "discovered_csv", "enriched_json", "scored_csv")
+
+
+def _run_manifest_path(run_id: int) -> Path:
+	"""Where a run's manifest lives; named by run id, so no globbing or mtime races."""
+	return OUTPUT_DIR / "manifests" / f"run_{run_id}.json"
 
 
-def _to_float(value: Any) -> float | None:
-	if value is None or value == "":
+def _read_run_manifest(run_id: int) -> dict[str, Any] | None:
+	path = _run_manifest_path(run_id)
+	if not path.exists():
 		return None
 	try:
-		return float(value)
+		loaded = _read_json(path)
 	except Exception:
 		return None
+	return loaded if isinstance(loaded, dict) else None
 
 
-def _load_jobs_from_artifacts(artifacts: dict[str, Path | None]) -> list[dict[str, Any]]:
-	discovered_map: dict[str, dict[str, Any]] = {}
-	scored_map: dict[str, dict[str, Any]] = {}
-	enriched_map: dict[str, dict[str, Any]] = {}
-
-	discovered = artifacts.get("discovered_csv")
-	if discovered and discovered.exists():
-		with discovered.open("r", encoding="utf-8", newline="") as f:
-			for row in csv.DictReader(f):
-				key = row.get("url") or f"{row.get('company','')}::{row.get('title','')}"
-				discovered_map[key] = row
-
-	scored = artifacts.get("scored_csv")
-	if scored and scored.exists():
-		with scored.open("r", encoding="utf-8", newline="") as f:
-			for row in csv.DictReader(f):
-				key = row.get("url") or f"{row.get('company','')}::{row.get('title','')}"
-				scored_map[key] = row
-
-	enriched = artifacts.get("enriched_json")
-	if enriched and enriched.exists():
-		loaded = _read_json(enriched)
-		if isinstance(loaded, list):
-			for row in loaded:
-				if isinstance(row, dict):
-					key = row.get("url") or f"{row.get('company','')}::{row.get('title','')}"
-					enriched_map[key] = row
-
-	keys = set(discovered_map.keys()) | set(scored_map.keys()) | set(enriched_map.keys())
-	jobs: list[dict[str, Any]] = []
-	for key in keys:
-		base = discovered_map.get(key, {})
-		scored_row = scored_map.get(key, {})
-		enriched_row = enriched_map.get(key, {})
-		merged = {
-			"title": base.get("title") or scored_row.get("title") or enriched_row.get("title"),
-			"company": base.get("company") or scored_row.get("company") or enriched_row.get("company"),
-			"location": base.get("location") or scored_row.get("location") or enriched_row.get("location"),
-			"source": base.get("source") or scored_row.get("source") or enriched_row.get("source"),
-			"url": base.get("url") or scored_row.get("url") or enriched_row.get("url"),
-			"posted_date": base.get("posted_date") or scored_row.get("posted_date") or enriched_row.get("posted_date"),
-			"score": _to_float(scored_row.get("score")),
-			"bucket": scored_row.get("bucket"),
-			"raw_json": enriched_row or base or scored_row,
-		}
-		jobs.append(merged)
-	return jobs
+def _manifest_artifacts(manifest: dict[str, Any] | None) -> dict[str, Path | None]:
+	entries = (manifest or {}).get("artifacts") or {}
+	artifacts: dict[str, Path | None] = {}
+	for kind in ARTIFACT_KINDS:
+		entry = entries.get(kind)
+		artifacts[kind] = Path(entry["path"]) if isinstance(entry, dict) and entry.get("path") else None
+	return artifacts
+
+
+def _load_jobs_from_artifacts(artifacts: dict[str, Path | None]) -> Iterator[dict[str, Any]]:
+	return job_mirror.load_artifacts(artifacts)
 
 
 def _insert_run(run_type: str, status: str) -> int:
@@ -286,6 +274,29 @@ def _insert_run(run_type: str, status: str) -> int:
 		conn.close()
 
 
+def _set_run_status(run_id: int, status: str) -> None:
+	conn = connect_db()
+	try:
+		conn.execute("UPDATE runs SET status=? WHERE id=?", (status, run_id))
+		conn.commit()
+	finally:
+		conn.close()
+
+
+def _get_run(run_id: int) -> dict[str, Any]:
+	conn = connect_db(readonly=True)
+	try:
+		row = conn.execute(
+			"SELECT id, run_type, status, started_at, finished_at FROM runs WHERE id=?",
+			(run_id,),
+		).fetchone()
+		if not row:
+			raise HTTPException(status_code=404, detail="Run not found")
+		return dict(row)
+	finally:
+		conn.close()
+
+
 def _complete_run(run_id: int, status: str, artifacts: dict[str, Path | None], stdout: str, stderr: str) -> None:
 	conn = connect_db()
 	try:
@@ -312,37 +323,16 @@ def _complete_run(run_id: int, status: str, artifacts: dict[str, Path | None], s
 		conn.close()
 
 
-def _replace_jobs_for_run(run_id: int, jobs: list[dict[str, Any]]) -> int:
+def _replace_jobs_for_run(run_id: int, jobs: Iterable[dict[str, Any]]) -> int:
 	conn = connect_db()
 	try:
-		conn.execute("DELETE FROM jobs WHERE run_id=?", (run_id,))
-		for job in jobs:
-			conn.execute(
-				"""
-				INSERT INTO jobs(run_id, title, company, location, source, url, posted_date, score, bucket, raw_json)
-				VALUES(?,?,?,?,?,?,?,?,?,?)
-				""",
-				(
-					run_id,
-					job.get("title"),
-					job.get("company"),
-					job.get("location"),
-					job.get("source"),
-					job.get("url"),
-					job.get("posted_date"),
-					job.get("score"),
-					job.get("bucket"),
-					json.dumps(job.get("raw_json") or {}, ensure_ascii=False),
-				),
-			)
-		conn.commit()
-		return len(jobs)
+		return job_mirror.replace_jobs(conn, run_id, jobs)
 	finally:
 		conn.close()
 
 
 def _get_job(job_id: int) -> dict[str, Any]:
-	conn = connect_db()
+	conn = connect_db(readonly=True)
 	try:
 		row = conn.execute("SELECT * FROM jobs WHERE id=?", (job_id,)).fetchone()
 		if not row:
@@ -369,11 +359,23 @@ app.add_middleware(
 @app.on_event("startup")
 def on_startup() -> None:
 	init_db()
+	if DISCOVERY_MODE != "subprocess":
+		# Warm the orchestrator imports so the first run does not pay for them
+		try:
+			discovery_pipeline.load_orchestrator()
+		except Exception:
+			pass
+
+
+@app.on_event("shutdown")
+def on_shutdown() -> None:
+	RUN_QUEUE.shutdown(wait=False)
+	close_all_connections()
 
 
 @app.get("/api/health")
 def health() -> dict[str, Any]:
-	return {"ok": True, "db": str(DB_PATH)}
+	return {"ok": True, "db": str(DB_PATH), "search": SEARCH_UNAVAILABLE is None}
 
 
 @app.get("/api/metadata/scoring")
@@ -381,6 +383,18 @@ def scoring_metadata() -> dict[str, Any]:
 	return {"thresholds": SCORING_THRESHOLDS, "bucketColors": BUCKET_COLORS}
 
 
+@app.post("/api/scoring/sweep")
+def scoring_sweep(request: ScoringSweepRequest) -> dict[str, Any]:
+	if request.candidates is not None:
+		grid: dict[str, Any] = {"candidates": request.candidates}
+	else:
+		grid = {"weights": request.weights, "thresholds": request.thresholds}
+	try:
+		return sweep_module.sweep_run(grid, request.run_ts, generation_module.config.to_dict(), top_n=request.top)
+	except ValueError as exc:
+		raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
 @app.get("/api/setup/status")
 def setup_status() -> dict[str, Any]:
 	return _build_setup_status()
@@ -414,36 +428,144 @@ def save_openai_key(request: SetupOpenAIKeyRequest) -> dict[str, Any]:
 	}
 
 
+def _execute_job_discovery(run_id: int, progress: Progress) -> dict[str, Any]:
+	"""Queue worker: run discovery, record the outcome and mirror the jobs."""
+	try:
+		_set_run_status(run_id, "running")
+		if DISCOVERY_MODE == "subprocess":
+			command = [
+				PYTHON_BIN,
+				str(DISCOVERY_SCRIPT),
+				"--out-dir",
+				str(OUTPUT_DIR),
+				"--enrich",
+				"--manifest",
+				str(_run_manifest_path(run_id)),
+			]
+			progress("discovery", {"mode": "subprocess"})
+			proc = _run_subprocess(command)
+			ok, stdout, stderr = proc.returncode == 0, proc.stdout, proc.stderr
+			artifacts = _manifest_artifacts(_read_run_manifest(run_id) if ok else None)
+			jobs = _load_jobs_from_artifacts(artifacts) if ok else []
+		else:
+			result = discovery_pipeline.run_discovery(
+				OUTPUT_DIR,
+				enrich=True,
+				progress=progress,
+				manifest_path=_run_manifest_path(run_id),
+			)
+			ok, stdout, stderr = result.ok, result.stdout, result.stderr
+			artifacts = {k: Path(v) if v else None for k, v in result.artifacts.items()}
+			jobs = job_mirror.from_pipeline_rows(result.scored or result.jobs) if ok else []
+		status = "success" if ok else "failed"
+		_complete_run(run_id, status, artifacts, stdout, stderr)
+
+		mirrored = _replace_jobs_for_run(run_id, jobs) if ok else 0
+		progress("mirror", {"mirrored_jobs": mirrored})
+		return {"run_id": run_id, "status": status, "mirrored_jobs": mirrored, "stdout": stdout, "stderr": stderr}
+	except Exception as exc:
+		_complete_run(run_id, "failed", {}, "", str(exc))
+		raise
+
+
+def _sse(event: str, data: dict[str, Any], event_id: int | None = None) -> str:
+	head = f"id: {event_id}\n" if event_id is not None else ""
+	return f"{head}event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
 @app.post("/api/runs/job-discovery")
-def run_job_discovery() -> dict[str, Any]:
+def run_job_discovery(response: Response, wait: bool = Query(default=False)) -> dict[str, Any]:
 	OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-	run_id = _insert_run("job-discovery", "running")
-	command = [
-		PYTHON_BIN,
-		str(DISCOVERY_SCRIPT),
-		"--out-dir",
-		str(OUTPUT_DIR),
-		"--enrich",
-	]
-	proc = _run_subprocess(command)
-	artifacts = _discover_artifacts()
-	status = "success" if proc.returncode == 0 else "failed"
-	_complete_run(run_id, status, artifacts, proc.stdout, proc.stderr)
+	run_id = _insert_run("job-discovery", "queued")
+	try:
+		future = RUN_QUEUE.submit(run_id, "job-discovery", lambda progress: _execute_job_discovery(run_id, progress))
+	except QueueFull as exc:
+		_complete_run(run_id, "failed", {}, "", str(exc))
+		raise HTTPException(status_code=429, detail=str(exc)) from exc
+
+	if not wait:
+		response.status_code = 202
+		return {
+			"run_id": run_id,
+			"status": "queued",
+			"status_url": f"/api/runs/{run_id}",
+			"events_url": f"/api/runs/{run_id}/events",
+		}
 
-	jobs = _load_jobs_from_artifacts(artifacts) if proc.returncode == 0 else []
-	mirrored = _replace_jobs_for_run(run_id, jobs) if proc.returncode == 0 else 0
-	if proc.returncode != 0:
+	result = future.result()
+	if result.get("status") != "success":
 		raise HTTPException(
 			status_code=500,
-			detail={"run_id": run_id, "stdout": proc.stdout, "stderr": proc.stderr},
+			detail={"run_id": run_id, "stdout": result.get("stdout", ""), "stderr": result.get("stderr") or result.get("error", "")},
 		)
-
-	return {"run_id": run_id, "status": status, "mirrored_jobs": mirrored}
+	return {"run_id": run_id, "status": result["status"], "mirrored_jobs": result["mirrored_jobs"]}
+
+
+@app.get("/api/runs/{run_id}")
+def get_run(run_id: int) -> dict[str, Any]:
+	payload = _get_run(run_id)
+	queued = RUN_QUEUE.get(run_id)
+	if queued:
+		result = dict(queued["result"] or {})
+		result.pop("stdout", None)
+		result.pop("stderr", None)
+		payload.update(stage=queued["stage"], events=queued["events"], result=result or None)
+	return payload
+
+
+@app.get("/api/runs/{run_id}/artifacts")
+def get_run_artifacts(run_id: int) -> dict[str, Any]:
+	_get_run(run_id)
+	manifest = _read_run_manifest(run_id)
+	if manifest is None:
+		raise HTTPException(status_code=404, detail="No manifest for this run")
+	return manifest
+
+
+@app.get("/api/runs/{run_id}/events")
+def run_events(
+	run_id: int,
+	after: int = Query(default=0, ge=0),
+	last_event_id: str | None = Header(default=None),
+) -> StreamingResponse:
+	"""Server-Sent Events: one `progress` event per stage, then `end`.
+
+	Reconnecting clients resume after `Last-Event-ID` (or `after`).
+	"""
+	run = _get_run(run_id)
+	start = after
+	if last_event_id and last_event_id.isdigit():
+		start = max(start, int(last_event_id))
+
+	# Async, so each open stream waits on the event loop instead of holding
+	# one of the threadpool workers that sync endpoints run on
+	async def stream():
+		seq = start
+		if RUN_QUEUE.get(run_id) is None:
+			# Finished before this process started (or aged out of memory)
+			yield _sse("end", {"status": run["status"]})
+			return
+		while True:
+			events, finished = await RUN_QUEUE.wait_events_async(run_id, seq, timeout=SSE_KEEPALIVE_SECONDS)
+			for event in events:
+				seq = event["seq"]
+				yield _sse("progress", event, seq)
+			if finished:
+				yield _sse("end", {"status": (RUN_QUEUE.get(run_id) or run)["status"]})
+				return
+			if not events:
+				yield ": keep-alive\n\n"
+
+	return StreamingResponse(
+		stream(),
+		media_type="text/event-stream",
+		headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+	)
 
 
 @app.get("/api/runs")
 def list_runs(limit: int = 30) -> list[dict[str, Any]]:
-	conn = connect_db()
+	conn = connect_db(readonly=True)
 	try:
 		rows = conn.execute(
 			"SELECT id, run_type, status, started_at, finished_at FROM runs ORDER BY id DESC LIMIT ?",
@@ -455,28 +577,78 @@ def list_runs(limit: int = 30) -> list[dict[str, Any]]:
 
 
 @app.get("/api/jobs")
-def list_jobs(limit: int = 100, run_id: int | None = None) -> list[dict[str, Any]]:
-	conn = connect_db()
+def list_jobs(
+	response: Response,
+	limit: int = 100,
+	run_id: int | None = None,
+	bucket: str | None = None,
+	min_score: float | None = None,
+	max_score: float | None = None,
+	source: str | None = None,
+	company: str | None = None,
+	posted_after: str | None = None,
+	posted_before: str | None = None,
+	before_id: int | None = None,
+	include_raw: bool = True,
+) -> list[dict[str, Any]]:
+	conn = connect_db(readonly=True)
 	try:
-		if run_id is None:
-			rows = conn.execute(
-				"SELECT * FROM jobs ORDER BY id DESC LIMIT ?",
-				(limit,),
-			).fetchall()
-		else:
-			rows = conn.execute(
-				"SELECT * FROM jobs WHERE run_id=? ORDER BY id DESC LIMIT ?",
-				(run_id, limit),
-			).fetchall()
-		payload = []
-		for row in rows:
-			item = dict(row)
-			try:
-				item["raw_json"] = json.loads(item.get("raw_json") or "{}")
-			except Exception:
-				item["raw_json"] = {}
-			payload.append(item)
-		return payload
+		payload = job_queries.fetch_jobs(
+			conn,
+			include_raw=include_raw,
+			limit=limit,
+			run_id=run_id,
+			bucket=bucket,
+			min_score=min_score,
+			max_score=max_score,
+			source=source,
+			company=company,
+			posted_after=posted_after,
+			posted_before=posted_before,
+			before_id=before_id,
+		)
+	finally:
+		conn.close()
+	if payload and len(payload) >= min(max(1, limit), job_queries.MAX_LIMIT):
+		# Keyset cursor: pass back as before_id to fetch the next page
+		response.headers["X-Next-Before-Id"] = str(payload[-1]["id"])
+	return payload
+
+
+@app.get("/api/jobs/search")
+def search_jobs(
+	q: str | None = None,
+	stack: str | None = None,
+	domain_tags: str | None = None,
+	seniority: str | None = None,
+	run_id: int | None = None,
+	bucket: str | None = None,
+	min_score: float | None = None,
+	limit: int = 50,
+	offset: int = 0,
+	include_raw: bool = False,
+) -> list[dict[str, Any]]:
+	if SEARCH_UNAVAILABLE is not None:
+		raise HTTPException(status_code=503, detail=f"Full-text search unavailable: {SEARCH_UNAVAILABLE}")
+	conn = connect_db(readonly=True)
+	try:
+		return job_queries.search_jobs(
+			conn,
+			q,
+			stack=stack,
+			domain_tags=domain_tags,
+			seniority=seniority,
+			run_id=run_id,
+			bucket=bucket,
+			min_score=min_score,
+			limit=limit,
+			offset=offset,
+			include_raw=include_raw,
+		)
+	except ValueError as e:
+		raise HTTPException(status_code=400, detail=str(e))
+	except sqlite3.OperationalError as e:
+		raise HTTPException(status_code=400, detail=f"Invalid search query: {e}")
 	finally:
 		conn.close()
 
@@ -605,18 +777,28 @@ def create_outreach_prompt(request: PromptRequest) -> PromptGenerationResponse:
 
 
 @app.get("/api/activity")
-def get_activity(limit: int = Query(default=100, ge=1, le=1000)) -> list[dict[str, Any]]:
-	if not LOG_PATH.exists():
-		return []
-	lines = LOG_PATH.read_text(encoding="utf-8").splitlines()[-limit:]
-	events: list[dict[str, Any]] = []
-	for line in lines:
-		try:
-			parsed = json.loads(line)
-			if isinstance(parsed, dict):
-				events.append(parsed)
-		except Exception:
-			continue
+def get_activity(
+	response: Response,
+	limit: int = Query(default=100, ge=1, le=1000),
+	since: int | None = Query(default=None, ge=0),
+	category: str | None = Query(default=None),
+) -> list[dict[str, Any]]:
+	"""Recent events, oldest first; `since` returns only events after that cursor.
+
+	The `X-Activity-Cursor` header is the byte offset to pass back as `since`.
+	"""
+	categories = activity.parse_categories(category)
+	if ACTIVITY_BUFFER_SIZE > 0:
+		buffer = activity.get_buffer(LOG_PATH, ACTIVITY_BUFFER_SIZE)
+		if since is None:
+			events, cursor = buffer.latest(limit, categories)
+		else:
+			events, cursor = buffer.since(since, limit, categories)
+	elif since is None:
+		events, cursor = activity.read_tail(LOG_PATH, limit, categories)
+	else:
+		events, cursor = activity.read_since(LOG_PATH, since, limit, categories)
+	response.headers["X-Activity-Cursor"] = str(cursor)
 	return events
 
 
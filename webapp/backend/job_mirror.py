@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+"""
+Streaming mirror of a discovery run into the control-center `jobs` table.
+
+The discovered CSV, scored CSV and enriched JSON are written by the orchestrator
+in the same (matched) order, so merge_artifact_rows() joins them in a single
+pass, holding only rows whose canonical key has not lined up yet (a handful,
+or none, for orchestrator output). replace_jobs() streams the merged rows into
+one `executemany` inside a single transaction with compact `raw_json`.
+"""
+
+import csv
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from automation.common.job_identity import canonical_key
+
+MERGED_FIELDS = ("title", "company", "location", "source", "url", "posted_date")
+INSERT_JOB_SQL = """
+	INSERT INTO jobs(run_id, title, company, location, source, url, posted_date, score, bucket, raw_json)
+	VALUES(?,?,?,?,?,?,?,?,?,?)
+"""
+_CHUNK = 1 << 16
+_compact = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def to_float(value: Any) -> float | None:
+	if value is None or value == "":
+		return None
+	try:
+		return float(value)
+	except Exception:
+		return None
+
+
+def iter_csv_rows(path: Path | None) -> Iterator[dict[str, Any]] | None:
+	if not path or not path.exists():
+		return None
+
+	def rows() -> Iterator[dict[str, Any]]:
+		with path.open("r", encoding="utf-8", newline="") as f:
+			yield from csv.DictReader(f)
+
+	return rows()
+
+
+def iter_json_array(path: Path | None) -> Iterator[Any] | None:
+	"""Stream the elements of a top-level JSON array (nothing for other documents)."""
+	if not path or not path.exists():
+		return None
+
+	def items() -> Iterator[Any]:
+		decoder = json.JSONDecoder()
+		with path.open("r", encoding="utf-8") as f:
+			buf, pos, eof, started = "", 0, False, False
+			while True:
+				while True:
+					while pos < len(buf) and (buf[pos].isspace() or (started and buf[pos] == ",")):
+						pos += 1
+					if pos < len(buf) or eof:
+						break
+					more = f.read(_CHUNK)
+					eof = not more
+					buf, pos = buf[pos:] + more, 0
+				if pos >= len(buf):
+					return
+				if not started:
+					if buf[pos] != "[":
+						return
+					started, pos = True, pos + 1
+					continue
+				if buf[pos] == "]":
+					return
+				try:
+					item, end = decoder.raw_decode(buf, pos)
+					if end == len(buf) and not eof:
+						raise ValueError("element may continue in the next chunk")
+				except ValueError:
+					if eof:
+						return
+					more = f.read(_CHUNK)
+					eof = not more
+					buf, pos = buf[pos:] + more, 0
+					continue
+				yield item
+				pos = end
+
+	return items()
+
+
+def _merge(base: dict[str, Any], scored_row: dict[str, Any], enriched_row: dict[str, Any]) -> dict[str, Any]:
+	merged: dict[str, Any] = {
+		field: base.get(field) or scored_row.get(field) or enriched_row.get(field) for field in MERGED_FIELDS
+	}
+	merged["score"] = to_float(scored_row.get("score"))
+	merged["bucket"] = scored_row.get("bucket")
+	merged["raw_json"] = enriched_row or base or scored_row
+	return merged
+
+
+def merge_artifact_rows(
+	discovered: Iterable[dict[str, Any]] | None,
+	scored: Iterable[dict[str, Any]] | None,
+	enriched: Iterable[dict[str, Any]] | None,
+) -> Iterator[dict[str, Any]]:
+	"""Join the three artifact streams on canonical_key, one merged row per key.
+
+	Missing artifacts are passed as None. Rows line up positionally for
+	orchestrator output and are emitted as soon as every present stream has
+	supplied their key; rows that never line up are joined at the end.
+	"""
+	streams = [iter(s) if s is not None else None for s in (discovered, scored, enriched)]
+	present = [s is not None for s in streams]
+	live = list(present)
+	pending: list[dict[str, dict[str, Any]]] = [{}, {}, {}]
+	emitted: set[str] = set()
+	while any(live):
+		touched: list[str] = []
+		for i, stream in enumerate(streams):
+			if not live[i]:
+				continue
+			row = next(stream, None)  # type: ignore[arg-type]
+			if row is None:
+				live[i] = False
+				continue
+			if not isinstance(row, dict):
+				continue
+			key = canonical_key(row)
+			if key in emitted:
+				continue
+			pending[i][key] = row
+			touched.append(key)
+		for key in touched:
+			if key not in emitted and all(key in pending[i] for i in range(3) if present[i]):
+				emitted.add(key)
+				yield _merge(*(pending[i].pop(key, {}) for i in range(3)))
+	for key in dict.fromkeys(k for rows in pending for k in rows):
+		yield _merge(*(pending[i].pop(key, {}) for i in range(3)))
+
+
+def load_artifacts(artifacts: dict[str, Path | None]) -> Iterator[dict[str, Any]]:
+	return merge_artifact_rows(
+		iter_csv_rows(artifacts.get("discovered_csv")),
+		iter_csv_rows(artifacts.get("scored_csv")),
+		iter_json_array(artifacts.get("enriched_json")),
+	)
+
+
+def from_pipeline_rows(rows: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+	"""Mirror rows for in-process pipeline output (scored rows carry the enriched fields)."""
+	for row in rows:
+		merged = {field: row.get(field) for field in MERGED_FIELDS}
+		merged["score"] = to_float(row.get("score"))
+		merged["bucket"] = row.get("bucket")
+		merged["raw_json"] = {k: v for k, v in row.items() if k not in ("score", "bucket")}
+		yield merged
+
+
+def replace_jobs(conn: sqlite3.Connection, run_id: int, jobs: Iterable[dict[str, Any]]) -> int:
+	"""Replace a run's mirrored jobs in one transaction; returns the number inserted."""
+	count = 0
+
+	def params() -> Iterator[tuple[Any, ...]]:
+		nonlocal count
+		for job in jobs:
+			count += 1
+			yield (
+				run_id,
+				job.get("title"),
+				job.get("company"),
+				job.get("location"),
+				job.get("source"),
+				job.get("url"),
+				job.get("posted_date"),
+				job.get("score"),
+				job.get("bucket"),
+				_compact(job.get("raw_json") or {}),
+			)
+
+	with conn:
+		conn.execute("DELETE FROM jobs WHERE run_id=?", (run_id,))
+		conn.executemany(INSERT_JOB_SQL, params())
+	return count
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+"""
+Indexed query layer for the control-center `jobs` table.
+
+Filters map onto composite `(column, id)` indexes so SQLite can seek straight
+to the matching rows already in `id DESC` order; pagination is keyset-based
+(`before_id`) rather than OFFSET, so page N costs the same as page 1.
+
+`jobs_fts` is an FTS5 index kept in sync with `jobs` by triggers and serves
+ranked keyword search (search_jobs).
+"""
+
+import json
+import sqlite3
+from typing import Any
+
+JOB_INDEXES = (
+	"CREATE INDEX IF NOT EXISTS idx_jobs_run_id ON jobs(run_id, id)",
+	"CREATE INDEX IF NOT EXISTS idx_jobs_bucket ON jobs(bucket, id)",
+	"CREATE INDEX IF NOT EXISTS idx_jobs_score ON jobs(score)",
+	"CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source, id)",
+	"CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company COLLATE NOCASE, id)",
+	"CREATE INDEX IF NOT EXISTS idx_jobs_posted_date ON jobs(posted_date)",
+)
+
+LIST_COLUMNS = ("id", "run_id", "title", "company", "location", "source", "url", "posted_date", "score", "bucket")
+MAX_LIMIT = 1000
+
+
+def ensure_indexes(conn: sqlite3.Connection) -> None:
+	"""Create the jobs indexes (idempotent) and refresh planner statistics."""
+	for statement in JOB_INDEXES:
+		conn.execute(statement)
+	conn.execute("PRAGMA optimize;")
+
+
+def _split(value: str | None) -> list[str]:
+	return [v.strip() for v in (value or "").split(",") if v.strip()]
+
+
+def build_job_query(
+	*,
+	limit: int = 100,
+	run_id: int | None = None,
+	bucket: str | None = None,
+	min_score: float | None = None,
+	max_score: float | None = None,
+	source: str | None = None,
+	company: str | None = None,
+	posted_after: str | None = None,
+	posted_before: str | None = None,
+	before_id: int | None = None,
+	include_raw: bool = True,
+) -> tuple[str, list[Any]]:
+	"""Return (sql, params) for a filtered, keyset-paginated jobs listing.
+
+	`bucket` and `source` accept comma-separated values; `company` matches
+	case-insensitively; posted dates compare as ISO strings (inclusive).
+	"""
+	where: list[str] = []
+	params: list[Any] = []
+	if run_id is not None:
+		where.append("run_id = ?")
+		params.append(run_id)
+	for column, raw in (("bucket", bucket), ("source", source)):
+		values = _split(raw)
+		if values:
+			where.append(f"{column} IN ({','.join('?' * len(values))})")
+			params.extend(values)
+	if company:
+		where.append("company = ? COLLATE NOCASE")
+		params.append(company)
+	if min_score is not None:
+		where.append("score >= ?")
+		params.append(float(min_score))
+	if max_score is not None:
+		where.append("score <= ?")
+		params.append(float(max_score))
+	if posted_after:
+		where.append("posted_date >= ?")
+		params.append(posted_after)
+	if posted_before:
+		where.append("posted_date <= ?")
+		params.append(posted_before)
+	if before_id is not None:
+		where.append("id < ?")
+		params.append(before_id)
+
+	columns = ", ".join(LIST_COLUMNS + (("raw_json",) if include_raw else ()))
+	sql = f"SELECT {columns} FROM jobs"
+	if where:
+		sql += " WHERE " + " AND ".join(where)
+	sql += " ORDER BY id DESC LIMIT ?"
+	params.append(max(1, min(int(limit), MAX_LIMIT)))
+	return sql, params
+
+
+def _rows(cur: sqlite3.Cursor, include_raw: bool) -> list[dict[str, Any]]:
+	names = [d[0] for d in cur.description]
+	payload = []
+	for row in cur.fetchall():
+		item = dict(zip(names, row))
+		if include_raw:
+			try:
+				item["raw_json"] = json.loads(item.get("raw_json") or "{}")
+			except Exception:
+				item["raw_json"] = {}
+		payload.append(item)
+	return payload
+
+
+def fetch_jobs(conn: sqlite3.Connection, include_raw: bool = True, **filters: Any) -> list[dict[str, Any]]:
+	"""Run build_job_query and return rows as dicts (raw_json decoded when included)."""
+	sql, params = build_job_query(include_raw=include_raw, **filters)
+	return _rows(conn.execute(sql, params), include_raw)
+
+
+# Full-text index over jobs; rowid mirrors jobs.id. Enriched fields come out of
+# raw_json (job-discovery `stack`/`domain_tags`, enrichment `stack_tags`).
+_RAW = "CASE WHEN json_valid({row}.raw_json) THEN {row}.raw_json END"
+_FTS_VALUES = f"""
+	json_extract({_RAW}, '$.description'),
+	coalesce(json_extract({_RAW}, '$.stack'), json_extract({_RAW}, '$.stack_tags')),
+	json_extract({_RAW}, '$.domain_tags'),
+	json_extract({_RAW}, '$.seniority')
+"""
+
+JOB_SEARCH_SCHEMA = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+	title, company, description, stack, domain_tags, seniority,
+	tokenize = "unicode61 remove_diacritics 2 tokenchars '#+'",
+	prefix = '2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+	INSERT INTO jobs_fts(rowid, title, company, description, stack, domain_tags, seniority)
+	VALUES (new.id, new.title, new.company, {_FTS_VALUES.format(row="new")});
+END;
+
+CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+	DELETE FROM jobs_fts WHERE rowid = old.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE ON jobs BEGIN
+	DELETE FROM jobs_fts WHERE rowid = old.id;
+	INSERT INTO jobs_fts(rowid, title, company, description, stack, domain_tags, seniority)
+	VALUES (new.id, new.title, new.company, {_FTS_VALUES.format(row="new")});
+END;
+"""
+
+# bm25 column weights: title, company, description, stack, domain_tags, seniority
+_BM25 = "bm25(jobs_fts, 10.0, 5.0, 1.0, 3.0, 2.0, 1.0)"
+
+
+def ensure_search_index(conn: sqlite3.Connection) -> None:
+	"""Create the FTS5 index and triggers; backfill rows indexed before it existed."""
+	conn.executescript(JOB_SEARCH_SCHEMA)
+	indexed = conn.execute("SELECT COUNT(*) FROM jobs_fts").fetchone()[0]
+	total = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+	if indexed != total:
+		conn.execute("DELETE FROM jobs_fts")
+		conn.execute(
+			f"""
+			INSERT INTO jobs_fts(rowid, title, company, description, stack, domain_tags, seniority)
+			SELECT jobs.id, jobs.title, jobs.company, {_FTS_VALUES.format(row="jobs")} FROM jobs
+			"""
+		)
+
+
+def _phrase(term: str) -> str:
+	prefix = term.endswith("*")
+	term = term.rstrip("*")
+	if not term:
+		return ""
+	return '"' + term.replace('"', '""') + '"' + ("*" if prefix else "")
+
+
+def build_match(
+	q: str | None = None,
+	stack: str | None = None,
+	domain_tags: str | None = None,
+	seniority: str | None = None,
+) -> str:
+	"""Build an FTS5 MATCH expression.
+
+	Free-text terms are quoted (a trailing `*` keeps prefix matching) and
+	ANDed; enriched filters become column filters, comma-separated values ORed.
+	Raises ValueError when there is nothing to match.
+	"""
+	clauses = [p for p in (_phrase(t) for t in (q or "").split()) if p]
+	for column, raw in (("stack", stack), ("domain_tags", domain_tags), ("seniority", seniority)):
+		values = [p for p in (_phrase(v) for v in _split(raw)) if p]
+		if values:
+			clauses.append(f"{column} : ({' OR '.join(values)})")
+	if not clauses:
+		raise ValueError("Provide a search query or at least one filter")
+	return " AND ".join(clauses)
+
+
+def search_jobs(
+	conn: sqlite3.Connection,
+	q: str | None = None,
+	*,
+	stack: str | None = None,
+	domain_tags: str | None = None,
+	seniority: str | None = None,
+	run_id: int | None = None,
+	bucket: str | None = None,
+	min_score: float | None = None,
+	limit: int = 50,
+	offset: int = 0,
+	include_raw: bool = False,
+) -> list[dict[str, Any]]:
+	"""Ranked full-text search over jobs (best match first)."""
+	where = ["jobs_fts MATCH ?"]
+	params: list[Any] = [build_match(q, stack, domain_tags, seniority)]
+	if run_id is not None:
+		where.append("j.run_id = ?")
+		params.append(run_id)
+	buckets = _split(bucket)
+	if buckets:
+		where.append(f"j.bucket IN ({','.join('?' * len(buckets))})")
+		params.extend(buckets)
+	if min_score is not None:
+		where.append("j.score >= ?")
+		params.append(float(min_score))
+	columns = ", ".join(f"j.{c}" for c in LIST_COLUMNS + (("raw_json",) if include_raw else ()))
+	page = [max(1, min(int(limit), MAX_LIMIT)), max(0, int(offset))]
+	if len(where) == 1:
+		# Rank and cut inside the FTS index before touching jobs rows
+		sql = (
+			f"SELECT {columns}, f.rank FROM (SELECT rowid, {_BM25} AS rank FROM jobs_fts"
+			" WHERE jobs_fts MATCH ? ORDER BY rank LIMIT ? OFFSET ?) f"
+			" JOIN jobs j ON j.id = f.rowid ORDER BY f.rank"
+		)
+	else:
+		sql = (
+			f"SELECT {columns}, {_BM25} AS rank FROM jobs_fts JOIN jobs j ON j.id = jobs_fts.rowid"
+			f" WHERE {' AND '.join(where)} ORDER BY rank LIMIT ? OFFSET ?"
+		)
+	params.extend(page)
+	return _rows(conn.execute(sql, params), include_raw)
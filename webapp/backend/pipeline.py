@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+"""
+In-process job-discovery runs for the control-center backend.
+
+The orchestrator (and with it sources, enrichment and scoring) is imported once
+per process and called directly, so a dashboard-triggered run pays no
+interpreter start-up or import cost and its rows come back as Python objects
+instead of being parsed out of the exported CSV/JSON. Runs are serialized:
+the orchestrator reinitializes the shared config and per-run source metrics.
+"""
+
+import importlib
+import sys
+import threading
+import traceback
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+from .schemas import DiscoveryResult
+
+ROOT = Path(__file__).resolve().parents[2]
+SCRIPTS_DIR = ROOT / "automation" / "job-discovery" / "scripts"
+
+_RUN_LOCK = threading.Lock()
+
+
+def load_orchestrator() -> ModuleType:
+	"""Import job_discovery_v1 once (cached in sys.modules afterwards)."""
+	if str(SCRIPTS_DIR) not in sys.path:
+		sys.path.insert(0, str(SCRIPTS_DIR))
+	return importlib.import_module("job_discovery_v1")
+
+
+def run_discovery(
+	out_dir: Path,
+	enrich: bool = True,
+	progress: Callable[[str, dict[str, Any]], None] | None = None,
+	manifest_path: Path | None = None,
+) -> DiscoveryResult:
+	"""Run the discovery pipeline in this process; failures come back as ok=False.
+
+	`progress(stage, data)` receives the orchestrator's stage events; the run
+	manifest goes to `manifest_path` when given.
+	"""
+	lines: list[str] = []
+	with _RUN_LOCK:
+		try:
+			result = load_orchestrator().run_pipeline(
+				str(out_dir),
+				enrich=enrich,
+				echo=lines.append,
+				progress=progress,
+				manifest_path=str(manifest_path) if manifest_path else None,
+			)
+		except Exception:
+			return DiscoveryResult(ok=False, stdout="\n".join(lines), stderr=traceback.format_exc())
+	return DiscoveryResult(
+		ok=True,
+		run_ts=result.get("run_ts"),
+		summary=result.get("summary") or {},
+		jobs=result.get("jobs") or [],
+		enriched=result.get("enriched") or [],
+		scored=result.get("scored") or [],
+		artifacts=result.get("artifacts") or {},
+		stdout="\n".join(lines) + ("\n" if lines else ""),
+	)
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+"""
+Background run queue for the control-center backend.
+
+Runs are submitted to a bounded thread pool (FIFO, `max_workers` at a time) so a
+slow discovery run never holds an API worker. Each run keeps an in-memory log
+of progress events (`seq`, `stage`, `data`, `ts`) that status and
+Server-Sent-Events endpoints read; waiting readers block on a condition
+instead of polling, and async readers (SSE streams) await an asyncio.Event
+that workers set on the reader's event loop, so an open stream never holds a
+pool thread. Only the most recent `keep_finished` finished runs are
+retained; the `runs` table remains the durable record.
+"""
+
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+Progress = Callable[[str, dict[str, Any]], None]
+
+FINISHED = frozenset({"success", "failed"})
+
+
+class QueueFull(Exception):
+	"""Raised when too many runs are already waiting."""
+
+
+class _RunState:
+	def __init__(self, run_id: int, run_type: str):
+		self.run_id = run_id
+		self.run_type = run_type
+		self.status = "queued"
+		self.stage: str | None = None
+		self.events: list[dict[str, Any]] = []
+		self.result: dict[str, Any] | None = None
+		self.future: Future | None = None
+
+	def snapshot(self) -> dict[str, Any]:
+		return {
+			"run_id": self.run_id,
+			"run_type": self.run_type,
+			"status": self.status,
+			"stage": self.stage,
+			"events": len(self.events),
+			"result": self.result,
+		}
+
+
+class RunQueue:
+	"""Bounded-concurrency queue of background runs with progress events."""
+
+	def __init__(self, max_workers: int = 1, max_pending: int = 32, keep_finished: int = 100):
+		self.max_workers = max(1, int(max_workers))
+		self.max_pending = max(1, int(max_pending))
+		self.keep_finished = max(1, int(keep_finished))
+		self._cond = threading.Condition()
+		self._runs: OrderedDict[int, _RunState] = OrderedDict()
+		self._executor: ThreadPoolExecutor | None = None
+		# Async readers waiting for any new event: (their loop, their signal)
+		self._waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+
+	def _pool(self) -> ThreadPoolExecutor:
+		if self._executor is None:
+			self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="strataos-run")
+		return self._executor
+
+	def _emit(self, state: _RunState, stage: str, data: dict[str, Any]) -> None:
+		with self._cond:
+			state.stage = stage
+			state.events.append(
+				{
+					"seq": len(state.events) + 1,
+					"stage": stage,
+					"data": data,
+					"ts": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+				}
+			)
+			self._cond.notify_all()
+			waiters, self._waiters = self._waiters, []
+		for loop, signal in waiters:
+			try:
+				loop.call_soon_threadsafe(signal.set)
+			except RuntimeError:
+				pass  # reader's loop already closed
+
+	def _prune(self) -> None:
+		finished = [rid for rid, st in self._runs.items() if st.status in FINISHED]
+		for rid in finished[: max(0, len(finished) - self.keep_finished)]:
+			self._runs.pop(rid, None)
+
+	def submit(self, run_id: int, run_type: str, work: Callable[[Progress], dict[str, Any]]) -> Future:
+		"""Queue `work(progress)`; its returned dict (with "status") becomes the run result.
+
+		Raises QueueFull when `max_pending` runs are already waiting.
+		"""
+		with self._cond:
+			pending = sum(1 for st in self._runs.values() if st.status == "queued")
+			if pending >= self.max_pending:
+				raise QueueFull(f"{pending} runs already queued")
+			state = _RunState(run_id, run_type)
+			self._runs[run_id] = state
+			self._prune()
+
+		def _run() -> dict[str, Any]:
+			with self._cond:
+				state.status = "running"
+			self._emit(state, "started", {})
+			try:
+				result = work(lambda stage, data: self._emit(state, stage, dict(data)))
+			except Exception as exc:
+				result = {"run_id": run_id, "status": "failed", "error": str(exc)}
+			status = "success" if result.get("status") == "success" else "failed"
+			with self._cond:
+				state.result = result
+				state.status = status
+			self._emit(state, "finished", {"status": status})
+			return result
+
+		with self._cond:
+			state.future = self._pool().submit(_run)
+		return state.future
+
+	def get(self, run_id: int) -> dict[str, Any] | None:
+		with self._cond:
+			state = self._runs.get(run_id)
+			return state.snapshot() if state else None
+
+	def wait_events(self, run_id: int, after: int = 0, timeout: float = 15.0) -> tuple[list[dict[str, Any]], bool]:
+		"""Events with seq > `after` (blocking up to `timeout` for new ones) and whether the run is finished."""
+		with self._cond:
+			state = self._runs.get(run_id)
+			if state is None:
+				return [], True
+			self._cond.wait_for(lambda: len(state.events) > after, timeout=timeout)
+			return self._events_after(state, after)
+
+	async def wait_events_async(
+		self, run_id: int, after: int = 0, timeout: float = 15.0
+	) -> tuple[list[dict[str, Any]], bool]:
+		"""wait_events for coroutines: waits on the event loop, not a thread."""
+		waiter = (asyncio.get_running_loop(), asyncio.Event())
+		with self._cond:
+			state = self._runs.get(run_id)
+			if state is None:
+				return [], True
+			if len(state.events) > after:
+				return self._events_after(state, after)
+			self._waiters.append(waiter)
+		try:
+			await asyncio.wait_for(waiter[1].wait(), timeout)
+		except asyncio.TimeoutError:
+			pass
+		finally:
+			with self._cond:
+				if waiter in self._waiters:
+					self._waiters.remove(waiter)
+		with self._cond:
+			return self._events_after(state, after)
+
+	@staticmethod
+	def _events_after(state: _RunState, after: int) -> tuple[list[dict[str, Any]], bool]:
+		finished = bool(state.events) and state.events[-1]["stage"] == "finished"
+		return list(state.events[after:]), finished
+
+	def shutdown(self, wait: bool = False) -> None:
+		with self._cond:
+			executor, self._executor = self._executor, None
+		if executor is not None:
+			executor.shutdown(wait=wait)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Literal
+from dataclasses import dataclass, field
+from typing import Any, Literal
 
 from pydantic import BaseModel
 
@@ -17,6 +17,14 @@ class SetupOpenAIKeyRequest(BaseModel):
 	api_key: str
 
 
+class ScoringSweepRequest(BaseModel):
+	run_ts: str | None = None
+	weights: dict[str, list[float] | float] = {}
+	thresholds: dict[str, list[float] | float] = {}
+	candidates: list[dict[str, dict[str, float]]] | None = None
+	top: int = 10
+
+
 class PromptArtifact(BaseModel):
 	type: Literal["resume", "outreach"]
 	content: str
@@ -42,4 +50,16 @@ class ArtifactResult:
 	ok: bool
 	content: str | None = None
 	error_message: str | None = None
-	error_code: str | None = None
\ No newline at end of file
+	error_code: str | None = None
+
+@dataclass
+class DiscoveryResult:
+	ok: bool
+	run_ts: str | None = None
+	summary: dict[str, Any] = field(default_factory=dict)
+	jobs: list[dict[str, Any]] = field(default_factory=list)
+	enriched: list[dict[str, Any]] = field(default_factory=list)
+	scored: list[dict[str, Any]] = field(default_factory=list)
+	artifacts: dict[str, str | None] = field(default_factory=dict)
+	stdout: str = ""
+	stderr: str = ""
@@ -90,18 +90,62 @@ export default function App() {
     };
   }, []);
 
+  const describeProgress = (runId, event) => {
+    const data = event.data || {};
+    switch (event.stage) {
+      case "fetch":
+        return `Run #${runId}: fetched ${data.total} jobs (${Object.entries(data.per_source || {})
+          .map(([source, count]) => `${source} ${count}`)
+          .join(", ") || "no sources"})`;
+      case "filter":
+        return `Run #${runId}: ${data.matched} jobs matched filters`;
+      case "enrich":
+        return data.status === "started"
+          ? `Run #${runId}: enriching ${data.jobs} jobs...`
+          : `Run #${runId}: enriched ${data.enriched} jobs`;
+      case "score":
+        return `Run #${runId}: scored ${data.scored} jobs`;
+      case "mirror":
+        return `Run #${runId}: mirrored ${data.mirrored_jobs} jobs`;
+      default:
+        return `Run #${runId}: ${event.stage}...`;
+    }
+  };
+
   const runDiscovery = async () => {
     setLoadingRun(true);
-    setStatus("Running job discovery...");
+    setStatus("Queueing job discovery...");
+    let queued;
     try {
-      const result = await api.post("/api/runs/job-discovery");
-      setStatus(`Run #${result.run_id} completed, mirrored ${result.mirrored_jobs} jobs`);
-      await loadAll();
+      queued = await api.post("/api/runs/job-discovery");
     } catch (err) {
       setStatus(`Discovery failed: ${String(err)}`);
-    } finally {
       setLoadingRun(false);
+      return;
     }
+    const runId = queued.run_id;
+    setStatus(`Run #${runId} queued`);
+    const events = new EventSource(queued.events_url);
+    events.addEventListener("progress", (message) => {
+      setStatus(describeProgress(runId, JSON.parse(message.data)));
+    });
+    events.addEventListener("end", async (message) => {
+      events.close();
+      const { status: runStatus } = JSON.parse(message.data);
+      try {
+        const run = await api.get(`/api/runs/${runId}`);
+        setStatus(
+          runStatus === "success"
+            ? `Run #${runId} completed, mirrored ${run.result?.mirrored_jobs ?? 0} jobs`
+            : `Discovery run #${runId} failed`
+        );
+        await loadAll();
+      } catch (err) {
+        setStatus(String(err));
+      } finally {
+        setLoadingRun(false);
+      }
+    });
   };
 
   const generatePrompt = async (kind) => {